@@ -0,0 +1,40 @@
+import money
+
+from .common import ROWS, install_rates, make_money_array, make_fixed_money_array
+
+
+class Arithmetic:
+    """ Element-wise operators, within one currency and across several """
+    params = [ROWS, [1, 3]]
+    param_names = ['n', 'currencies']
+
+    def setup(self, n, currencies):
+        install_rates(currencies)
+        self.array = make_money_array(n, currencies, na_ratio=0.05)
+        self.other = make_money_array(n, currencies, seed=1)
+        self.fixed = make_fixed_money_array(n, currencies)
+        self.scalar = money.XMoney(10, 'GBP')
+
+    def teardown(self, n, currencies):
+        money.xrates.uninstall()
+
+    def time_add(self, n, currencies):
+        self.array + self.other
+
+    def peakmem_add(self, n, currencies):
+        self.array + self.other
+
+    def time_sub_scalar(self, n, currencies):
+        self.array - self.scalar
+
+    def time_mul(self, n, currencies):
+        self.array * 1.2
+
+    def time_fixed_mul(self, n, currencies):
+        self.fixed * 1.2
+
+    def time_ratio(self, n, currencies):
+        self.array / self.other
+
+    def time_eq_scalar(self, n, currencies):
+        self.array == self.scalar
@@ -0,0 +1,93 @@
+""" Synthetic data for the benchmarks, parameterized by row count, currency
+cardinality, NA ratio and string format, reproducible from a seed.
+"""
+import decimal
+
+import money
+import numpy as np
+
+import moneypandas as mpd
+from moneypandas import dtypes, rates
+
+# Common parameter values; suites pick from these to keep run times sane
+ROWS = [10 ** 4, 10 ** 6]
+CURRENCIES = [1, 3, 40]
+NA_RATIOS = [0., 0.1]
+FORMATS = ['code_first', 'code_last', 'symbol', 'bare', 'mixed']
+
+
+def currency_codes(n_currencies):
+    """ The first n_currencies ISO codes, GBP, EUR and USD first """
+    codes = ['GBP', 'EUR', 'USD'] + [code for code in dtypes.currency_codes[1:]
+                                     if code not in ('GBP', 'EUR', 'USD')]
+    return codes[:n_currencies]
+
+
+def install_rates(n_currencies=40, seed=0):
+    """ Install an xrates backend quoting every benchmark currency """
+    rng = np.random.RandomState(seed)
+    money.xrates.install(money.exchange.SimpleBackend)
+    money.xrates.base = 'USD'
+    for code in currency_codes(max(n_currencies, 3)):
+        if code != 'USD':
+            money.xrates.setrate(code, decimal.Decimal(str(round(rng.uniform(0.1, 10), 4))))
+    rates.rate_cache.clear()
+
+
+def make_records(n, currencies=3, na_ratio=0., seed=0):
+    """ MoneyType records of n random amounts, to the cent, in 'currencies'
+    (a number of them, or their codes), with a fraction na_ratio of NAs """
+    if isinstance(currencies, int):
+        currencies = currency_codes(currencies)
+    rng = np.random.RandomState(seed)
+    data = np.empty(n, dtype=mpd.MoneyType._record_type)
+    data['va'] = rng.uniform(-1000, 1000, n).round(2)
+    codes = np.array([dtypes.encode_currency(code) for code in currencies])
+    data['cu'] = codes[rng.randint(0, len(codes), n)]
+    if na_ratio:
+        data[rng.uniform(size=n) < na_ratio] = (0, 0)
+    return data
+
+
+def make_money_array(n, currencies=('GBP', 'EUR', 'USD'), seed=0, na_ratio=0.):
+    """ A MoneyArray of make_records, with GBP as its default currency """
+    return mpd.MoneyArray(make_records(n, currencies, na_ratio, seed), 'GBP')
+
+
+def make_fixed_money_array(n, currencies=3, seed=0, na_ratio=0.):
+    """ As make_money_array, as a FixedMoneyArray """
+    return mpd.FixedMoneyArray.from_money_array(make_money_array(n, currencies, seed, na_ratio))
+
+
+_symbols = {'GBP': '£', 'EUR': '€', 'USD': '$'}
+
+
+def make_strings(n, n_currencies=3, na_ratio=0., fmt='code_first', distinct=None, seed=0):
+    """ An object ndarray of n money strings, with None for NA.
+
+    fmt is one of FORMATS: 'EUR 12.34', '12.34EUR', '€12.34' (for
+    currencies with a symbol), '12.34' (to be parsed with a default
+    currency) or an even mix of those. 'distinct' limits the number of
+    distinct amounts, as in real price columns.
+    """
+    rng = np.random.RandomState(seed)
+    amounts = rng.uniform(0, 1000, distinct or n).round(2)
+    amounts = amounts[rng.randint(0, len(amounts), n)]
+    codes = np.array(currency_codes(n_currencies))[rng.randint(0, n_currencies, n)]
+
+    formats = FORMATS[:-1] if fmt == 'mixed' else [fmt]
+    chosen = np.array(formats)[rng.randint(0, len(formats), n)]
+    result = np.empty(n, dtype=object)
+    for i, (amount, code, form) in enumerate(zip(amounts.tolist(), codes.tolist(), chosen.tolist())):
+        if form == 'symbol' and code in _symbols:
+            result[i] = '{}{:.2f}'.format(_symbols[code], amount)
+        elif form == 'code_last':
+            result[i] = '{:.2f}{}'.format(amount, code)
+        elif form == 'bare':
+            result[i] = '{:.2f}'.format(amount)
+        else:
+            result[i] = '{} {:.2f}'.format(code, amount)
+
+    if na_ratio:
+        result[rng.uniform(size=n) < na_ratio] = None
+    return result
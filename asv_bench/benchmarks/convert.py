@@ -0,0 +1,51 @@
+import money
+
+from .common import ROWS, CURRENCIES, install_rates, make_money_array, make_fixed_money_array
+
+
+class Convert:
+    """ Currency conversion through the rate snapshot """
+    params = [ROWS, CURRENCIES]
+    param_names = ['n', 'currencies']
+
+    def setup(self, n, currencies):
+        install_rates(currencies)
+        self.array = make_money_array(n, currencies, na_ratio=0.05)
+        self.fixed = make_fixed_money_array(n, currencies, na_ratio=0.05)
+        self.small = self.fixed[:10 ** 4]
+
+    def teardown(self, n, currencies):
+        money.xrates.uninstall()
+
+    def time_to_currency_shallow(self, n, currencies):
+        self.array.to_currency('USD')
+
+    def time_to_currency_deep(self, n, currencies):
+        self.array.to_currency('USD', shallow=False)
+
+    def peakmem_to_currency_deep(self, n, currencies):
+        self.array.to_currency('USD', shallow=False)
+
+    def time_to_currency_lazy_head(self, n, currencies):
+        self.array.to_currency('USD', shallow=False, lazy=True)[:10]
+
+    def time_to_currency_lazy_sum(self, n, currencies):
+        self.array.to_currency('USD', shallow=False, lazy=True)._reduce('sum')
+
+    def peakmem_to_currency_lazy_sum(self, n, currencies):
+        self.array.to_currency('USD', shallow=False, lazy=True)._reduce('sum')
+
+    def time_fixed_to_currency_deep(self, n, currencies):
+        self.fixed.to_currency('USD', shallow=False)
+
+    def time_to_decimals(self, n, currencies):
+        self.small.to_decimals('USD')
+
+    def time_compare_scalar(self, n, currencies):
+        self.array > money.XMoney(100, 'USD')
+
+    def time_compare_arrays(self, n, currencies):
+        self.array < self.array[::-1]
+
+    def time_sort_keys(self, n, currencies):
+        self.array.sort_keys('USD')
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from .common import ROWS, install_rates, make_money_array
+
+
+class Factorize:
+    """ Hashing, deduplication and sorting on the native record keys.
+    'distinct' bounds the distinct amounts, as in real price columns.
+    """
+    params = [ROWS, [100, None], [0., 0.1]]
+    param_names = ['n', 'distinct', 'na_ratio']
+
+    def setup(self, n, distinct, na_ratio):
+        install_rates(3)
+        array = make_money_array(n, 3, na_ratio=na_ratio)
+        if distinct:
+            array = array.take(np.random.RandomState(2).randint(0, distinct, n))
+        self.array = array
+        self.series = pd.Series(array)
+
+    def time_factorize(self, n, distinct, na_ratio):
+        self.array.factorize()
+
+    def peakmem_factorize(self, n, distinct, na_ratio):
+        self.array.factorize()
+
+    def time_unique(self, n, distinct, na_ratio):
+        self.array.unique()
+
+    def time_value_counts(self, n, distinct, na_ratio):
+        self.series.value_counts()
+
+    def time_drop_duplicates(self, n, distinct, na_ratio):
+        self.series.drop_duplicates()
+
+    def time_argsort(self, n, distinct, na_ratio):
+        self.array.argsort()
+
+    def time_sort_values(self, n, distinct, na_ratio):
+        self.series.sort_values()
+
+    def time_nlargest(self, n, distinct, na_ratio):
+        self.series.money.nlargest(10)
@@ -0,0 +1,35 @@
+import money
+import numpy as np
+import pandas as pd
+
+from .common import install_rates, make_money_array
+
+
+class GroupBy:
+    """ Grouped reductions through the money accessor, binning rows by
+    (group, currency) in one pass """
+    params = [[10 ** 4, 10 ** 6], [10, 10 ** 4], [1, 3, 40]]
+    param_names = ['n', 'groups', 'currencies']
+
+    def setup(self, n, groups, currencies):
+        install_rates(currencies)
+        self.series = pd.Series(make_money_array(n, currencies, na_ratio=0.05))
+        self.keys = np.random.RandomState(3).randint(0, groups, n)
+
+    def teardown(self, n, groups, currencies):
+        money.xrates.uninstall()
+
+    def time_sum(self, n, groups, currencies):
+        self.series.money.groupby(self.keys).sum()
+
+    def peakmem_sum(self, n, groups, currencies):
+        self.series.money.groupby(self.keys).sum()
+
+    def time_mean(self, n, groups, currencies):
+        self.series.money.groupby(self.keys).mean()
+
+    def time_max(self, n, groups, currencies):
+        self.series.money.groupby(self.keys).max()
+
+    def time_count(self, n, groups, currencies):
+        self.series.money.groupby(self.keys).count()
@@ -0,0 +1,15 @@
+class Import:
+    """ Cold-start cost of importing moneypandas, in a fresh interpreter.
+    Currency data is precomputed, and the symbol table and patterns are
+    only built on first parse, so the import should cost little beyond
+    pandas itself.
+    """
+
+    def timeraw_import_pandas(self):
+        return "import pandas"
+
+    def timeraw_import_moneypandas(self):
+        return "import moneypandas"
+
+    def timeraw_first_parse(self):
+        return "moneypandas.to_money(['£1.50', 'EUR 2'])", "import moneypandas"
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from .common import make_money_array
+
+
+class Indexing:
+    """ Structural operations on typed records should scale linearly, at
+    NumPy speed, without re-parsing any rows.
+    """
+    params = [10 ** 4, 10 ** 5, 10 ** 6]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.array = make_money_array(n)
+        self.df = pd.DataFrame({'amount': self.array})
+        self.indexer = np.random.RandomState(1).permutation(n)[:n // 2]
+        self.mask = np.arange(n) % 3 == 0
+
+    def time_getitem_slice(self, n):
+        self.array[1:-1]
+
+    def time_getitem_indexer(self, n):
+        self.array[self.indexer]
+
+    def time_take_allow_fill(self, n):
+        self.array.take(np.append(self.indexer, -1), allow_fill=True)
+
+    def time_copy(self, n):
+        self.array.copy()
+
+    def time_loc_indexer(self, n):
+        self.df.loc[self.indexer]
+
+    def time_loc_mask(self, n):
+        self.df.loc[self.mask]
+
+    def time_reindex(self, n):
+        self.df.reindex(np.arange(-10, n))
+
+    def time_concat(self, n):
+        pd.concat([self.df, self.df], ignore_index=True)
@@ -0,0 +1,73 @@
+import pandas as pd
+
+import moneypandas as mpd
+from moneypandas import parser
+
+from .common import FORMATS, make_strings
+
+
+class ToMoney:
+    """ Parsing strings with to_money, from cold: the parse cache is
+    cleared before each sample. Real columns repeat amounts, so 'distinct'
+    bounds the distinct strings per row count.
+    """
+    params = [[10 ** 4, 10 ** 6], [3, 40], [0., 0.1], FORMATS]
+    param_names = ['n', 'currencies', 'na_ratio', 'fmt']
+    number = 1
+    repeat = 3
+
+    def setup(self, n, currencies, na_ratio, fmt):
+        self.values = make_strings(n, currencies, na_ratio, fmt, distinct=n // 10)
+        parser.parse_cache.clear()
+
+    def time_to_money(self, n, currencies, na_ratio, fmt):
+        mpd.to_money(self.values, default_money_code='GBP')
+
+    def peakmem_to_money(self, n, currencies, na_ratio, fmt):
+        mpd.to_money(self.values, default_money_code='GBP')
+
+
+class ToMoneyDistinct:
+    """ Every string distinct, so factorizing cannot help and the batch
+    string parser does all the work """
+    params = [[10 ** 4, 10 ** 6], ['code_first', 'symbol', 'mixed']]
+    param_names = ['n', 'fmt']
+    number = 1
+    repeat = 3
+
+    def setup(self, n, fmt):
+        self.values = make_strings(n, 3, 0., fmt)
+        parser.parse_cache.clear()
+
+    def time_to_money(self, n, fmt):
+        mpd.to_money(self.values, default_money_code='GBP')
+
+    def time_to_money_warm_cache(self, n, fmt):
+        mpd.to_money(self.values[:2 ** 15], default_money_code='GBP')
+        mpd.to_money(self.values[:2 ** 15], default_money_code='GBP')
+
+
+class Construct:
+    """ Constructors that should not parse at all """
+    params = [10 ** 4, 10 ** 6]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.array = mpd.to_money(make_strings(n, 3, 0.1, distinct=1000), default_money_code='GBP')
+        self.series = pd.Series(self.array)
+        self.tuples = self.array.tolist()[:10 ** 4]
+
+    def time_from_money_array(self, n):
+        mpd.MoneyArray(self.array)
+
+    def time_from_records(self, n):
+        mpd.MoneyArray(self.array.data)
+
+    def time_from_series(self, n):
+        mpd.to_money(self.series)
+
+    def time_fixed_from_money_array(self, n):
+        mpd.FixedMoneyArray(self.array)
+
+    def time_from_tuples(self, n):
+        mpd.MoneyArray(self.tuples)
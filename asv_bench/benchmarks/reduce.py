@@ -0,0 +1,89 @@
+import money
+import pandas as pd
+
+import moneypandas as mpd
+
+from .common import ROWS, CURRENCIES, NA_RATIOS, install_rates, make_money_array, make_fixed_money_array
+
+
+class Reduce:
+    """ Whole-column reductions: per-currency partials, converted once """
+    params = [ROWS, CURRENCIES, NA_RATIOS, ['money', 'fixedmoney']]
+    param_names = ['n', 'currencies', 'na_ratio', 'dtype']
+
+    def setup(self, n, currencies, na_ratio, dtype):
+        install_rates(currencies)
+        make = make_fixed_money_array if dtype == 'fixedmoney' else make_money_array
+        self.series = pd.Series(make(n, currencies, na_ratio=na_ratio))
+
+    def teardown(self, n, currencies, na_ratio, dtype):
+        money.xrates.uninstall()
+
+    def time_sum(self, n, currencies, na_ratio, dtype):
+        self.series.sum()
+
+    def peakmem_sum(self, n, currencies, na_ratio, dtype):
+        self.series.sum()
+
+    def time_mean(self, n, currencies, na_ratio, dtype):
+        self.series.mean()
+
+    def time_min(self, n, currencies, na_ratio, dtype):
+        self.series.min()
+
+    def time_max(self, n, currencies, na_ratio, dtype):
+        self.series.max()
+
+    def time_median(self, n, currencies, na_ratio, dtype):
+        self.series.median()
+
+    def time_std(self, n, currencies, na_ratio, dtype):
+        self.series.std()
+
+    def time_count(self, n, currencies, na_ratio, dtype):
+        self.series.count()
+
+
+class Accumulate:
+    """ Running totals, per currency and normalized """
+    params = [ROWS, CURRENCIES]
+    param_names = ['n', 'currencies']
+
+    def setup(self, n, currencies):
+        install_rates(currencies)
+        self.series = pd.Series(make_money_array(n, currencies, na_ratio=0.05))
+
+    def teardown(self, n, currencies):
+        money.xrates.uninstall()
+
+    def time_cumsum(self, n, currencies):
+        self.series.money.cumsum()
+
+    def time_cumsum_normalized(self, n, currencies):
+        self.series.money.cumsum(money_code='USD')
+
+    def time_cummax(self, n, currencies):
+        self.series.money.cummax()
+
+
+class StreamingTotals:
+    """ MoneyAccumulator updates over batches, and the converted result """
+    params = [ROWS, CURRENCIES]
+    param_names = ['n', 'currencies']
+
+    def setup(self, n, currencies):
+        install_rates(currencies)
+        self.batch = make_money_array(n, currencies, na_ratio=0.05)
+        self.accumulator = mpd.MoneyAccumulator('USD').update(self.batch)
+
+    def teardown(self, n, currencies):
+        money.xrates.uninstall()
+
+    def time_update(self, n, currencies):
+        mpd.MoneyAccumulator('USD').update(self.batch)
+
+    def time_merge(self, n, currencies):
+        mpd.MoneyAccumulator('USD').merge(self.accumulator)
+
+    def time_result(self, n, currencies):
+        self.accumulator.result()
@@ -0,0 +1,92 @@
+import io
+import os
+import pickle
+import tempfile
+
+import pandas as pd
+
+import moneypandas as mpd
+
+from .common import make_money_array, make_strings
+
+
+class Serialize:
+    """ Round trips that should move records in bulk, never boxing """
+    params = [10 ** 4, 10 ** 6]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.array = make_money_array(n, 3, na_ratio=0.05)
+        self.bytes = self.array.to_bytes()
+        self.pickled = pickle.dumps(self.array, protocol=5)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'ledger.money')
+        self.array.to_file(self.path)
+
+    def teardown(self, n):
+        os.remove(self.path)
+        os.rmdir(self.directory)
+
+    def time_to_bytes(self, n):
+        self.array.to_bytes()
+
+    def time_from_bytes(self, n):
+        mpd.MoneyArray.from_bytes(self.bytes)
+
+    def time_pickle(self, n):
+        pickle.dumps(self.array, protocol=5)
+
+    def time_unpickle(self, n):
+        pickle.loads(self.pickled)
+
+    def time_to_file(self, n):
+        self.array.to_file(self.path)
+
+    def time_open_mmap(self, n):
+        mpd.MoneyArray.open_mmap(self.path)
+
+    def peakmem_open_mmap_slice(self, n):
+        mpd.MoneyArray.open_mmap(self.path)[:1000].copy()
+
+
+class Arrow:
+    """ Conversion to and from Arrow, if pyarrow is installed """
+    params = [10 ** 4, 10 ** 6]
+    param_names = ['n']
+
+    def setup(self, n):
+        try:
+            import pyarrow
+        except ImportError:
+            raise NotImplementedError("pyarrow is not installed")
+        self.pa = pyarrow
+        self.array = make_money_array(n, 3, na_ratio=0.05)
+        self.arrow = pyarrow.array(self.array)
+
+    def time_to_arrow(self, n):
+        self.pa.array(self.array)
+
+    def time_from_arrow(self, n):
+        mpd.MoneyType().__from_arrow__(self.arrow)
+
+
+class ReadCSV:
+    """ Chunked CSV ingestion of a money column """
+    params = [10 ** 4, 10 ** 6]
+    param_names = ['n']
+    number = 1
+    repeat = 3
+
+    def setup(self, n):
+        frame = pd.DataFrame({'account': range(n), 'amount': make_strings(n, 3, 0.05, 'mixed', distinct=n // 10)})
+        self.csv = frame.to_csv(index=False)
+
+    def time_read_csv(self, n):
+        mpd.read_csv(io.StringIO(self.csv), ['amount'], default_money_code='GBP')
+
+    def peakmem_read_csv(self, n):
+        mpd.read_csv(io.StringIO(self.csv), ['amount'], default_money_code='GBP')
+
+    def peakmem_pandas_read_csv_then_parse(self, n):
+        frame = pd.read_csv(io.StringIO(self.csv))
+        frame['amount'] = mpd.to_money(frame['amount'], default_money_code='GBP')
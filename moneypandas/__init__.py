@@ -5,7 +5,22 @@ from .money_array import (
     MoneyArray,
     MoneyAccessor,
 )
+from .fixed_money_array import (
+    FixedMoneyType,
+    FixedMoneyArray,
+)
+from .converted_money_array import ConvertedMoneyArray
+from .groupby import MoneyGroupBy
+from .accumulator import MoneyAccumulator, MoneySummary
 from .parser import to_money
+from .io import read_csv
+from .instrumentation import stats
+
+try:
+    # Registers the Arrow extension type, for Parquet and Arrow IPC
+    from .arrow import MoneyArrowType
+except ImportError:
+    pass
 
 from pkg_resources import get_distribution, DistributionNotFound
 try:
@@ -20,8 +35,16 @@ del DistributionNotFound
 
 __all__ = [
     '__version__',
+    'ConvertedMoneyArray',
+    'FixedMoneyArray',
+    'FixedMoneyType',
     'MoneyAccessor',
+    'MoneyAccumulator',
     'MoneyArray',
+    'MoneyGroupBy',
+    'MoneySummary',
     'MoneyType',
+    'read_csv',
+    'stats',
     'to_money',
 ]
@@ -0,0 +1,67 @@
+""" ISO 4217 data precomputed from iso4217parse, so that importing
+moneypandas does not load and search its tables.
+
+Generated by moneypandas.dtypes.write_currency_data; do not edit. """
+
+ISO4217PARSE_VERSION = '0.6.2'
+
+CODES = [
+    'AED', 'AFN', 'ALL', 'AMD', 'ANG', 'AOA', 'ARS', 'AUD', 'AWG', 'AZN',
+    'BAM', 'BBD', 'BDT', 'BGN', 'BHD', 'BIF', 'BMD', 'BND', 'BOB', 'BOV',
+    'BRL', 'BSD', 'BTN', 'BWP', 'BYN', 'BZD', 'CAD', 'CDF', 'CHE', 'CHF',
+    'CHW', 'CLF', 'CLP', 'CNH', 'CNT', 'CNY', 'COP', 'COU', 'CRC', 'CUC',
+    'CUP', 'CVE', 'CZK', 'DJF', 'DKK', 'DOP', 'DZD', 'EGP', 'ERN', 'ETB',
+    'EUR', 'FJD', 'FKP', 'GBP', 'GEL', 'GGP', 'GHS', 'GIP', 'GMD', 'GNF',
+    'GTQ', 'GYD', 'HKD', 'HNL', 'HRK', 'HTG', 'HUF', 'IDR', 'ILS', 'IMP',
+    'INR', 'IQD', 'IRR', 'ISK', 'JEP', 'JMD', 'JOD', 'JPY', 'KES', 'KGS',
+    'KHR', 'KID', 'KMF', 'KPW', 'KRW', 'KWD', 'KYD', 'KZT', 'LAK', 'LBP',
+    'LKR', 'LRD', 'LSL', 'LYD', 'MAD', 'MDL', 'MGA', 'MKD', 'MMK', 'MNT',
+    'MOP', 'MRO', 'MUR', 'MVR', 'MWK', 'MXN', 'MXV', 'MYR', 'MZN', 'NAD',
+    'NGN', 'NIO', 'NIS', 'NOK', 'NPR', 'NTD', 'NZD', 'OMR', 'PAB', 'PEN',
+    'PGK', 'PHP', 'PKR', 'PLN', 'PRB', 'PYG', 'QAR', 'RON', 'RSD', 'RUB',
+    'RWF', 'SAR', 'SBD', 'SCR', 'SDG', 'SEK', 'SGD', 'SHP', 'SLL', 'SLS',
+    'SOS', 'SRD', 'SSP', 'STD', 'SVC', 'SYP', 'SZL', 'THB', 'TJS', 'TMT',
+    'TND', 'TOP', 'TRY', 'TTD', 'TVD', 'TWD', 'TZS', 'UAH', 'UGX', 'USD',
+    'USN', 'UYI', 'UYU', 'UZS', 'VEF', 'VND', 'VUV', 'WST', 'XAF', 'XAG',
+    'XAU', 'XBA', 'XBB', 'XBC', 'XBD', 'XCD', 'XDR', 'XOF', 'XPD', 'XPF',
+    'XPT', 'XSU', 'XTS', 'XUA', 'XXX', 'YER', 'ZAR', 'ZMW', 'ZWL',
+]
+
+EXPONENTS = {
+    'AED': 2, 'AFN': 2, 'ALL': 2, 'AMD': 2, 'ANG': 2, 'AOA': 2, 'ARS': 2,
+    'AUD': 2, 'AWG': 2, 'AZN': 2, 'BAM': 2, 'BBD': 2, 'BDT': 2, 'BGN': 2,
+    'BHD': 3, 'BIF': 0, 'BMD': 2, 'BND': 2, 'BOB': 2, 'BOV': 2, 'BRL': 2,
+    'BSD': 2, 'BTN': 2, 'BWP': 2, 'BYN': 2, 'BZD': 2, 'CAD': 2, 'CDF': 2,
+    'CHE': 2, 'CHF': 2, 'CHW': 2, 'CLF': 4, 'CLP': 0, 'CNH': 2, 'CNT': 2,
+    'CNY': 2, 'COP': 2, 'COU': 2, 'CRC': 2, 'CUC': 2, 'CUP': 2, 'CVE': 0,
+    'CZK': 2, 'DJF': 0, 'DKK': 2, 'DOP': 2, 'DZD': 2, 'EGP': 2, 'ERN': 2,
+    'ETB': 2, 'EUR': 2, 'FJD': 2, 'FKP': 2, 'GBP': 2, 'GEL': 2, 'GGP': 2,
+    'GHS': 2, 'GIP': 2, 'GMD': 2, 'GNF': 0, 'GTQ': 2, 'GYD': 2, 'HKD': 2,
+    'HNL': 2, 'HRK': 2, 'HTG': 2, 'HUF': 2, 'IDR': 2, 'ILS': 2, 'IMP': 2,
+    'INR': 2, 'IQD': 3, 'IRR': 2, 'ISK': 0, 'JEP': 2, 'JMD': 2, 'JOD': 3,
+    'JPY': 0, 'KES': 2, 'KGS': 2, 'KHR': 2, 'KID': 2, 'KMF': 0, 'KPW': 2,
+    'KRW': 0, 'KWD': 3, 'KYD': 2, 'KZT': 2, 'LAK': 2, 'LBP': 2, 'LKR': 2,
+    'LRD': 2, 'LSL': 2, 'LYD': 3, 'MAD': 2, 'MDL': 2, 'MGA': 1, 'MKD': 2,
+    'MMK': 2, 'MNT': 2, 'MOP': 2, 'MRO': 1, 'MUR': 2, 'MVR': 2, 'MWK': 2,
+    'MXN': 2, 'MXV': 2, 'MYR': 2, 'MZN': 2, 'NAD': 2, 'NGN': 2, 'NIO': 2,
+    'NIS': 2, 'NOK': 2, 'NPR': 2, 'NTD': 2, 'NZD': 2, 'OMR': 3, 'PAB': 2,
+    'PEN': 2, 'PGK': 2, 'PHP': 2, 'PKR': 2, 'PLN': 2, 'PRB': 2, 'PYG': 0,
+    'QAR': 2, 'RON': 2, 'RSD': 2, 'RUB': 2, 'RWF': 0, 'SAR': 2, 'SBD': 2,
+    'SCR': 2, 'SDG': 2, 'SEK': 2, 'SGD': 2, 'SHP': 2, 'SLL': 2, 'SLS': 2,
+    'SOS': 2, 'SRD': 2, 'SSP': 2, 'STD': 2, 'SVC': 2, 'SYP': 2, 'SZL': 2,
+    'THB': 2, 'TJS': 2, 'TMT': 2, 'TND': 3, 'TOP': 2, 'TRY': 2, 'TTD': 2,
+    'TVD': 2, 'TWD': 2, 'TZS': 2, 'UAH': 2, 'UGX': 0, 'USD': 2, 'USN': 2,
+    'UYI': 0, 'UYU': 2, 'UZS': 2, 'VEF': 2, 'VND': 0, 'VUV': 0, 'WST': 2,
+    'XAF': 0, 'XAG': 0, 'XAU': 0, 'XBA': 0, 'XBB': 0, 'XBC': 0, 'XBD': 0,
+    'XCD': 2, 'XDR': 0, 'XOF': 0, 'XPD': 0, 'XPF': 0, 'XPT': 0, 'XSU': 0,
+    'XTS': 0, 'XUA': 0, 'XXX': 0, 'YER': 2, 'ZAR': 2, 'ZMW': 2, 'ZWL': 2,
+}
+
+SYMBOLS = {
+    '$': 'ARS', '¢': 'GHS', '£': 'FKP', '¥': 'CNY', '֏': 'AMD', '؋': 'AFN',
+    '৳': 'BDT', '฿': 'THB', '៛': 'KHR', '₡': 'CRC', '₦': 'NGN', '₨': 'LKR',
+    '₩': 'KPW', '₪': 'ILS', '₫': 'VND', '€': 'EUR', '₭': 'LAK', '₮': 'MNT',
+    '₱': 'CUP', '₲': 'PYG', '₴': 'UAH', '₵': 'GHS', '₸': 'KZT', '₹': 'INR',
+    '₺': 'TRY', '₼': 'AZN', '₽': 'RUB', '₾': 'GEL', '﷼': 'IRR', '﹩': 'ARS',
+    '＄': 'ARS', '￡': 'FKP', '￥': 'CNY', '￦': 'KPW',
+}
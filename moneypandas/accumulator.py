@@ -0,0 +1,203 @@
+""" Mergeable per-currency totals, for streams of batches and map-reduce """
+import collections
+
+import numpy as np
+import money
+
+from .dtypes import encode_currency, encode_currencies, decode_currencies
+from .rates import pairwise_rates
+from .reductions import currency_counts, currency_partials, currency_extrema
+
+MoneySummary = collections.namedtuple('MoneySummary', ['count', 'sum', 'mean', 'min', 'max', 'std'])
+
+# Per-currency state, keyed by currency string rather than integer code so
+# that accumulators from processes that code currencies apart can merge.
+# 'm2' is the sum of squared deviations from the mean, combined as by Chan
+# et al. rather than from a sum of squares, which cancels catastrophically
+# for large amounts with a small spread.
+_state_type = np.dtype([
+    ('currency', 'U3'),
+    ('count', np.int64),
+    ('sum', np.float64),
+    ('min', np.float64),
+    ('max', np.float64),
+    ('m2', np.float64),
+])
+
+
+def _means(state):
+    """ Per-currency means of a state, 0 where it has no values """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(state['count'] > 0, state['sum'] / state['count'], 0.)
+
+
+class MoneyAccumulator:
+    """Running count, sum, minimum, maximum and variance of money values,
+    per currency.
+
+    Amounts accumulate as floats in major units, for FixedMoneyArrays too.
+    Each update reduces a batch in one pass over its rows, and merges the
+    per-currency partials into the state, so totals over an endless stream
+    never hold more than a batch. Accumulators from different batches,
+    threads or processes combine with merge, and pickle as their state.
+    Nothing is converted until result, which converts the per-currency
+    partials with one gather over a rate snapshot.
+
+    Parameters
+    ----------
+    default_money_code : str, optional
+        ISO4712 code to report mixed currencies in, unless result is given
+        one; otherwise the first present, alphabetically
+
+    Examples
+    --------
+    >>> totals = MoneyAccumulator('GBP')
+    >>> for frame in read_csv('ledger.csv', ['amount'], chunksize=10 ** 6):
+    ...     totals.update(frame['amount'])
+    >>> totals.result().sum
+    GBP 1234.56
+    """
+
+    def __init__(self, default_money_code=None):
+        self.default_money_code = default_money_code
+        self.state = np.zeros(0, dtype=_state_type)
+
+    def __repr__(self):
+        return '<MoneyAccumulator({})>'.format(', '.join(
+            '{}: {}'.format(row['currency'], row['count']) for row in self.state))
+
+    def __len__(self):
+        """Number of non-NA values accumulated"""
+        return int(self.state['count'].sum())
+
+    def update(self, values):
+        """Accumulate a batch of money values.
+
+        Parameters
+        ----------
+        values : MoneyArray, FixedMoneyArray, Series of those, or anything
+            to_money parses
+
+        Returns
+        -------
+        MoneyAccumulator
+            This accumulator
+        """
+        from .money_array import MoneyArray
+        from .parser import to_money
+
+        values = getattr(values, 'array', values)
+        if not isinstance(values, MoneyArray):
+            values = to_money(values, default_money_code=self.default_money_code)
+
+        cu = values.data['cu']
+        currencies, counts = currency_counts(cu)
+        if not len(currencies):
+            return self
+
+        va = values._amounts()
+        batch = np.zeros(len(currencies), dtype=_state_type)
+        batch['currency'] = decode_currencies(currencies)
+        batch['count'] = counts
+        batch['sum'] = currency_partials(va, cu, np.add, currencies, counts)
+        batch['min'], batch['max'] = currency_extrema(va, cu, currencies, counts)
+
+        # Squared deviations from each currency's mean in this batch
+        means = np.zeros(currencies[-1] + 1)
+        means[currencies] = _means(batch)
+        deviations = va - means[cu]
+        batch['m2'] = np.bincount(cu, weights=deviations * deviations)[currencies]
+        return self._merge_state(batch)
+
+    def merge(self, other):
+        """Fold another accumulator's state into this one.
+
+        Returns
+        -------
+        MoneyAccumulator
+            This accumulator
+        """
+        return self._merge_state(other.state)
+
+    def _merge_state(self, state):
+        currencies = np.union1d(self.state['currency'], state['currency'])
+        left, right = (self._aligned(part, currencies) for part in (self.state, state))
+
+        merged = np.zeros(len(currencies), dtype=_state_type)
+        merged['currency'] = currencies
+        merged['count'] = left['count'] + right['count']
+        merged['sum'] = left['sum'] + right['sum']
+        merged['min'] = np.minimum(left['min'], right['min'])
+        merged['max'] = np.maximum(left['max'], right['max'])
+
+        # Chan et al.'s pairwise update of the squared deviations
+        delta = _means(right) - _means(left)
+        weight = left['count'] * right['count'] / merged['count']
+        merged['m2'] = left['m2'] + right['m2'] + delta * delta * weight
+
+        self.state = merged
+        return self
+
+    @staticmethod
+    def _aligned(state, currencies):
+        """ A state spread over 'currencies', a superset of its own, with
+        empty entries for the currencies it lacks """
+        aligned = np.zeros(len(currencies), dtype=_state_type)
+        aligned['currency'] = currencies
+        aligned['min'] = np.inf
+        aligned['max'] = -np.inf
+        aligned[np.searchsorted(currencies, state['currency'])] = state
+        return aligned
+
+    def result(self, money_code=None, ddof=1):
+        """Summarize the values accumulated so far in one currency.
+
+        Parameters
+        ----------
+        money_code : str, optional
+            ISO4712 code to convert to; by default the only currency
+            present, or else the default currency or the first present
+        ddof : int, default 1
+            Delta degrees of freedom of the standard deviation
+
+        Returns
+        -------
+        MoneySummary
+            The count, and the sum, mean, minimum, maximum and standard
+            deviation as money, NA where there are too few values
+        """
+        state = self.state
+        count = len(self)
+        if not money_code:
+            if len(state) == 1:
+                money_code = state['currency'][0]
+            else:
+                money_code = self.default_money_code or (state['currency'][0] if len(state) else None)
+
+        na = np.nan
+        if not count:
+            total = money.XMoney(0, money_code) if money_code else na
+            return MoneySummary(0, total, na, na, na, na)
+
+        # One rate per currency, from one snapshot
+        currencies = encode_currencies(state['currency'])
+        target = np.full(len(currencies), encode_currency(money_code), dtype=currencies.dtype)
+        rates = pairwise_rates(currencies, target)
+
+        total = (state['sum'] * rates).sum()
+        std = na
+        if count > ddof:
+            # Each currency's deviations scale with its rate, and its mean
+            # deviates from the overall mean
+            spread = _means(state) * rates - total / count
+            m2 = (state['m2'] * rates * rates).sum() + (state['count'] * spread * spread).sum()
+            std = money.XMoney(np.sqrt(m2 / (count - ddof)), money_code)
+
+        return MoneySummary(
+            count,
+            money.XMoney(total, money_code),
+            money.XMoney(total / count, money_code),
+            money.XMoney((state['min'] * rates).min(), money_code),
+            money.XMoney((state['max'] * rates).max(), money_code),
+            std,
+        )
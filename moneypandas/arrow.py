@@ -0,0 +1,132 @@
+""" Apache Arrow extension type for money columns (requires pyarrow)
+
+Money is stored in Arrow as a struct of the amount (float64 major units for
+MoneyType, int64 minor units for FixedMoneyType) and a dictionary-encoded
+currency, with NA as a null struct. Registering the type lets Parquet and
+Arrow IPC round-trip money columns, including their default currency.
+"""
+import json
+
+import numpy as np
+import pyarrow as pa
+
+from .dtypes import encode_currencies, decode_currencies, currency_code_type
+from .reductions import currency_counts
+
+
+class MoneyArrowType(pa.ExtensionType):
+    """Arrow type for a MoneyArray ('money') or FixedMoneyArray
+    ('fixedmoney') column, with its default currency, if any, as metadata.
+    """
+    _amount_types = {'money': pa.float64(), 'fixedmoney': pa.int64()}
+
+    def __init__(self, dtype_name='money', default_money_code=None, currency_type=None):
+        if dtype_name not in self._amount_types:
+            raise ValueError("Unknown money dtype '{}'".format(dtype_name))
+        self.dtype_name = dtype_name
+        self.default_money_code = default_money_code
+        storage = pa.struct([
+            ('va', self._amount_types[dtype_name]),
+            ('cu', currency_type or pa.dictionary(pa.int32(), pa.string())),
+        ])
+        super(MoneyArrowType, self).__init__(storage, 'moneypandas.money')
+
+    def __arrow_ext_serialize__(self):
+        return json.dumps({
+            'dtype': self.dtype_name,
+            'default_money_code': self.default_money_code,
+        }).encode()
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        # Other writers may store the currencies as plain strings, or with
+        # other dictionary indices, which from_arrow accepts as well
+        metadata = json.loads(serialized.decode())
+        currency_type = storage_type.field('cu').type
+        return cls(metadata['dtype'], metadata.get('default_money_code'), currency_type)
+
+    def __reduce__(self):
+        return type(self), (self.dtype_name, self.default_money_code,
+                            self.storage_type.field('cu').type)
+
+    def to_pandas_dtype(self):
+        from .money_array import MoneyType
+        from .fixed_money_array import FixedMoneyType
+
+        dtype = FixedMoneyType if self.dtype_name == 'fixedmoney' else MoneyType
+        return dtype(default_money_code=self.default_money_code)
+
+
+try:
+    pa.register_extension_type(MoneyArrowType())
+except pa.ArrowKeyError:
+    # Already registered, e.g. on reloading this module
+    pass
+
+
+def to_arrow(values):
+    """ Method to build a MoneyArrowType array from a MoneyArray in bulk:
+    the amounts are copied out of the records once, and the currencies are
+    dictionary-encoded over those present, without boxing any values.
+    """
+    data = values.data
+    cu = data['cu']
+    na = cu == 0
+
+    currencies, _ = currency_counts(cu)
+    lookup = np.zeros(cu.max(initial=0) + 1, dtype=np.int32)
+    lookup[currencies] = np.arange(len(currencies))
+
+    indices = pa.array(lookup[cu], mask=na if na.any() else None)
+    dictionary = pa.array(decode_currencies(currencies).tolist(), type=pa.string())
+
+    arrow_type = MoneyArrowType(values.dtype.name, values.default_money_code)
+    storage = pa.StructArray.from_arrays(
+        [pa.array(np.ascontiguousarray(data['va'])), pa.DictionaryArray.from_arrays(indices, dictionary)],
+        fields=list(arrow_type.storage_type),
+        mask=pa.array(na) if na.any() else None,
+    )
+    return pa.ExtensionArray.from_storage(arrow_type, storage)
+
+
+def _chunk_records(chunk, record_type):
+    """ Records for one Arrow chunk of MoneyArrowType, or its struct storage """
+    if isinstance(chunk, pa.ExtensionArray):
+        chunk = chunk.storage
+
+    # Unlike field(), flatten() respects slicing and the struct's own nulls
+    amounts, currencies = chunk.flatten()
+    records = np.zeros(len(chunk), dtype=record_type)
+    records['va'] = amounts.fill_null(0).to_numpy(zero_copy_only=False)
+
+    if not isinstance(currencies, pa.DictionaryArray):
+        currencies = currencies.dictionary_encode()
+    lookup = encode_currencies(currencies.dictionary.to_numpy(zero_copy_only=False).astype('U3'))
+    indices = currencies.indices.fill_null(0).to_numpy(zero_copy_only=False)
+    codes = lookup[indices] if len(lookup) else np.zeros(len(chunk), dtype=currency_code_type)
+
+    # A row is NA if its struct, or its currency, is null
+    na = currencies.is_null().to_numpy(zero_copy_only=False)
+    codes[na] = 0
+    records['va'][na] = 0
+    records['cu'] = codes
+    return records
+
+
+def from_arrow(array, dtype):
+    """ Method to build a MoneyArray, or FixedMoneyArray, of 'dtype' from an
+    Arrow Array or ChunkedArray of MoneyArrowType (or its struct storage).
+    """
+    chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+    default_money_code = dtype.default_money_code
+    if default_money_code is None and isinstance(array.type, MoneyArrowType):
+        default_money_code = array.type.default_money_code
+
+    record_type = dtype._record_type
+    if len(chunks) == 1:
+        records = _chunk_records(chunks[0], record_type)
+    else:
+        records = np.concatenate([_chunk_records(chunk, record_type) for chunk in chunks]) \
+            if chunks else np.zeros(0, dtype=record_type)
+
+    return dtype.construct_array_type()._from_ndarray(records, default_money_code=default_money_code)
@@ -1,6 +1,8 @@
 import operator
 
 import numpy as np
+import pandas as pd
+from pandas.core.algorithms import duplicated
 
 from pandas.core.arrays import ExtensionArray, ExtensionScalarOpsMixin
 
@@ -33,7 +35,7 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray, ExtensionScalarOpsMixin):
         elif result.ndim == 0:
             return self._box_scalar(result.item())
         else:
-            return type(self)(result)
+            return self._shallow_copy(result)
 
     def setitem(self, indexer, value):
         """Set the 'value' inplace.
@@ -50,25 +52,33 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray, ExtensionScalarOpsMixin):
     def _formatting_values(self):
         return np.array(self._format_values(), dtype='object')
 
+    def _shallow_copy(self, data):
+        """Wrap an ndarray of our record type without re-parsing it."""
+        return self._from_ndarray(data)
+
     def copy(self, deep=False):
-        return type(self)(self.data.copy())
+        return self._shallow_copy(self.data.copy())
 
     @classmethod
     def _concat_same_type(cls, to_concat):
-        return cls(np.concatenate([array.data for array in to_concat]))
+        data = np.concatenate([array.data for array in to_concat])
+        if not to_concat:
+            return cls._from_ndarray(data)
+        return to_concat[0]._shallow_copy(data)
 
     def tolist(self):
         return self.data.tolist()
 
-    def argsort(self, axis=-1, kind='quicksort', order=None):
-        return self.data.argsort()
-
     def unique(self):
         # type: () -> ExtensionArray
         # https://github.com/pandas-dev/pandas/pull/19869
-        _, indices = np.unique(self.data, return_index=True)
-        data = self.data.take(np.sort(indices))
-        return self._from_ndarray(data)
+        # Hash the records' factorize keys, rather than sorting the records
+        values, _ = self._values_for_factorize()
+        return self._from_factorized(pd.unique(values), self)
+
+    def duplicated(self, keep='first'):
+        values, _ = self._values_for_factorize()
+        return duplicated(values, keep=keep)
 
 NumPyBackedExtensionArrayMixin._add_arithmetic_ops()
 NumPyBackedExtensionArrayMixin._add_comparison_ops()
@@ -0,0 +1,136 @@
+""" Lazily converted views of money arrays, from to_currency(lazy=True) """
+import numpy as np
+
+from .dtypes import encode_currency
+from .money_array import MoneyArray, _convert_to
+from .rates import rate_cache
+
+
+class ConvertedMoneyArray(MoneyArray):
+    """A MoneyArray of the records of another converted to one currency,
+    as returned by to_currency(money_code, shallow=False, lazy=True).
+
+    Until materialized, the view holds the source records, the target
+    currency and the rate snapshot current when it was made. Slices, takes,
+    copies and reductions work from the source records, converting only
+    what they return; a write, or anything else needing the records,
+    converts the whole array once, after which the view behaves as an
+    ordinary MoneyArray. Like a NumPy view, an unmaterialized view sees
+    later writes to its source.
+
+    Examples
+    --------
+    >>> converted = arr.to_currency('GBP', shallow=False, lazy=True)
+    >>> converted[:5]       # converts five rows
+    >>> converted.sum()     # converts one partial sum per currency
+    >>> converted.materialize()
+    """
+    _source = None
+
+    @classmethod
+    def _view(cls, source, money_code, rates):
+        """ A view converting MoneyType records 'source' to 'money_code'
+        with the RateSnapshot 'rates' (None for the live backend) """
+        new = cls.__new__(cls)
+        new._data = None
+        new._source = source
+        new._money_code = money_code
+        new._rates = rates
+        new.default_money_code = money_code
+        return new
+
+    @property
+    def data(self):
+        if self._source is not None:
+            self.materialize()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._source = None
+
+    @property
+    def is_materialized(self):
+        """Whether the converted records have been computed"""
+        return self._source is None
+
+    def materialize(self):
+        """Convert the source records now, if not done already.
+
+        Returns
+        -------
+        ConvertedMoneyArray
+            This array, no longer lazy
+        """
+        if self._source is not None:
+            self.data = self._convert(self._source)
+            self._rates = None
+        return self
+
+    def _convert(self, records):
+        """ A converted copy of some of the source records """
+        with rate_cache.pinned(self._rates):
+            return _convert_to(records.copy(), self._money_code)
+
+    def _view_of(self, records):
+        return self._view(records, self._money_code, self._rates)
+
+    def _shallow_copy(self, data):
+        # Arrays derived from the converted records are ordinary
+        return MoneyArray._from_ndarray(data, default_money_code=self.default_money_code)
+
+    @property
+    def shape(self):
+        return (len(self),)
+
+    def __len__(self):
+        if self._source is not None:
+            return len(self._source)
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if self._source is None:
+            return super(ConvertedMoneyArray, self).__getitem__(key)
+
+        result = self._source[key]
+        if isinstance(result, np.ndarray) and result.ndim:
+            return self._view_of(result)
+        return self._box_scalar(self._convert(np.atleast_1d(result))[0])
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        if self._source is None or not (fill_value is None or fill_value is self.dtype.na_value):
+            return super(ConvertedMoneyArray, self).take(indices, allow_fill, fill_value)
+
+        source = MoneyArray._from_ndarray(self._source)
+        return self._view_of(source.take(indices, allow_fill=allow_fill).data)
+
+    def copy(self, deep=False):
+        if self._source is None:
+            return super(ConvertedMoneyArray, self).copy(deep)
+        return self._view_of(self._source.copy())
+
+    def isna(self):
+        if self._source is None:
+            return super(ConvertedMoneyArray, self).isna()
+        return self._source['cu'] == 0
+
+    def _reduce(self, name, skipna=True, money_code=None, **kwargs):
+        # Converting distinct values may make them equal, so counting them
+        # needs the converted records
+        if self._source is None or name == 'nunique':
+            return super(ConvertedMoneyArray, self)._reduce(name, skipna, money_code, **kwargs)
+
+        source = MoneyArray._from_ndarray(self._source)
+        with rate_cache.pinned(self._rates):
+            return source._reduce(name, skipna, money_code or self._money_code, **kwargs)
+
+    def to_currency(self, money_code, shallow=True, in_place=False, lazy=False):
+        # A chained lazy conversion under the same rates converts straight
+        # from the source records
+        if self._source is not None and lazy and not shallow and not in_place:
+            # Registered first, so that a current snapshot covers it
+            encode_currency(money_code)
+            if self._rates is not None and self._rates is rate_cache.snapshot():
+                return self._view(self._source, money_code, self._rates)
+        return super(ConvertedMoneyArray, self).to_currency(money_code, shallow, in_place, lazy)
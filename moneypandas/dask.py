@@ -0,0 +1,152 @@
+""" Dask DataFrame support for money columns (requires dask[dataframe])
+
+Importing this module registers MoneyType and FixedMoneyType with dask's
+meta machinery, and a 'money' accessor on dask Series:
+
+>>> import moneypandas.dask
+>>> ddf['price'].money.sum().compute()
+>>> ddf['price'].money.to_currency('GBP')
+
+The reductions carry per-currency partials through dask's tree reduction,
+keyed by currency string so that partitions parsed in other processes
+combine correctly, and convert them once, in the final aggregate.
+"""
+import numpy as np
+import pandas as pd
+import money
+from dask.dataframe.extensions import (make_array_nonempty, make_scalar,
+                                       register_series_accessor)
+
+from .dtypes import encode_currencies, decode_currencies
+from .money_array import MoneyType
+from .rates import rate_cache
+from .reductions import currency_counts, currency_partials
+
+
+@make_array_nonempty.register(MoneyType)
+def _nonempty_money_array(dtype):
+    return dtype.construct_array_type()(['1 GBP', '2 GBP'])
+
+
+@make_scalar.register(MoneyType)
+def _money_scalar(dtype):
+    return money.XMoney(1, 'GBP')
+
+
+_partial_ufuncs = {
+    'sum': np.add,
+    'mean': np.add,
+    'min': np.minimum,
+    'max': np.maximum,
+    'count': np.add,
+}
+
+
+def _chunk(series, name):
+    """ Per-currency partials and counts of one partition, indexed by
+    currency string """
+    values = series.array
+    cu = values.data['cu']
+    currencies, counts = currency_counts(cu)
+    partials = currency_partials(values.data['va'], cu, _partial_ufuncs[name], currencies, counts)
+    return pd.DataFrame({'partial': partials, 'count': counts},
+                        index=pd.Index(decode_currencies(currencies), dtype=object))
+
+
+def _combine(partials, name):
+    """ Merge partials from several partitions, per currency """
+    grouped = partials.groupby(level=0, sort=False)
+    return pd.DataFrame({
+        'partial': grouped['partial'].agg(_partial_ufuncs[name].reduce),
+        'count': grouped['count'].sum(),
+    })
+
+
+def _aggregate(partials, name, meta, money_code, min_count, rates):
+    """ Convert the merged partials once and reduce them to a scalar, as
+    MoneyArray._reduce would over the whole column. The conversion uses
+    'rates', the RateSnapshot of the process building the graph, if any, as
+    this may run in a worker process with no xrates backend of its own. """
+    partials = _combine(partials, name)
+    total_count = int(partials['count'].sum())
+    if name == 'count':
+        return total_count
+
+    currencies = encode_currencies(partials.index.to_numpy(dtype='U3'))
+    order = np.argsort(currencies)
+    currencies = currencies[order]
+    if not money_code:
+        if len(currencies) == 1:
+            money_code = partials.index[order[0]]
+        else:
+            money_code = meta.default_money_code or \
+                (partials.index[order[0]] if len(currencies) else None)
+
+    if not total_count or total_count < min_count:
+        if name == 'sum' and money_code and total_count >= min_count:
+            return money.XMoney(0, money_code)
+        return meta.dtype.na_value
+
+    ufunc = _partial_ufuncs[name]
+    values = partials['partial'].to_numpy()[order]
+    with rate_cache.pinned(rates):
+        total = ufunc.reduce(meta._convert_partials(values, currencies, money_code))
+    if name == 'mean':
+        total = total / total_count
+    return money.XMoney(total, money_code)
+
+
+def _to_currency(series, money_code, shallow, rates):
+    with rate_cache.pinned(rates):
+        return series.money.to_currency(money_code, shallow=shallow, in_place=False)
+
+
+@register_series_accessor('money')
+class DaskMoneyAccessor:
+    """Money methods for a dask Series of MoneyType"""
+
+    def __init__(self, series):
+        if not isinstance(series.dtype, MoneyType):
+            raise AttributeError("Can only use .money accessor with money values")
+        self._series = series
+
+    def _reduction(self, name, money_code=None, min_count=0):
+        meta = self._series._meta.array
+        return self._series.reduction(
+            chunk=_chunk,
+            combine=_combine,
+            aggregate=_aggregate,
+            chunk_kwargs={'name': name},
+            combine_kwargs={'name': name},
+            aggregate_kwargs={'name': name, 'meta': meta, 'money_code': money_code,
+                              'min_count': min_count, 'rates': rate_cache.snapshot()},
+            meta=object,
+        )
+
+    def sum(self, money_code=None, min_count=0):
+        """Total, converting mixed currencies once at the end to
+        'money_code', the default currency, or the first present"""
+        return self._reduction('sum', money_code, min_count)
+
+    def mean(self, money_code=None):
+        """Mean of the non-NA values; see sum"""
+        return self._reduction('mean', money_code)
+
+    def min(self, money_code=None):
+        """Minimum; see sum"""
+        return self._reduction('min', money_code)
+
+    def max(self, money_code=None):
+        """Maximum; see sum"""
+        return self._reduction('max', money_code)
+
+    def count(self):
+        """Number of non-NA values"""
+        return self._reduction('count')
+
+    def to_currency(self, money_code, shallow=True):
+        """Convert each partition with Series.money.to_currency"""
+        return self._series.map_partitions(
+            _to_currency, money_code, shallow, rate_cache.snapshot(),
+            meta=self._series._meta,
+        )
@@ -1,9 +1,13 @@
 import re
+import threading
 import numpy as np
-import iso4217parse
+
+from . import _currency_data
 
 
 def find_currency_data():
+    import iso4217parse
+
     currency_symbols = iso4217parse._symbols()
     symbols = {}
     exclusion_list = ['.', '/']
@@ -14,30 +18,189 @@ def find_currency_data():
             symbols[item[0][0]] = code[0][0]
     return symbols
 
-symbols = find_currency_data()
-
-money_patterns = [(re.compile(r[0]), r[1]) for r in [
-    (
-        r'(-?)([' + ''.join(symbols) + r'])(\d*\.?\d*\d)',       # -£123.00
-        lambda m: (np.float64(m.group(1) + m.group(3)), symbols[m.group(2)])
-    ),
-    (
-        r'([A-Z]{3})\s*(-?\d*\.?\d*\d)',                         # EUR 123
-        lambda m: (np.float64(m.group(2)), m.group(1))
-    ),
-    (
-        r'(-?\d*\.?\d*\d)\s*([A-Z]{3})',                         # 97GBP
-        lambda m: (np.float64(m.group(1)), m.group(2))
-    ),
-]]
+
+def find_currency_codes():
+    """Return the sorted ISO 4217 alpha-3 codes known to iso4217parse"""
+    import iso4217parse
+    return sorted(iso4217parse._data().alpha3)
+
+
+def find_currency_exponents():
+    """Return the ISO 4217 minor unit exponent for each known code"""
+    import iso4217parse
+    return {code: currency.minor for code, currency in iso4217parse._data().alpha3.items()}
+
+
+def _format_literal(name, value, width=79):
+    """Format a list or dict assignment as source, packing its items onto
+    lines of at most 'width' characters under a hanging indent"""
+    if isinstance(value, dict):
+        items = ['{!r}: {!r},'.format(key, item) for key, item in sorted(value.items())]
+        brackets = '{}'
+    else:
+        items = ['{!r},'.format(item) for item in value]
+        brackets = '[]'
+
+    lines = ['']
+    for item in items:
+        if lines[-1] and len(lines[-1]) + len(item) + 1 > width:
+            lines.append('')
+        lines[-1] += (' ' if lines[-1] else '    ') + item
+    return '{} = {}\n{}\n{}\n'.format(name, brackets[0], '\n'.join(lines), brackets[1])
+
+
+def write_currency_data(path=None):
+    """Regenerate the _currency_data module from iso4217parse, e.g. with
+    `make currency-data` after upgrading iso4217parse.
+    """
+    from importlib.metadata import version
+
+    path = path or _currency_data.__file__
+    sections = [
+        '""" ISO 4217 data precomputed from iso4217parse, so that importing\n'
+        'moneypandas does not load and search its tables.\n\n'
+        'Generated by moneypandas.dtypes.write_currency_data; do not edit. """\n',
+        'ISO4217PARSE_VERSION = {!r}\n'.format(version('iso4217parse')),
+        _format_literal('CODES', find_currency_codes()),
+        _format_literal('EXPONENTS', find_currency_exponents()),
+        _format_literal('SYMBOLS', find_currency_data()),
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(sections))
+
+
+# The symbol table and the patterns built from it are only needed to parse
+# strings, so they are loaded on first use; see __getattr__
+_lazy = {}
+
+
+def __getattr__(name):
+    if name == 'symbols':
+        if name not in _lazy:
+            _lazy[name] = dict(_currency_data.SYMBOLS)
+        return _lazy[name]
+    if name == 'money_patterns':
+        if name not in _lazy:
+            _lazy[name] = _compile_money_patterns(__getattr__('symbols'))
+        return _lazy[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+currency_exponents = dict(_currency_data.EXPONENTS)
+default_currency_exponent = 2
+
+# Currencies are stored as small integer codes into this table, rather than as
+# strings. Code 0 is reserved for NA, and the ISO 4217 codes are seeded in sorted
+# order so that their codes are stable across processes (and so across
+# to_bytes); anything else is appended on first use, so its code depends on
+# the order in which each process meets it.
+currency_codes = [''] + list(_currency_data.CODES)
+currency_index = {code: i for i, code in enumerate(currency_codes)}
+_register_lock = threading.Lock()
+currency_code_type = np.dtype(np.uint16)
+_currency_table = np.array(currency_codes, dtype='U3')
+_exponent_table = np.array(
+    [0] + [currency_exponents[code] for code in currency_codes[1:]],
+    dtype=np.int8
+)
+
+
+def encode_currency(code):
+    """Return the integer code for a currency string, registering it if new"""
+    global _currency_table, _exponent_table
+
+    if not code:
+        return 0
+
+    try:
+        return currency_index[code]
+    except KeyError:
+        pass
+
+    with _register_lock:
+        # Another thread may have registered it meanwhile
+        if code in currency_index:
+            return currency_index[code]
+
+        index = len(currency_codes)
+        if index > np.iinfo(currency_code_type).max:
+            raise ValueError("Too many distinct currencies to encode {}".format(code))
+
+        # The tables grow first, so that a code found in currency_index
+        # without the lock can always be decoded
+        _currency_table = np.array(currency_codes + [code], dtype='U3')
+        _exponent_table = np.append(
+            _exponent_table,
+            currency_exponents.get(code, default_currency_exponent)
+        ).astype(np.int8)
+        currency_codes.append(code)
+        currency_index[code] = index
+    return index
+
+
+def encode_currencies(codes):
+    """Vectorized encode_currency for an array of currency strings"""
+    codes = np.asarray(codes)
+    if not len(codes):
+        return np.zeros(0, dtype=currency_code_type)
+
+    uniques, inverse = np.unique(codes, return_inverse=True)
+    lookup = np.array([encode_currency(code) for code in uniques], dtype=currency_code_type)
+    return lookup[inverse]
+
+
+def currency_lookup(currencies):
+    """Return an array mapping the integer codes of a currency table written
+    elsewhere, a dict of {code: currency string}, to the codes in this
+    process; or None if they are the same codes"""
+    if all(index < len(currency_codes) and currency_codes[index] == code
+           for index, code in currencies.items()):
+        return None
+    lookup = np.zeros(max(currencies, default=0) + 1, dtype=currency_code_type)
+    for index, code in currencies.items():
+        lookup[index] = encode_currency(code)
+    return lookup
+
+
+def decode_currency(index):
+    """Return the currency string for an integer code ('' for NA)"""
+    return currency_codes[index]
+
+
+def decode_currencies(indices):
+    """Vectorized decode_currency, returning an array of 'U3' strings"""
+    return _currency_table[indices]
+
+
+def _compile_money_patterns(symbols):
+    return [(re.compile(r[0]), r[1]) for r in [
+        (
+            r'(-?)([' + ''.join(symbols) + r'])(\d*\.?\d*\d)',       # -£123.00
+            lambda m: (np.float64(m.group(1) + m.group(3)), symbols[m.group(2)])
+        ),
+        (
+            r'([A-Z]{3})\s*(-?\d*\.?\d*\d)',                         # EUR 123
+            lambda m: (np.float64(m.group(2)), m.group(1))
+        ),
+        (
+            r'(-?\d*\.?\d*\d)\s*([A-Z]{3})',                         # 97GBP
+            lambda m: (np.float64(m.group(1)), m.group(2))
+        ),
+    ]]
+
 
 def is_money(value):
     # TODO: Better detection
     if isinstance(value, str):
-        return any([r[0].match(value) for r in money_patterns])
+        return any([r[0].match(value) for r in __getattr__('money_patterns')])
     elif isinstance(value, bytes):
         pass
     elif isinstance(value, int):
         return True
     else:
         return False
+
+
+def decode_exponents(indices):
+    """Return the minor unit exponent for each integer currency code"""
+    return _exponent_table[indices]
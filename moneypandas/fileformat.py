@@ -0,0 +1,91 @@
+""" Versioned binary file format for money arrays, readable through np.memmap
+
+A file is laid out as:
+
+    magic      8 bytes, b'MONEYPD\\0'
+    version    uint16, little-endian
+    length     uint32, little-endian: bytes of JSON header that follow
+    header     UTF-8 JSON: dtype name, record layout, row count,
+               default_money_code and the currency table of the writer
+    padding    to a multiple of 64 bytes
+    records    the raw records, as in MoneyArray.data
+
+so the records can be mapped without reading them, and the integer currency
+codes interpreted even if the reading process has registered currencies in
+a different order.
+"""
+import json
+import struct
+
+import numpy as np
+
+from . import dtypes
+
+MAGIC = b'MONEYPD\x00'
+VERSION = 1
+_ALIGNMENT = 64
+_prefix = struct.Struct('<8sHI')
+
+
+def write(values, path):
+    """ Method to write a MoneyArray, or FixedMoneyArray, to 'path' """
+    data = values.data
+    header = json.dumps({
+        'dtype': values.dtype.name,
+        'descr': data.dtype.descr,
+        'shape': [len(data)],
+        'default_money_code': values.default_money_code,
+        'currencies': dtypes.currency_codes[:data['cu'].max(initial=0) + 1],
+    }).encode('utf-8')
+
+    offset = _prefix.size + len(header)
+    padding = -offset % _ALIGNMENT
+    with open(path, 'wb') as f:
+        f.write(_prefix.pack(MAGIC, VERSION, len(header) + padding))
+        f.write(header + b' ' * padding)
+        f.write(np.ascontiguousarray(data).tobytes())
+
+
+def read_header(path):
+    """ Method to return the JSON header of a money file, and the offset of
+    its records """
+    with open(path, 'rb') as f:
+        prefix = f.read(_prefix.size)
+        if len(prefix) < _prefix.size:
+            raise ValueError("'{}' is not a money file".format(path))
+        magic, version, length = _prefix.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError("'{}' is not a money file".format(path))
+        if version > VERSION:
+            raise ValueError("'{}' has money file version {}, newer than the "
+                             "supported version {}".format(path, version, VERSION))
+        header = json.loads(f.read(length).decode('utf-8'))
+    return header, _prefix.size + length
+
+
+def open_mmap(cls, path, mode='r'):
+    """ Method to open a money file as an instance of 'cls' backed by
+    np.memmap over its records.
+
+    The records are only copied into memory if they cannot be used as they
+    are: if they were written with another byte order, or with currencies
+    registered in an order this process does not share.
+    """
+    header, offset = read_header(path)
+    if header['dtype'] != cls._dtype.name:
+        raise TypeError("'{}' holds '{}', not '{}'".format(path, header['dtype'], cls._dtype.name))
+
+    record_type = np.dtype([tuple(field) for field in header['descr']])
+    if header['shape'][0]:
+        data = np.memmap(path, dtype=record_type, mode=mode, offset=offset, shape=tuple(header['shape']))
+    else:
+        # An empty region cannot be mapped
+        data = np.zeros(0, dtype=record_type)
+
+    lookup = dtypes.currency_lookup(dict(enumerate(header['currencies'])))
+    if lookup is not None or record_type != cls._dtype._record_type:
+        data = data.astype(cls._dtype._record_type)
+        if lookup is not None:
+            data['cu'] = lookup[data['cu']]
+
+    return cls._from_ndarray(data, default_money_code=header['default_money_code'])
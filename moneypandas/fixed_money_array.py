@@ -0,0 +1,267 @@
+import decimal
+
+import numpy as np
+import pandas as pd
+import money
+
+from .dtypes import (currency_code_type, encode_currency, encode_currencies,
+                     decode_currency, decode_exponents)
+from .money_array import MoneyType, MoneyArray
+from .rates import convert, convert_pairwise, convert_decimals
+
+# -----------------------------------------------------------------------------
+# Extension Type
+# -----------------------------------------------------------------------------
+
+@pd.api.extensions.register_extension_dtype
+class FixedMoneyType(MoneyType):
+    name = 'fixedmoney'
+    _record_type = np.dtype([('va', np.int64), ('cu', currency_code_type)])
+
+    @classmethod
+    def construct_array_type(cls):
+        return FixedMoneyArray
+
+
+# -----------------------------------------------------------------------------
+# Extension Container
+# -----------------------------------------------------------------------------
+
+
+def _minor_unit_scale(cu):
+    """ Powers of ten taking each currency code's major units to minor units """
+    return np.power(10, decode_exponents(cu).astype(np.int64))
+
+
+def _rounded_units(units):
+    """ Round float amounts in minor units half-even to int64, raising
+    OverflowError for any that are not finite or do not fit """
+    units = np.rint(units)
+    if not (np.abs(units) < 2. ** 63).all():
+        raise OverflowError("Money amounts must be finite and fit in int64 minor units")
+    return units.astype(np.int64)
+
+
+def _to_fixed_records(data):
+    """ Convert float-layout MoneyType records to FixedMoneyType records,
+    rounding to the nearest minor unit. NaN amounts become NA.
+    """
+    na = np.isnan(data['va'])
+    result = np.empty(len(data), dtype=FixedMoneyType._record_type)
+    result['va'] = _rounded_units(np.where(na, 0, data['va']) * _minor_unit_scale(data['cu']))
+    result['cu'] = np.where(na, 0, data['cu'])
+    return result
+
+
+def _to_float_records(data):
+    """ Convert FixedMoneyType records back to the float MoneyType layout """
+    result = np.empty(len(data), dtype=MoneyType._record_type)
+    result['va'] = data['va'] / _minor_unit_scale(data['cu'])
+    result['cu'] = data['cu']
+    return result
+
+
+class FixedMoneyArray(MoneyArray):
+    """Holder for exact Money Amounts.
+
+    FixedMoneyArray stores each amount as an int64 count of the minor units
+    (pence, cents, ...) of its currency, using the ISO 4217 exponent, so that
+    sums, differences and comparisons between amounts in the same currency
+    are exact and vectorized. Rows in differing currencies are converted
+    through :class:`money.XMoney`, as for :class:`MoneyArray`.
+    """
+    _dtype = FixedMoneyType()
+
+    def __init__(self, values, default_money_code=None, dtype=None, copy=False, n_jobs=None):
+        from .parser import _to_money_array
+
+        if dtype and dtype != self.dtype:
+            raise TypeError("Can only construct FixedMoneyArray with underlying (i64, u2) not {}".format(dtype))
+
+        if isinstance(values, FixedMoneyArray):
+            default_money_code = default_money_code or values.default_money_code
+            values = values.data
+        elif not (isinstance(values, np.ndarray) and values.dtype == self.dtype._record_type):
+            values, default_money_code = _to_money_array(values, default_money_code=default_money_code, n_jobs=n_jobs)
+            values = _to_fixed_records(values)
+
+        if copy:
+            values = values.copy()
+        self.data = values
+        self.default_money_code = default_money_code
+
+    @classmethod
+    def from_minor_units(cls, units, currencies, default_money_code=None):
+        r"""Create a FixedMoneyArray from counts of minor units.
+
+        Parameters
+        ----------
+        units : sequence of int
+            Amounts in the minor unit of their currency, e.g. cents
+        currencies : str or sequence of str
+            ISO4712 currency code(s), one per amount or one for all
+
+        Returns
+        -------
+        FixedMoneyArray
+
+        Examples
+        --------
+        >>> FixedMoneyArray.from_minor_units([1050, 25], 'GBP')
+        <FixedMoneyArray>
+        [GBP 10.50, GBP 0.25]
+        Length: 2, dtype: fixedmoney
+        """
+        units = np.asarray(units, dtype=np.int64)
+        data = np.empty(len(units), dtype=FixedMoneyType._record_type)
+        data['va'] = units
+        if isinstance(currencies, str):
+            data['cu'] = encode_currency(currencies)
+        else:
+            data['cu'] = encode_currencies(currencies)
+
+        new = cls._from_ndarray(data)
+        new.default_money_code = default_money_code
+        return new
+
+    def to_minor_units(self):
+        """Return the amounts as an int64 ndarray of minor units.
+
+        See Also
+        --------
+        FixedMoneyArray.from_minor_units
+        """
+        return self.data['va'].copy()
+
+    @classmethod
+    def from_money_array(cls, values):
+        """Create a FixedMoneyArray from a float-backed MoneyArray in bulk,
+        rounding each amount to the nearest minor unit.
+        """
+        new = cls._from_ndarray(_to_fixed_records(values.data))
+        new.default_money_code = values.default_money_code
+        return new
+
+    def to_money_array(self):
+        """Convert to a float-backed MoneyArray in bulk."""
+        new = MoneyArray._from_ndarray(_to_float_records(self.data))
+        new.default_money_code = self.default_money_code
+        return new
+
+    @staticmethod
+    def _box_scalar(scalar):
+        if type(scalar) is not tuple:
+            scalar = (scalar['va'], scalar['cu'])
+        if not scalar[1]:
+            return np.nan
+        amount = decimal.Decimal(int(scalar[0])).scaleb(-int(decode_exponents(scalar[1])))
+        return money.XMoney(amount, decode_currency(scalar[1]))
+
+    @property
+    def _parser(self):
+        from .parser import to_money
+        return lambda val: type(self)(to_money(val, default_money_code=self.default_money_code))
+
+    def tolist(self):
+        """Convert the array to a list of (Decimal value, currency) tuples."""
+        return [
+            (x.amount, x.currency) if isinstance(x, money.XMoney) else (decimal.Decimal(0), '')
+            for x in self.to_pymoney()
+        ]
+
+    def to_decimals(self, money_code=None):
+        r"""Create a list of exact decimals from an ISO4712 code, attempting
+        conversion with XMoney where necessary.
+
+        See Also
+        --------
+        MoneyArray.to_decimals
+        """
+        if not money_code:
+            money_code = self.default_money_code
+            if not money_code:
+                codes = self.currency_codes()
+                if len(codes) != 1:
+                    raise TypeError("Cannot output mixed-currency monies as decimal "
+                        "without either a target or default currency")
+                money_code = codes[0]
+
+        result = np.array([
+            decimal.Decimal(int(va)).scaleb(-int(exponent))
+            for va, exponent in zip(self.data['va'], decode_exponents(self.data['cu']))
+        ], dtype=object)
+
+        different = (self.data['cu'] != encode_currency(money_code)) & ~self.isna()
+        result[different] = convert_decimals(result[different], self.data['cu'][different], money_code)
+
+        return result
+
+    def _amounts(self):
+        return self.data['va'] / _minor_unit_scale(self.data['cu'])
+
+    # Minima and maxima are also taken exactly, per currency
+    _reductions = dict(MoneyArray._reductions, min=np.minimum, max=np.maximum)
+
+    def _convert_partials(self, partials, currencies, money_code):
+        """ Per-currency partials are converted exactly, as Decimals """
+        amounts = np.array([
+            decimal.Decimal(int(partial)).scaleb(-int(exponent))
+            for partial, exponent in zip(partials, decode_exponents(currencies))
+        ], dtype=object)
+        return convert_decimals(amounts, currencies, money_code)
+
+    def to_currency(self, money_code, shallow=True, in_place=False, lazy=False):
+        """As MoneyArray.to_currency, rounding converted amounts to the
+        minor unit; conversions are always eager, so 'lazy' is ignored"""
+        if shallow:
+            return super(FixedMoneyArray, self).to_currency(money_code, shallow=True, in_place=in_place)
+
+        cu = encode_currency(money_code)
+        different = (self.data['cu'] != cu) & ~self.isna()
+
+        result = self.data
+        if not in_place:
+            result = result.copy()
+
+        amounts = convert(self._amounts()[different], self.data['cu'][different], money_code)
+        result['va'][different] = _rounded_units(amounts * _minor_unit_scale(cu))
+        result['cu'][different] = cu
+
+        if in_place:
+            self.data = result
+        copy = self._from_ndarray(result)
+        copy.default_money_code = money_code
+        return copy
+
+    # ------------------------------------------------------------------------
+    # Ops
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _unrounded(other):
+        """ Whether 'other' is a Money scalar or float-backed MoneyArray,
+        which comparisons must not round to minor units """
+        return isinstance(other, money.Money) or (
+            isinstance(other, MoneyArray) and not isinstance(other, FixedMoneyArray))
+
+    def __eq__(self, other):
+        if self._unrounded(other):
+            return self.to_money_array() == other
+        return super(FixedMoneyArray, self).__eq__(other)
+
+    def _compare(self, other, op):
+        # Compared in the float layout, which holds our amounts exactly
+        if self._unrounded(other):
+            return self.to_money_array()._compare(other, op)
+        return super(FixedMoneyArray, self)._compare(other, op)
+
+    def _convert_records(self, records, targets):
+        amounts = records['va'] / _minor_unit_scale(records['cu'])
+        converted = convert_pairwise(amounts, records['cu'], targets)
+        return _rounded_units(converted * _minor_unit_scale(targets))
+
+    def _scaled_values(self, values):
+        if values.dtype.kind == 'f':
+            # Round half-even to the minor unit
+            values = _rounded_units(values)
+        return values
@@ -0,0 +1,201 @@
+""" Grouped reductions over money columns, in one pass over (group, currency) codes """
+import numpy as np
+import pandas as pd
+
+from .dtypes import encode_currency
+from .rates import pairwise_rates
+
+
+def _align(by, index):
+    """ Method to align Series keys on the index of the grouped Series, as
+    pandas groupby does; other keys are taken positionally.
+    """
+    if isinstance(by, pd.Series):
+        return by if by.index.equals(index) else by.reindex(index)
+    if isinstance(by, list) and len(by) and all(pd.api.types.is_list_like(key) for key in by):
+        return [_align(key, index) for key in by]
+    return by
+
+
+def _factorize(by, sort=True):
+    """ Method to return integer group codes for one or more keys, with -1
+    for missing keys, and an Index of the groups.
+    """
+    if isinstance(by, list) and len(by) and all(pd.api.types.is_list_like(key) for key in by):
+        index = pd.MultiIndex.from_arrays(by)
+        codes, uniques = index.factorize(sort=sort)
+        return codes, pd.MultiIndex.from_tuples(uniques, names=index.names)
+
+    codes, uniques = pd.factorize(by, sort=sort)
+    return codes, pd.Index(uniques, name=getattr(by, 'name', None))
+
+
+class MoneyGroupBy:
+    """Grouped reductions of a money Series.
+
+    Rows are binned by (group, currency) with one bincount over combined
+    integer codes, so each group's partials in each of its currencies come
+    from a single pass. Groups in one currency stay in it; mixed groups are
+    reduced, as by MoneyArray._reduce, in the default currency, if any, or
+    their first. The partials are then converted with one gather over a
+    rate snapshot, rather than once per group. FixedMoneyArray sums are
+    taken in integer minor units, so groups in one currency are exact.
+
+    Keys that are Series are aligned on 'index', the index of the values,
+    if given; other keys are positional.
+
+    Examples
+    --------
+    >>> df['price'].money.groupby(df['account']).sum()
+    """
+
+    def __init__(self, values, by, sort=True, name=None, index=None):
+        self._values = values
+        self._name = name
+        if index is not None:
+            by = _align(by, index)
+        self._groups, self.index = _factorize(by, sort=sort)
+        if len(self._groups) != len(values):
+            raise ValueError("Grouper and values must have the same length")
+        self.ngroups = len(self.index)
+
+        cu = values.data['cu']
+        valid = (cu != 0) & (self._groups >= 0)
+        self._all_valid = valid.all()
+        if not self._all_valid:
+            self._rows = np.flatnonzero(valid)
+            cu = cu[self._rows]
+
+        # Combined (group, currency) codes over the currencies present
+        self._currencies = np.flatnonzero(np.bincount(cu, minlength=1))
+        lookup = np.zeros(self._currencies[-1] + 1 if len(self._currencies) else 1, dtype=np.intp)
+        lookup[self._currencies] = np.arange(len(self._currencies))
+        self._cu = cu
+        self._keys = self._valid(self._groups) * len(self._currencies) + lookup[cu]
+
+        shape = (self.ngroups, len(self._currencies))
+        self._counts = np.bincount(self._keys, minlength=shape[0] * shape[1]).reshape(shape)
+        self._targets = self._target_currencies()
+
+    def _valid(self, values):
+        return values if self._all_valid else values[self._rows]
+
+    def _target_currencies(self):
+        """ The currency code each group is reduced in, or 0 if it is empty """
+        present = self._counts > 0
+        if not present.shape[1]:
+            return np.zeros(self.ngroups, dtype=np.intp)
+        targets = self._currencies[np.argmax(present, axis=1)]
+
+        default = self._values.default_money_code
+        if default:
+            mixed = present.sum(axis=1) > 1
+            targets[mixed] = encode_currency(default)
+        targets[~present.any(axis=1)] = 0
+        return targets
+
+    def _amounts(self):
+        return self._valid(self._values._amounts())
+
+    def _wrap(self, amounts, mask):
+        """ Build a Series of money in each group's currency, with NA where
+        'mask' is set """
+        from .money_array import MoneyType, MoneyArray
+
+        records = np.zeros(self.ngroups, dtype=MoneyType._record_type)
+        records['va'] = np.where(mask, 0, amounts)
+        records['cu'] = np.where(mask, 0, self._targets)
+
+        result = MoneyArray._from_ndarray(records, default_money_code=self._values.default_money_code)
+        if type(self._values) is not MoneyArray:
+            result = type(self._values)(result)
+        return pd.Series(result, index=self.index, name=self._name)
+
+    def count(self):
+        """Number of non-NA values in each group"""
+        counts = self._counts.sum(axis=1)
+        return pd.Series(counts, index=self.index, name=self._name)
+
+    def _totals(self):
+        shape = self._counts.shape
+        partials = np.bincount(self._keys, weights=self._amounts(), minlength=shape[0] * shape[1])
+
+        # Convert each (group, currency) partial into the group's currency
+        present = np.flatnonzero(self._counts.ravel())
+        groups, currencies = np.divmod(present, shape[1])
+        rates = pairwise_rates(self._currencies[currencies], self._targets[groups])
+        return np.bincount(groups, weights=partials[present] * rates, minlength=shape[0])
+
+    def _minor_unit_totals(self):
+        """ Exact totals of integer minor units in each group's currency;
+        only the partials of mixed groups are converted, and rounded once """
+        from .fixed_money_array import _minor_unit_scale
+
+        shape = self._counts.shape
+        counts = self._counts.ravel()
+        present = np.flatnonzero(counts)
+        totals = np.zeros(shape[0], dtype=np.int64)
+        if not len(present):
+            return totals
+
+        # Rows of each (group, currency) are contiguous in a stable sort
+        order = np.argsort(self._keys, kind='stable')
+        starts = np.concatenate([[0], np.cumsum(counts[present][:-1])])
+        partials = np.add.reduceat(self._valid(self._values.data['va'])[order], starts)
+
+        groups, currencies = np.divmod(present, shape[1])
+        cu, targets = self._currencies[currencies], self._targets[groups]
+        same = cu == targets
+        np.add.at(totals, groups[same], partials[same])
+
+        other = ~same
+        if other.any():
+            rates = pairwise_rates(cu[other], targets[other])
+            converted = partials[other] / _minor_unit_scale(cu[other]) * rates
+            converted = np.bincount(groups[other], weights=converted, minlength=shape[0])
+            totals += np.rint(converted * _minor_unit_scale(self._targets)).astype(np.int64)
+        return totals
+
+    def sum(self, min_count=0):
+        """Totals of each group; NA where a group has fewer than
+        'min_count' values, or none"""
+        counts = self._counts.sum(axis=1)
+        mask = (counts == 0) | (counts < min_count)
+        if self._values.data['va'].dtype.kind != 'i':
+            return self._wrap(self._totals(), mask)
+
+        records = np.zeros(self.ngroups, dtype=self._values.dtype._record_type)
+        records['va'] = np.where(mask, 0, self._minor_unit_totals())
+        records['cu'] = np.where(mask, 0, self._targets)
+        result = type(self._values)._from_ndarray(
+            records, default_money_code=self._values.default_money_code)
+        return pd.Series(result, index=self.index, name=self._name)
+
+    def mean(self):
+        """Means of the non-NA values of each group"""
+        counts = self._counts.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = self._totals() / counts
+        return self._wrap(means, counts == 0)
+
+    def _extremum(self, name):
+        rates = pairwise_rates(self._cu, self._targets[self._valid(self._groups)])
+        amounts = pd.Series(self._amounts() * rates)
+        result = getattr(amounts.groupby(self._valid(self._groups)), name)()
+        result = result.reindex(np.arange(self.ngroups)).to_numpy()
+        return self._wrap(result, np.isnan(result))
+
+    def min(self):
+        """Minimum of each group"""
+        return self._extremum('min')
+
+    def max(self):
+        """Maximum of each group"""
+        return self._extremum('max')
+
+    def agg(self, name):
+        """Apply a reduction by name"""
+        if name not in ('count', 'sum', 'mean', 'min', 'max'):
+            raise TypeError("'{}' does not implement grouped reduction '{}'".format(
+                type(self).__name__, name))
+        return getattr(self, name)()
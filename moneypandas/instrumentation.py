@@ -0,0 +1,124 @@
+""" Opt-in counters and timings for finding slow paths in real pipelines
+
+>>> with moneypandas.stats() as collected:
+...     df['price'].money.to_currency('GBP', shallow=False)
+>>> print(collected.summary())
+
+Operations record how many rows (or distinct values, where the work is
+done once per distinct value) took a vectorized path, a cached one, or a
+'scalar' path constructing money.XMoney or parsing value by value; phases
+(parse, rate lookup, conversion, boxing) record their wall time. When no
+collector is active, each instrumentation point costs one truth test.
+"""
+import collections
+import contextlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger('moneypandas')
+
+_collectors = []
+_lock = threading.Lock()
+
+
+class Stats:
+    """Rows per (operation, path) and time per phase, collected by stats()"""
+
+    def __init__(self):
+        self.rows = collections.Counter()
+        self.seconds = collections.Counter()
+        self.calls = collections.Counter()
+
+    def record(self, operation, path, rows):
+        self.rows[(operation, path)] += int(rows)
+
+    def add_time(self, phase, seconds):
+        self.seconds[phase] += seconds
+        self.calls[phase] += 1
+
+    def scalar_fraction(self, operation):
+        """ Fraction of an operation's rows that took the scalar path """
+        total = sum(rows for (name, _), rows in self.rows.items() if name == operation)
+        return self.rows[(operation, 'scalar')] / total if total else 0.
+
+    def as_dict(self):
+        return {
+            'rows': {'{}.{}'.format(*key): rows for key, rows in sorted(self.rows.items())},
+            'seconds': dict(sorted(self.seconds.items())),
+            'calls': dict(sorted(self.calls.items())),
+        }
+
+    def summary(self):
+        lines = ['{:<24} {:>10} {:>12}'.format('operation', 'path', 'rows')]
+        for (operation, path), rows in sorted(self.rows.items()):
+            lines.append('{:<24} {:>10} {:>12}'.format(operation, path, rows))
+        lines.append('{:<24} {:>10} {:>12}'.format('phase', 'calls', 'seconds'))
+        for phase, seconds in sorted(self.seconds.items()):
+            lines.append('{:<24} {:>10} {:>12.6f}'.format(phase, self.calls[phase], seconds))
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return '<Stats {}>'.format(self.as_dict())
+
+
+@contextlib.contextmanager
+def stats(callback=None, level=logging.INFO):
+    """Collect moneypandas counters and timings for the duration of a with
+    block, in this process.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Called with the Stats on leaving the block; otherwise the summary
+        is logged to the 'moneypandas' logger at 'level'
+
+    Yields
+    ------
+    Stats
+    """
+    collected = Stats()
+    with _lock:
+        _collectors.append(collected)
+    try:
+        yield collected
+    finally:
+        with _lock:
+            _collectors.remove(collected)
+        if callback is not None:
+            callback(collected)
+        else:
+            logger.log(level, 'moneypandas stats\n%s', collected.summary())
+
+
+def record(operation, path, rows):
+    """ Count rows of an operation taking 'path' ('vectorized', 'cached' or
+    'scalar'), if anything is collecting """
+    if _collectors and rows:
+        with _lock:
+            for collected in _collectors:
+                collected.record(operation, path, rows)
+
+
+class _Timer:
+    __slots__ = ('phase', 'start')
+
+    def __init__(self, phase):
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        with _lock:
+            for collected in _collectors:
+                collected.add_time(self.phase, seconds)
+
+
+_null_timer = contextlib.nullcontext()
+
+
+def timed(phase):
+    """ Context manager timing a phase, if anything is collecting """
+    return _Timer(phase) if _collectors else _null_timer
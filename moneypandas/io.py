@@ -0,0 +1,85 @@
+""" Methods to read money columns from files in bounded memory """
+import collections
+import time
+
+import pandas as pd
+
+# Rows read at a time when read_csv is asked for a whole frame
+DEFAULT_CHUNKSIZE = 2 ** 20
+
+ChunkInfo = collections.namedtuple('ChunkInfo', ['chunk', 'rows', 'seconds', 'rows_per_second'])
+
+
+def read_csv(filepath_or_buffer, money_columns, chunksize=None, default_money_code=None,
+             errors='raise', progress=None, **kwargs):
+    r"""Read a CSV file, parsing money columns chunk by chunk.
+
+    Each chunk of rows is read by pandas.read_csv, with the money columns
+    left as strings, and those columns are parsed at once into MoneyArrays
+    by to_money, so only one chunk of the strings is held at a time.
+
+    Parameters
+    ----------
+    filepath_or_buffer : str, path or file-like
+    money_columns : list of str
+        Columns to parse as money
+    chunksize : int, optional
+        If given, return an iterator of DataFrames of this many rows;
+        otherwise read DEFAULT_CHUNKSIZE rows at a time and return one
+        DataFrame
+    default_money_code : str, optional
+        ISO4712 code for amounts with no currency of their own
+    errors : {'raise', 'coerce'}, default 'raise'
+        As for to_money
+    progress : callable, optional
+        Called with a ChunkInfo after parsing each chunk, giving the number
+        of rows and the time spent parsing its money columns
+    \**kwargs
+        Passed to pandas.read_csv
+
+    Returns
+    -------
+    DataFrame, or iterator of DataFrames
+
+    Examples
+    --------
+    >>> for frame in read_csv('ledger.csv', ['amount'], chunksize=10 ** 6,
+    ...                       progress=print):
+    ...     totals.append(frame['amount'].money.groupby(frame['account']).sum())
+    ChunkInfo(chunk=0, rows=1000000, seconds=0.21, rows_per_second=4761904.8)
+    """
+    money_columns = list(money_columns)
+    if not money_columns:
+        raise ValueError("read_csv needs at least one money column")
+
+    dtype = dict(kwargs.pop('dtype', None) or {})
+    dtype.update({column: object for column in money_columns})
+
+    chunks = _read_chunks(
+        filepath_or_buffer, money_columns, chunksize or DEFAULT_CHUNKSIZE,
+        default_money_code, errors, progress, dtype=dtype, **kwargs)
+    if chunksize:
+        return chunks
+
+    frames = list(chunks)
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames)
+
+
+def _read_chunks(filepath_or_buffer, money_columns, chunksize, default_money_code,
+                 errors, progress, **kwargs):
+    from .parser import to_money
+
+    with pd.read_csv(filepath_or_buffer, chunksize=chunksize, **kwargs) as reader:
+        for number, frame in enumerate(reader):
+            start = time.perf_counter()
+            for column in money_columns:
+                # As a Series, so that parse errors name the row label
+                frame[column] = to_money(frame[column], default_money_code, errors)
+            seconds = time.perf_counter() - start
+
+            if progress is not None:
+                progress(ChunkInfo(number, len(frame), seconds,
+                                   len(frame) / seconds if seconds else float('inf')))
+            yield frame
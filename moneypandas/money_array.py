@@ -1,18 +1,25 @@
 import abc
 import decimal
+import pickle
+import operator
 import collections
 
 import numpy as np
-from pandas.compat.numpy import function as nv
 import pandas as pd
-from pandas.core import nanops
 import money
 from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import infer_dtype, is_number
+from pandas.core.sorting import nargsort
 
+from . import instrumentation
 from ._accessor import (DelegatedMethod, DelegatedProperty,
                         delegated_method)
 from .base import NumPyBackedExtensionArrayMixin
 from .parser import _as_money_object
+from .dtypes import (currency_code_type, encode_currency, decode_currency,
+                     decode_currencies, currency_codes, currency_lookup)
+from .rates import convert, convert_pairwise, convert_decimals, rate_cache
+from .reductions import currency_counts, currency_partials
 import re
 
 # -----------------------------------------------------------------------------
@@ -26,8 +33,9 @@ class MoneyType(ExtensionDtype):
     type = money.XMoney
     kind = 'O'
     default_money_code = None
-    _record_type = np.dtype([('va', np.float64), ('cu', 'U3')])
-    _record_na_value = (0, '')
+    _record_type = np.dtype([('va', np.float64), ('cu', currency_code_type)])
+    _record_na_value = (0, 0)
+    _metadata = ('name',)
 
     def __init__(self, *args, default_money_code=None, **kwargs):
         self.default_money_code = default_money_code
@@ -52,6 +60,12 @@ class MoneyType(ExtensionDtype):
     def construct_array_type(cls):
         return MoneyArray
 
+    def __from_arrow__(self, array):
+        """Build an array of this dtype from an Arrow MoneyArrowType
+        Array or ChunkedArray (requires pyarrow)."""
+        from .arrow import from_arrow
+        return from_arrow(array, self)
+
 
 # -----------------------------------------------------------------------------
 # Extension Container
@@ -69,19 +83,22 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
     """
     __array_priority__ = 1000
     _dtype = MoneyType()
-    _itemsize = 20
+    _itemsize = 10
     ndim = 1
     can_hold_na = True
     default_money_code = None
 
-    def __init__(self, values, default_money_code=None, dtype=None, copy=False):
+    def __init__(self, values, default_money_code=None, dtype=None, copy=False, n_jobs=None):
         from .parser import _to_money_array
 
         # TODO: copy
         if dtype and dtype != self.dtype:
-            raise TypeError("Can only construct MoneyArray with underlying (f64, U3) not {}".format(dtype))
+            raise TypeError("Can only construct MoneyArray with underlying (f64, u2) not {}".format(dtype))
 
-        values, self.default_money_code = _to_money_array(values, default_money_code=default_money_code)  # TODO: avoid potential copy
+        if isinstance(values, np.ndarray) and values.dtype == self.dtype._record_type:
+            self.default_money_code = default_money_code
+        else:
+            values, self.default_money_code = _to_money_array(values, default_money_code=default_money_code, n_jobs=n_jobs)  # TODO: avoid potential copy
         # TODO: dtype?
         if copy:
             values = values.copy()
@@ -113,85 +130,184 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         if not money_code:
             money_code = self.default_money_code
             if not money_code:
-                codes = {c['cu'] for c in self.data if c['cu']}
+                codes = self.currency_codes()
                 if len(codes) != 1:
                     raise TypeError("Cannot output mixed-currency monies as decimal "
                         "without either a target or default currency")
                 money_code = codes[0]
 
-        mask = self.isna()
-        same = (self.data['cu'] == money_code) | mask
-        decimalize = np.vectorize(decimal.Decimal)
+        different = (self.data['cu'] != encode_currency(money_code)) & ~self.isna()
+        decimalize = np.vectorize(decimal.Decimal, otypes=[object])
         result = decimalize(self.data['va'])
-        for i, ceq in enumerate(same):
-            if not ceq:
-                result[i] = money.XMoney(*self.data[i]).to(money_code).amount
+        result[different] = convert_decimals(result[different], self.data['cu'][different], money_code)
 
         return result
 
-    # Operations thanks to pandas.core.arrays.base.numpy_
-    def _min(self, ndarray, axis=None, out=None, keepdims=False, skipna=True):
-        nv.validate_min((), dict(out=out, keepdims=keepdims))
-        return nanops.nanmin(ndarray, axis=axis, skipna=skipna)
-
-    def _max(self, ndarray, axis=None, out=None, keepdims=False, skipna=True):
-        nv.validate_max((), dict(out=out, keepdims=keepdims))
-        return nanops.nanmax(ndarray, axis=axis, skipna=skipna)
-
-    def _sum(
-        self,
-        ndarray,
-        axis=None,
-        dtype=None,
-        out=None,
-        keepdims=False,
-        initial=None,
-        skipna=True,
-        min_count=0,
-    ):
-        nv.validate_sum(
-            (), dict(dtype=dtype, out=out, keepdims=keepdims, initial=initial)
-        )
-        return nanops.nansum(
-            ndarray, axis=axis, skipna=skipna, min_count=min_count
-        )
+    def _amounts(self):
+        """ Amounts in major units as float64, for conversion """
+        return self.data['va']
 
-    def _reduce(self, name, skipna=True, **kwargs):
-        """ _reduce is called when min, sum or max is called via the pandas series (column). 
-        It's stored as an array of floats & the _reduce operation is performed on that.
+    def _convert_partials(self, partials, currencies, money_code):
+        """ Method to convert per-currency partials, in our storage layout,
+        to amounts in 'money_code'.
         """
-        currencies = [cu for cu in np.unique(self.data['cu']) if cu]
-        totals = {}
+        return convert(partials, currencies, money_code)
+
+    _reductions = {
+        'sum': np.add,
+        'mean': np.add,
+        'min': None,
+        'max': None,
+        'median': None,
+        'quantile': None,
+        'std': None,
+        'var': None,
+        'count': None,
+        'nunique': None,
+        'any': None,
+        'all': None,
+    }
+
+    def _reduce(self, name, skipna=True, money_code=None, **kwargs):
+        """ _reduce is called when sum, mean, min, max, std, etc. are called via the pandas series (column).
+        Rows are grouped by currency in one pass; the per-currency partial
+        sums, or for the other statistics the amounts themselves, are then
+        converted to one currency with a single rate snapshot. Mixed currencies are reduced in 'money_code', if given,
+        else the default currency, if any, or the first present. Variances are floats, in squared units.
+        """
+        if name not in self._reductions:
+            msg = "'{}' does not implement reduction '{}'"
+            raise TypeError(msg.format(type(self).__name__, name))
 
-        if name == 'mean':
-            meth = getattr(self, '_sum', None)
-        else:
-            meth = getattr(self, '_' + name, None)
+        cu = self.data['cu']
+        currencies, counts = currency_counts(cu)
+        total_count = int(counts.sum())
 
-        if meth:
-            if len(currencies) > 1:
-                money_code = self.default_money_code if self.default_money_code else currencies[0]
-                for i, currency in enumerate(currencies):
-                    totals[currency] = money.XMoney(
-                        meth(self.data['va'][self.data['cu'] == currency], skipna=skipna, **kwargs),
-                        currency
-                    )
-                total = meth(
-                    np.array([subtotal.to(money_code).amount for subtotal in totals.values()]),
-                    skipna=skipna,
-                    **kwargs
-                )
-                if name == 'mean':
-                    total = total / len(self.data)
-                total = money.XMoney(amount=total, currency=money_code)
-            else:
-                money_code = currencies[0] if currencies else self.default_money_code
-                total = money.XMoney(meth(self.data['va'], skipna=skipna, **kwargs), money_code)
+        if name == 'count':
+            return total_count
+        if name == 'nunique':
+            return len(np.unique(self.data[~self.isna()]))
+        if not skipna and total_count < len(self):
+            return self.dtype.na_value
+        if name in ('any', 'all'):
+            return bool(getattr(self.data['va'][~self.isna()] != 0, name)())
 
-            return total
+        if not money_code:
+            if len(currencies) == 1:
+                money_code = decode_currency(currencies[0])
+            else:
+                money_code = self.default_money_code or \
+                    (decode_currency(currencies[0]) if len(currencies) else None)
+
+        if not total_count or total_count < kwargs.get('min_count', 0):
+            if name == 'sum' and money_code and total_count >= kwargs.get('min_count', 0):
+                return money.XMoney(0, money_code)
+            return self.dtype.na_value
+
+        ufunc = self._reductions[name]
+        if ufunc is not None:
+            partials = currency_partials(self.data['va'], cu, ufunc, currencies, counts)
+            total = ufunc.reduce(self._convert_partials(partials, currencies, money_code))
+            if name == 'mean':
+                total = total / total_count
+            return money.XMoney(total, money_code)
+
+        amounts = self._amounts()
+        if (currencies != encode_currency(money_code)).any():
+            amounts = convert(amounts, cu, money_code)
+        if total_count < len(self):
+            amounts = amounts[~self.isna()]
+
+        if name in ('std', 'var'):
+            ddof = kwargs.get('ddof', 1)
+            if total_count <= ddof:
+                return self.dtype.na_value
+            total = getattr(np, name)(amounts, ddof=ddof)
+            if name == 'var':
+                return total
+        elif name == 'quantile':
+            total = np.quantile(amounts, kwargs.get('q', 0.5))
         else:
-            msg = "'{}' does not implement reduction '{}'"
+            total = getattr(np, name)(amounts)
+
+        return money.XMoney(total, money_code)
+
+    _accumulations = {
+        'cumsum': np.add,
+        'cummin': np.minimum,
+        'cummax': np.maximum,
+    }
+
+    def _accumulate(self, name, skipna=True, money_code=None, **kwargs):
+        """ Running sums, minima or maxima. Each currency accumulates
+        separately, in NumPy over the rows of that currency, unless a
+        'money_code' is given, or the array is mixed and has a default
+        currency: then every row is converted to it in one batch, and the
+        result is a single running total in that currency.
+
+        NA rows stay NA; with skipna=False, so does every row after the
+        first NA.
+        """
+        if name not in self._accumulations:
+            msg = "'{}' does not implement accumulation '{}'"
             raise TypeError(msg.format(type(self).__name__, name))
+        ufunc = self._accumulations[name]
+
+        mask = self.isna()
+        cu = self.data['cu']
+        currencies, counts = currency_counts(cu)
+        if not money_code and len(currencies) > 1:
+            money_code = self.default_money_code
+
+        result = np.zeros(len(self), dtype=self.dtype._record_type)
+        if money_code:
+            target = np.full(len(self), encode_currency(money_code), dtype=currency_code_type)
+            values = self._convert_records(self.data, target)
+            rows = np.flatnonzero(~mask)
+            result['va'][rows] = ufunc.accumulate(values[rows])
+            result['cu'][rows] = target[rows]
+        else:
+            # Rows of each currency are contiguous in a stable (radix) sort
+            order = np.argsort(cu, kind='stable')
+            start = len(self) - counts.sum()
+            for count in counts:
+                rows = order[start:start + count]
+                result['va'][rows] = ufunc.accumulate(self.data['va'][rows])
+                start += count
+            result['cu'] = cu
+
+        if not skipna and mask.any():
+            result[np.argmax(mask):] = self.dtype._record_na_value
+        return self._shallow_copy(result)
+
+    def cumsum(self, axis=0, dtype=None, out=None, skipna=True, money_code=None):
+        """Running totals; see _accumulate"""
+        return self._accumulate('cumsum', skipna=skipna, money_code=money_code)
+
+    def cummin(self, axis=0, dtype=None, out=None, skipna=True, money_code=None):
+        """Running minima; see _accumulate"""
+        return self._accumulate('cummin', skipna=skipna, money_code=money_code)
+
+    def cummax(self, axis=0, dtype=None, out=None, skipna=True, money_code=None):
+        """Running maxima; see _accumulate"""
+        return self._accumulate('cummax', skipna=skipna, money_code=money_code)
+
+    def _quantile(self, qs, interpolation):
+        """ Quantiles for pandas, in a single currency as for _reduce """
+        mask = self.isna()
+        cu = self.data['cu']
+        currencies, counts = currency_counts(cu)
+
+        result = np.zeros(len(qs), dtype=MoneyType._record_type)
+        if len(currencies):
+            money_code = decode_currency(currencies[0])
+            if len(currencies) > 1:
+                money_code = self.default_money_code or money_code
+            amounts = convert(self._amounts(), cu, money_code)[~mask]
+            result['va'] = np.quantile(amounts, qs, method=interpolation)
+            result['cu'] = encode_currency(money_code)
+
+        return type(self)(MoneyArray._from_ndarray(result), default_money_code=self.default_money_code)
 
     @classmethod
     def from_bytes(cls, bytestring):
@@ -200,7 +316,8 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         Parameters
         ----------
         bytestring : bytes
-            Note that bytestring is a Python 3-style string of bytes
+            Note that bytestring is a Python 3-style string of bytes. Its
+            currency codes are read as this process's; see to_bytes
 
         Returns
         -------
@@ -219,11 +336,41 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         --------
         to_bytes
         """
-        data = np.frombuffer(bytestring, dtype=MoneyType._record_type)
+        data = np.frombuffer(bytestring, dtype=cls._dtype._record_type)
         return cls._from_ndarray(data)
 
     @classmethod
-    def _from_ndarray(cls, data, copy=False):
+    def open_mmap(cls, path, mode='r'):
+        r"""Open a file written by :meth:`MoneyArray.to_file` without
+        reading it, as an array backed by a np.memmap over its records.
+
+        Parameters
+        ----------
+        path : str
+        mode : {'r', 'r+', 'c'}
+            As for np.memmap: read-only, read-write or copy-on-write
+
+        Returns
+        -------
+        MoneyArray
+
+        Examples
+        --------
+        >>> MoneyArray(['10 GBP', '20 EUR']).to_file('ledger.money')
+        >>> MoneyArray.open_mmap('ledger.money')[1:]
+        <MoneyArray>
+        [EUR 20.00]
+        Length: 1, dtype: money
+
+        See Also
+        --------
+        to_file
+        """
+        from .fileformat import open_mmap
+        return open_mmap(cls, path, mode=mode)
+
+    @classmethod
+    def _from_ndarray(cls, data, copy=False, default_money_code=None):
         """Zero-copy construction of an MoneyArray from an ndarray.
 
         Parameters
@@ -232,6 +379,8 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
             This should have MoneyType._record_type dtype
         copy : bool, default False
             Whether to copy the data.
+        default_money_code : str, optional
+            ISO4712 code to carry over as the default currency.
 
         Returns
         -------
@@ -239,10 +388,28 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         """
         if copy:
             data = data.copy()
-        new = MoneyArray([])
+        new = cls.__new__(cls)
         new.data = data
+        new.default_money_code = default_money_code
         return new
 
+    def _shallow_copy(self, data):
+        return self._from_ndarray(data, default_money_code=self.default_money_code)
+
+    def __reduce_ex__(self, protocol):
+        """Pickle as the raw records and the currency table they are coded
+        against, rather than as boxed values; under protocol 5 the records
+        go as a PickleBuffer, so they can be transferred out-of-band.
+        """
+        data = np.ascontiguousarray(self.data)
+        present, _ = currency_counts(data['cu'])
+        currencies = {int(index): currency_codes[index] for index in present}
+        if protocol >= 5:
+            buffer = pickle.PickleBuffer(data)
+        else:
+            buffer = data.tobytes()
+        return _unpickle, (type(self), buffer, currencies, self.default_money_code)
+
     # -------------------------------------------------------------------------
     # Properties
     # -------------------------------------------------------------------------
@@ -255,6 +422,8 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
 
         if fill_value is self.dtype.na_value:
             fill_value = self.dtype._record_na_value
+        elif allow_fill:
+            fill_value = self._parser(fill_value).data[0]
 
         # fill value should always be translated from the scalar
         # type for the array, to the physical storage type for
@@ -271,7 +440,7 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
                     # all NA take from and empty array
                     result = np.zeros(len(indices), dtype=self.dtype._record_type)
                     result.fill(fill_value)
-                    return self._from_ndarray(result)
+                    return self._shallow_copy(result)
             if (np.asarray(indices) < -1).any():
                 msg = ("Invalid value in 'indices'. Must be all >= -1 "
                        "for 'allow_fill=True'")
@@ -282,7 +451,7 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         if allow_fill:
             result[mask] = fill_value
 
-        return self._from_sequence(result, dtype=self.dtype, default_money_code=self.default_money_code)
+        return self._shallow_copy(result)
 
 
     @classmethod
@@ -294,7 +463,17 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         return cls(strings, dtype=dtype, copy=copy, default_money_code=default_money_code)
 
     def isna(self):
-        return self.data['cu'] == ''
+        return self.data['cu'] == 0
+
+    def currency_codes(self):
+        """Return the sorted currency codes present in the array, excluding NA.
+
+        Examples
+        --------
+        >>> MoneyArray(['120 EUR', '127 USD', None]).currency_codes()
+        ['EUR', 'USD']
+        """
+        return sorted(decode_currency(cu) for cu in np.unique(self.data['cu']) if cu)
 
     # -------------------------------------------------------------------------
     # Interfaces
@@ -312,11 +491,11 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
 
     @staticmethod
     def _box_scalar(scalar):
-        if scalar == (0, ''):
+        if type(scalar) is not tuple:
+            scalar = (scalar['va'], scalar['cu'])
+        if not scalar[1]:
             return np.nan
-        elif type(scalar) is tuple:
-            return money.XMoney(scalar[0], scalar[1])
-        return money.XMoney(scalar['va'], scalar['cu'])
+        return money.XMoney(scalar[0], decode_currency(scalar[1]))
 
     @property
     def _parser(self):
@@ -324,9 +503,14 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         return lambda val: to_money(val, default_money_code=self.default_money_code)
 
     def __setitem__(self, key, value):
-        from .parser import to_money
-
-        value = to_money(value, default_money_code=self.default_money_code).data
+        if isinstance(key, np.ndarray) and key.dtype == bool and not key.any():
+            # Nothing to set, so nothing to parse
+            return
+        if is_number(value) and value == 0 and self.isna()[key].all():
+            # pandas' own accumulations fill NA rows with a bare 0 first;
+            # NA records already hold a zero amount
+            return
+        value = self._parser(value).data
         self.data[key] = value
 
     def __iter__(self):
@@ -352,13 +536,47 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         >>> MoneyArray(['120 EUR', '127 USD']).to_pymoney()
         [XMoney('120', 'EUR'), XMoney('127', 'USD')]
         """
-        return [money.XMoney(x['va'], x['cu']) if x['cu'] else np.nan for x in self.data]
+        return self._box_array().tolist()
+
+    def _box_array(self):
+        """ Box each distinct record once, sharing the Money objects between
+        repeated rows, as an object ndarray.
+        """
+        with instrumentation.timed('boxing'):
+            codes, uniques = self.factorize()
+            boxed = np.empty(len(uniques) + 1, dtype=object)
+            boxed[:-1] = [self._box_scalar(x) for x in uniques.data.tolist()]
+            boxed[-1] = np.nan
+        instrumentation.record('box', 'scalar', len(uniques))
+        instrumentation.record('box', 'cached', len(codes) - len(uniques))
+        return boxed.take(codes)
+
+    def __array__(self, dtype=None):
+        return np.asarray(self._box_array(), dtype=dtype)
+
+    def __arrow_array__(self, type=None):
+        """Convert to an Arrow MoneyArrowType array (requires pyarrow)"""
+        from .arrow import to_arrow
+        return to_arrow(self)
+
+    def tolist(self):
+        """Convert the array to a list of (value, currency) tuples.
+
+        Examples
+        ---------
+        >>> MoneyArray(['120 EUR', '127 USD']).tolist()
+        [(120.0, 'EUR'), (127.0, 'USD')]
+        """
+        return list(zip(self.data['va'].tolist(), decode_currencies(self.data['cu']).tolist()))
 
     def to_bytes(self):
         r"""Serialize the MoneyArray as a Python bytestring.
 
         This and :meth:MoneyArray.from_bytes is the fastest way to roundtrip
-        serialize and de-serialize a MoneyArray.
+        serialize and de-serialize a MoneyArray. The bytes hold integer
+        currency codes, which only ISO 4217 currencies share between
+        processes; arrays in other currencies should go through
+        :meth:`MoneyArray.to_file` or pickle, which record their currencies.
 
         See Also
         --------
@@ -372,8 +590,20 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
         """
         return self.data.tobytes()
 
+    def to_file(self, path):
+        r"""Write the array to a versioned binary file, recording its dtype,
+        currency table and default currency in a small header ahead of the
+        raw records, so that :meth:`MoneyArray.open_mmap` can map it.
+
+        See Also
+        --------
+        MoneyArray.open_mmap
+        """
+        from .fileformat import write
+        write(self, path)
+
     def astype(self, dtype, copy=True):
-        if isinstance(dtype, MoneyType):
+        if isinstance(dtype, MoneyType) and dtype == self.dtype:
             if copy:
                 self = self.copy()
             return self
@@ -385,105 +615,322 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
 
     def __eq__(self, other):
         # Currently, this does not account for exchange, unlike other comparators
-        if not isinstance(other, MoneyArray):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        records = self._money_operand(other)
+        if records is None:
             return NotImplemented
-        mask = self.isna() | other.isna()
-        result = self.data == other.data
+        mask = self.isna() | (records['cu'] == 0)
+        result = (self.data['va'] == records['va']) & (self.data['cu'] == records['cu'])
         result[mask] = False
         return result
 
-    def __lt__(self, other):
-        if not isinstance(other, MoneyArray):
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return ~result
+
+    def _compare(self, other, op):
+        """ Arrays in matching currencies are compared directly; otherwise
+        each row is converted into the currency of the other side with one
+        gather over a rate snapshot.
+        """
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        records = self._money_operand(other)
+        if records is None:
             return NotImplemented
-        mask = self.isna() | other.isna()
-        same = (self.data['cu'] == other.data['cu']) | mask
-        result = (self.data['va'] < other.data['va'])
-        for i, ceq in enumerate(same):
-            if not ceq:
-                result[i] = money.XMoney(*self.data[i]) < money.XMoney(*self.other[i])
 
-        result[mask] = False
+        if (self.data['cu'] == records['cu']).all():
+            result = op(self.data['va'], records['va'])
+        elif isinstance(other, money.Money):
+            result = op(convert(self._amounts(), self.data['cu'], other.currency), float(other.amount))
+        else:
+            result = op(
+                convert_pairwise(self._amounts(), self.data['cu'], records['cu']),
+                self._shallow_copy(records)._amounts()
+            )
+        result[self.isna() | (records['cu'] == 0)] = False
         return result
 
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
     def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def equals(self, other):
         if not isinstance(other, MoneyArray):
+            raise TypeError("Cannot compare 'MoneyArray' "
+                            "to type '{}'".format(type(other)))
+        # TODO: missing
+        return (self.data == self._coerce(other).data).all()
+
+    def _coerce(self, other):
+        """ Method to bring a MoneyArray of another storage layout into ours """
+        if isinstance(other, MoneyArray) and other.dtype != self.dtype:
+            return type(self)(other)
+        return other
+
+    def _money_operand(self, other):
+        """ Method to return the records of a Money scalar or MoneyArray
+        operand in our storage layout, broadcast to our length, or None.
+        """
+        if isinstance(other, money.Money):
+            return np.broadcast_to(self._parser(other).data, self.data.shape)
+        if isinstance(other, MoneyArray):
+            if len(other) != len(self):
+                raise ValueError("Lengths must match: {} != {}".format(len(self), len(other)))
+            return self._coerce(other).data
+        return None
+
+    def _numeric_operand(self, other):
+        """ Method to return a numeric scalar or array-like operand as
+        float64, or None.
+        """
+        if isinstance(other, (money.Money, MoneyArray, str)):
+            return None
+        values = np.asarray(other)
+        if values.dtype == object and \
+                infer_dtype(values, skipna=True) in ('integer', 'floating', 'decimal', 'mixed-integer-float'):
+            values = values.astype(np.float64)
+        if values.dtype.kind not in 'biuf':
+            return None
+        if values.ndim and len(values) != len(self):
+            raise ValueError("Lengths must match: {} != {}".format(len(self), len(values)))
+        return values
+
+    def _convert_records(self, records, targets):
+        """ Method to convert records to the currency codes 'targets',
+        returning values in our storage layout.
+        """
+        return convert_pairwise(records['va'], records['cu'], targets)
+
+    def _scaled_values(self, values):
+        """ Method to cast scaled float values back to our storage layout """
+        return values
+
+    def _add_sub(self, other, op, reverse=False):
+        """ Rows in matching currencies are added directly; as with XMoney,
+        the right-hand side of mismatched rows is converted into the currency
+        of the left with one batched rate snapshot. 'op' is a binary ufunc.
+        """
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        records = self._money_operand(other)
+        if records is None:
             return NotImplemented
-        mask = self.isna() | other.isna()
-        same = (self.data['cu'] == other.data['cu']) | mask
-        result = (self.data['va'] < other.data['va'])
-        for i, ceq in enumerate(same):
-            if not ceq:
-                result[i] = money.XMoney(*self.data[i]) < money.XMoney(*self.other[i])
 
-        result[mask] = False
+        left, right = (records, self.data) if reverse else (self.data, records)
+
+        # NA records are (0, 0), so NA only needs handling where the
+        # currencies differ
+        right_va = right['va']
+        mask = None
+        if not (left['cu'] == right['cu']).all():
+            right_va = self._convert_records(right, left['cu'])
+            mask = (left['cu'] == 0) | (right['cu'] == 0)
+
+        result = np.empty(len(self), dtype=self.dtype._record_type)
+        op(left['va'], right_va, out=result['va'])
+        result['cu'] = left['cu']
+        if mask is not None:
+            result[mask] = self.dtype._record_na_value
+        return self._shallow_copy(result)
+
+    def _scale(self, other, op):
+        """ Scale each row by a number, leaving NA where the result is not finite """
+        factor = self._numeric_operand(other)
+        if factor is None:
+            return NotImplemented
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = op(self.data['va'], factor)
+        mask = self.isna() | ~np.isfinite(values)
+
+        result = np.empty(len(self), dtype=self.dtype._record_type)
+        result['va'] = self._scaled_values(np.where(mask, 0, values))
+        result['cu'] = self.data['cu']
+        result[mask] = self.dtype._record_na_value
+        return self._shallow_copy(result)
+
+    def _ratio(self, other):
+        """ Divide by a money operand, giving float64 ratios, with NaN for NA """
+        records = self._money_operand(other)
+        mask = self.isna() | (records['cu'] == 0)
+        different = (self.data['cu'] != records['cu']) & ~mask
+
+        divisor = self._shallow_copy(records)._amounts()
+        if different.any():
+            divisor = divisor.copy()
+            divisor[different] = convert_pairwise(
+                divisor[different], records['cu'][different], self.data['cu'][different]
+            )
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = self._amounts() / divisor
+        result[mask] = np.nan
         return result
 
-    def __gt__(self, other):
-        if not isinstance(other, MoneyArray):
+    def __add__(self, other):
+        return self._add_sub(other, np.add)
+
+    def __radd__(self, other):
+        return self._add_sub(other, np.add, reverse=True)
+
+    def __sub__(self, other):
+        return self._add_sub(other, np.subtract)
+
+    def __rsub__(self, other):
+        return self._add_sub(other, np.subtract, reverse=True)
+
+    def __mul__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
             return NotImplemented
-        mask = self.isna() | other.isna()
-        same = (self.data['cu'] == other.data['cu']) | mask
-        result = (self.data['va'] > other.data['va'])
-        for i, ceq in enumerate(same):
-            if not ceq:
-                result[i] = money.XMoney(*self.data[i]) > money.XMoney(*self.other[i])
+        return self._scale(other, operator.mul)
 
-        result[mask] = False
-        return result
+    __rmul__ = __mul__
 
-    def __ge__(self, other):
-        if not isinstance(other, MoneyArray):
+    def __truediv__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
             return NotImplemented
-        mask = self.isna() | other.isna()
-        same = (self.data['cu'] == other.data['cu']) | mask
-        result = (self.data['va'] >= other.data['va'])
-        for i, ceq in enumerate(same):
-            if not ceq:
-                result[i] = money.XMoney(*self.data[i]) < money.XMoney(*self.other[i])
+        if isinstance(other, (money.Money, MoneyArray)):
+            return self._ratio(other)
+        return self._scale(other, operator.truediv)
 
-        result[mask] = False
-        return result
+    def __rtruediv__(self, other):
+        return NotImplemented
 
-    def equals(self, other):
-        if not isinstance(other, MoneyArray):
-            raise TypeError("Cannot compare 'MoneyArray' "
-                            "to type '{}'".format(type(other)))
-        # TODO: missing
-        return (self.data == other.data).all()
+    def __neg__(self):
+        result = self.data.copy()
+        result['va'] = -result['va']
+        return self._shallow_copy(result)
+
+    def __pos__(self):
+        return self.copy()
+
+    def __abs__(self):
+        result = self.data.copy()
+        result['va'] = np.abs(result['va'])
+        return self._shallow_copy(result)
 
     _formatting_values = None
     def _formatter(self, boxed=False):
         def fmt(x):
             if isinstance(x, money.XMoney):
                 return str(x)
-            elif not x:
-                return "NA"
+            return "NA"
         return fmt
 
     def _values_for_factorize(self):
-        return self.astype(object), (0, '')
+        """ Each (value, currency code) record as one complex128 key, which
+        pandas hashes natively; NA records, (0, 0), give the NA key 0j.
+        """
+        values = np.empty(len(self), dtype=np.complex128)
+        values.real = self.data['va']
+        values.imag = self.data['cu']
+        return values, 0j
+
+    def sort_keys(self, money_code=None):
+        """Return float64 keys ordering the rows by value, with NaN for NA.
+
+        Amounts in a mixed array are converted, in one batch, to
+        'money_code', or the default currency, or else the first currency
+        present. If the xrates backend cannot convert them, the keys are
+        the ranks of the records, ordering by amount and then currency.
+        """
+        cu = self.data['cu']
+        currencies, _ = currency_counts(cu)
+        if len(currencies) > 1 or (money_code and len(currencies)):
+            money_code = money_code or self.default_money_code or \
+                decode_currency(currencies[0])
+            try:
+                keys = convert(self._amounts(), cu, money_code)
+            except money.exceptions.ExchangeError:
+                # Equal records share a rank
+                _, ranks = np.unique(self.data, return_inverse=True)
+                keys = ranks.astype(np.float64)
+        else:
+            keys = np.array(self._amounts(), dtype=np.float64)
 
-    def to_currency(self, money_code, shallow=True, in_place=False):
+        keys[cu == 0] = np.nan
+        return keys
+
+    def _values_for_argsort(self):
+        return self.sort_keys()
+
+    def searchsorted(self, value, side='left', sorter=None):
+        """Find the indices where money 'value' would be inserted to keep
+        order, comparing sort_keys on both sides in one currency.
+        """
+        cu = self.data['cu']
+        currencies, _ = currency_counts(cu)
+        scalar = isinstance(value, money.Money)
+        value = type(self)([value] if scalar else value)
+
+        # Both sides are keyed in one currency, if there is any mixing
+        money_code = None
+        if len(currencies) > 1 or (len(currencies) and (value.data['cu'] != currencies[0]).any()):
+            money_code = self.default_money_code or decode_currency(currencies[0])
+        # Keyed together, so that ranks, if the rows cannot be converted,
+        # are comparable between the two sides
+        keys = self._concat_same_type([self, value]).sort_keys(money_code)
+        result = np.searchsorted(keys[:len(self)], keys[len(self):], side=side, sorter=sorter)
+        return result[0] if scalar else result
+
+    def value_counts(self, dropna=True):
+        """Return a Series of the count of each distinct record, from the
+        hashed factorization.
+        """
+        codes, uniques = self.factorize()
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        if not dropna and (codes < 0).any():
+            uniques = uniques.take(np.append(np.arange(len(uniques)), -1), allow_fill=True)
+            counts = np.append(counts, (codes < 0).sum())
+        return pd.Series(counts, index=pd.Index(uniques, dtype=object))
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        data = np.empty(len(values), dtype=original.dtype._record_type)
+        data['va'] = values.real
+        data['cu'] = values.imag
+        return original._shallow_copy(data)
+
+    def to_currency(self, money_code, shallow=True, in_place=False, lazy=False):
+        """Set the default currency or, if not shallow, convert every row to
+        'money_code'.
+
+        If 'lazy', a deep conversion returns a ConvertedMoneyArray, a view
+        of these records that converts only what is used: slices, takes and
+        reductions work from the source records, and the whole array is
+        converted, once, only when written to or materialized.
+        """
         if shallow:
             if in_place:
                 copy = self
             else:
                 copy = self.copy()
             copy.default_money_code = money_code
+        elif lazy:
+            if in_place:
+                raise ValueError("A lazy conversion cannot be in place")
+            from .converted_money_array import ConvertedMoneyArray
+            # Registered first, so that the snapshot covers it
+            encode_currency(money_code)
+            copy = ConvertedMoneyArray._view(self.data, money_code, rate_cache.snapshot())
         else:
-            mask = self.isna()
-            same = (self.data['cu'] == money_code) | mask
-            decimalize = np.vectorize(decimal.Decimal)
-
             result = self.data
             if not in_place:
                 result = result.copy()
 
-            for i, ceq in enumerate(same):
-                if not ceq:
-                    va = money.XMoney(self.data[i]['va'], self.data[i]['cu']) \
-                           .to(money_code).amount
-                    result[i] = (va, money_code)
+            _convert_to(result, money_code)
 
             if in_place:
                 self.data = result
@@ -495,6 +942,28 @@ class MoneyArray(NumPyBackedExtensionArrayMixin):
 
         return copy
 
+
+def _convert_to(data, money_code):
+    """ Convert MoneyType records to 'money_code' in place """
+    cu = encode_currency(money_code)
+    different = (data['cu'] != cu) & (data['cu'] != 0)
+    data['va'][different] = convert(data['va'][different], data['cu'][different], money_code)
+    data['cu'][different] = cu
+    return data
+
+
+def _unpickle(cls, buffer, currencies, default_money_code):
+    """ Rebuild a pickled MoneyArray, or subclass, from its records without
+    parsing, remapping currency codes if this process registered them in
+    another order """
+    data = np.frombuffer(buffer, dtype=cls._dtype._record_type)
+    lookup = currency_lookup(currencies)
+    if lookup is not None or not data.flags.writeable:
+        data = data.copy()
+        if lookup is not None:
+            data['cu'] = lookup[data['cu']]
+    return cls._from_ndarray(data, default_money_code=default_money_code)
+
 # -----------------------------------------------------------------------------
 # Accessor
 # -----------------------------------------------------------------------------
@@ -517,14 +986,80 @@ class MoneyAccessor:
             raise AttributeError("Cannot use 'money' accessor on objects of "
                                  "dtype '{}'.".format(obj.dtype))
 
-    def to_currency(self, money_code, shallow=True, in_place=True):
+    def _accumulate(self, name, skipna=True, money_code=None):
+        return delegated_method(
+            self._data._accumulate,
+            self._index,
+            self._name,
+            name,
+            skipna=skipna,
+            money_code=money_code
+        )
+
+    def cumsum(self, skipna=True, money_code=None):
+        """Running totals, per currency or in 'money_code', with NA handled
+        as by Series.cumsum."""
+        return self._accumulate('cumsum', skipna, money_code)
+
+    def cummin(self, skipna=True, money_code=None):
+        """Running minima, per currency or in 'money_code'."""
+        return self._accumulate('cummin', skipna, money_code)
+
+    def cummax(self, skipna=True, money_code=None):
+        """Running maxima, per currency or in 'money_code'."""
+        return self._accumulate('cummax', skipna, money_code)
+
+    def sort_values(self, ascending=True, money_code=None, na_position='last'):
+        """Sort by value, converting a mixed Series to 'money_code', or
+        its default currency, for the comparison; see MoneyArray.sort_keys.
+        """
+        keys = self._data.sort_keys(money_code)
+        indexer = nargsort(keys, ascending=ascending, na_position=na_position)
+        return pd.Series(self._data.take(indexer), self._index.take(indexer), name=self._name)
+
+    def _select_n(self, n, money_code, largest):
+        keys = self._data.sort_keys(money_code)
+        rows = np.flatnonzero(~np.isnan(keys))
+        keys = -keys[rows] if largest else keys[rows]
+        n = min(n, len(rows))
+        if n < len(rows):
+            # Partition out the top n in linear time, then sort just those
+            top = np.argpartition(keys, n - 1)[:n]
+            rows, keys = rows[top], keys[top]
+        indexer = rows[np.argsort(keys, kind='stable')]
+        return pd.Series(self._data.take(indexer), self._index.take(indexer), name=self._name)
+
+    def nlargest(self, n=5, money_code=None):
+        """The n largest values, compared as for sort_values"""
+        return self._select_n(n, money_code, largest=True)
+
+    def nsmallest(self, n=5, money_code=None):
+        """The n smallest values, compared as for sort_values"""
+        return self._select_n(n, money_code, largest=False)
+
+    def groupby(self, by, sort=True):
+        """Group by one key, or a list of keys, of the same length as the
+        Series, for fast grouped sum, mean, min, max and count. Keys that
+        are Series are aligned on the index, as by Series.groupby.
+
+        See Also
+        --------
+        moneypandas.groupby.MoneyGroupBy
+        """
+        from .groupby import MoneyGroupBy
+        return MoneyGroupBy(self._data, by, sort=sort, name=self._name, index=self._index)
+
+    def to_currency(self, money_code, shallow=True, in_place=True, lazy=False):
+        """Convert, as MoneyArray.to_currency; a lazy conversion is never
+        in place"""
         return delegated_method(
             self._data.to_currency,
             self._index,
             self._name,
             money_code,
             shallow,
-            in_place
+            in_place and not lazy,
+            lazy
         )
 
 
@@ -1,17 +1,35 @@
 # pylint: disable = invalid-name
 """ Methods to parse strings/datatypes to find currencies """
+import os
+import itertools
+import threading
+import collections
+import concurrent.futures
+
 import numpy as np
-from pandas.api.types import is_list_like
+import pandas as pd
+from pandas.api.types import is_list_like, infer_dtype
 import money
-from .dtypes import money_patterns
+from . import dtypes, instrumentation
+from .dtypes import encode_currency, encode_currencies, decode_currency
+
+# Layout of the scalar parser's output, before currencies are encoded
+_parsed_record_type = np.dtype([('va', np.float64), ('cu', 'U3')])
 
 
-def to_money(values, default_money_code=None):
+def to_money(values, default_money_code=None, errors='raise', n_jobs=None):
     """Convert values to MoneyArray
 
     Parameters
     ----------
     values : int, str, bytes, or sequence of those
+    default_money_code : str, optional
+        ISO4712 code for values that have no currency of their own
+    errors : {'raise', 'coerce'}, default 'raise'
+        If 'coerce', values that cannot be parsed become NA
+    n_jobs : int, optional
+        If given, parse large inputs in a pool of this many processes (-1
+        for one per CPU); the result is the same as parsing serially
 
     Returns
     -------
@@ -34,25 +52,497 @@ def to_money(values, default_money_code=None):
         values = [values]
 
     values, default_money_code = _to_money_array(
-        values, default_money_code=default_money_code)
+        values, default_money_code=default_money_code, errors=errors, n_jobs=n_jobs)
     return MoneyArray(
         values,
         default_money_code=default_money_code
     )
 
 
-def _to_money_array(values, default_money_code=None):
+def _to_money_array(values, default_money_code=None, errors='raise', n_jobs=None):
     """ Method to convert a money object to a money array """
     from .money_array import MoneyType, MoneyArray
+    from .fixed_money_array import FixedMoneyType, FixedMoneyArray, _to_float_records
+
+    if isinstance(values, FixedMoneyArray):
+        values = values.to_money_array()
+
+    # Records already in a storage layout need no parsing
+    if isinstance(values, np.ndarray):
+        if values.dtype == MoneyType._record_type:
+            return values, default_money_code
+        if values.dtype == FixedMoneyType._record_type:
+            return _to_float_records(values), default_money_code
 
     if isinstance(values, MoneyArray):
-        if values.default_money_code:
-            default_money_code = default_money_code
+        default_money_code = default_money_code or values.default_money_code
         return values.data, default_money_code
 
-    values = [_as_money_object(v, default_money_code) for v in values]
+    if errors not in ('raise', 'coerce'):
+        raise ValueError("errors must be 'raise' or 'coerce', not {}".format(errors))
+
+    with instrumentation.timed('parse'):
+        return _parse_values(values, default_money_code, errors, n_jobs)
+
+
+def _parse_values(values, default_money_code, errors, n_jobs):
+    """ Method to parse values that are not already records, timed as the
+    parse phase """
+    from .money_array import MoneyType
+
+    # Parse each distinct value once; records and inputs that cannot be
+    # hashed are parsed row by row.
+    try:
+        if getattr(getattr(values, 'dtype', None), 'names', None):
+            raise TypeError("Records are not factorized")
+        codes, uniques = pd.factorize(values)
+    except (TypeError, ValueError):
+        try:
+            data = _parse_scalars(values, default_money_code, errors)
+        except _UniqueParseError as error:
+            raise _located(error, error.position, values) from None
+        instrumentation.record('parse', 'scalar', len(data))
+        return data, default_money_code
+
+    try:
+        data = _parse_uniques(np.asarray(uniques, dtype=object), default_money_code, errors, n_jobs)
+    except _UniqueParseError as error:
+        # Point at the first row holding the value that failed
+        raise _located(error, np.argmax(codes == error.position), values) from None
+
+    # Missing values are coded -1, so index a trailing NA record
+    data = np.append(data, np.array([MoneyType._record_na_value], dtype=data.dtype))
+    data = data.take(codes)
+
+    return data, default_money_code
+
+
+def _located(error, row, values):
+    """ Method to return a ValueError naming the index label of the row at
+    which a _UniqueParseError occurred """
+    index = getattr(values, 'index', None)
+    label = index[row] if isinstance(index, pd.Index) else row
+    return ValueError("{} (at index {!r})".format(error.args[0], label))
+
+
+def _parse_uniques(uniques, default_money_code=None, errors='raise', n_jobs=None):
+    """ Method to parse an object ndarray of distinct values, consulting
+    and then filling parse_cache.
+    """
+    from .money_array import MoneyType
+
+    data = np.zeros(len(uniques), dtype=MoneyType._record_type)
+    use_cache = 0 < len(uniques) <= parse_cache.maxsize
+    if use_cache:
+        missing = parse_cache.lookup(uniques, default_money_code, data)
+        instrumentation.record('parse', 'cached', len(uniques) - len(missing))
+    else:
+        missing = np.arange(len(uniques))
+
+    if len(missing):
+        values = uniques[missing]
+        try:
+            if _n_workers(n_jobs, len(values)) > 1:
+                data[missing] = _parse_parallel(values, default_money_code, errors, n_jobs)
+                # The workers' own counts stay in their processes
+                instrumentation.record('parse', 'parallel', len(values))
+            elif infer_dtype(values, skipna=True) == 'string':
+                data[missing] = _parse_strings(values, default_money_code, errors)
+            else:
+                data[missing] = _parse_scalars(values, default_money_code, errors)
+                instrumentation.record('parse', 'scalar', len(values))
+        except _UniqueParseError as error:
+            raise _UniqueParseError(error.args[0], missing[error.position]) from None
+
+        if use_cache:
+            parse_cache.store(values, default_money_code, data[missing])
+
+    return data
+
+# -----------------------------------------------------------------------------
+# Parallel parsing
+# -----------------------------------------------------------------------------
+
+
+# Fewest distinct values worth sending to each worker process
+PARALLEL_CHUNKSIZE = 2 ** 16
+
+
+class _UniqueParseError(ValueError):
+    """ A value could not be parsed; 'position' is its index in the
+    values, usually the distinct values, being parsed """
+
+    def __init__(self, message, position):
+        super(_UniqueParseError, self).__init__(message, position)
+        self.position = position
+
+
+def _n_workers(n_jobs, n_values):
+    """ Number of processes to parse n_values distinct values with """
+    if not n_jobs or n_jobs == 1:
+        return 1
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    return max(1, min(n_jobs, n_values // PARALLEL_CHUNKSIZE))
+
+
+def _parse_chunk(values, default_money_code, errors):
+    """ Worker: parse a chunk of distinct values into a MoneyArray, which is
+    pickled back as raw records along with its currency table. Returns the
+    message and position of the first failure instead, if any.
+    """
+    from .money_array import MoneyArray
+
+    try:
+        return MoneyArray._from_ndarray(_parse_uniques(values, default_money_code, errors))
+    except _UniqueParseError as error:
+        return error.args[0], error.position
+
+
+def _parse_parallel(values, default_money_code, errors, n_jobs):
+    """ Method to parse distinct values in chunks across a process pool,
+    stitching the records back together in order.
+    """
+    workers = _n_workers(n_jobs, len(values))
+    chunks = np.array_split(values, workers * 4)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        results = list(executor.map(
+            _parse_chunk, chunks,
+            itertools.repeat(default_money_code), itertools.repeat(errors)
+        ))
+
+    offset = 0
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, tuple):
+            message, position = result
+            raise _UniqueParseError(message, offset + position)
+        offset += len(chunk)
+
+    return np.concatenate([result.data for result in results])
+
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ParseCache:
+    """ Process-wide LRU of parsed money literals, keyed by
+    (literal, default_money_code), holding (value, currency code) records.
+    Set maxsize to 0 to disable it. Safe to share between threads.
+    """
+
+    def __init__(self, maxsize=2 ** 16):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._records = collections.OrderedDict()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._records))
+
+    def lookup(self, literals, default_money_code, data):
+        """ Fill 'data' with the cached records for 'literals', returning the
+        indices of those that were not cached.
+        """
+        missing = []
+        with self._lock:
+            for i, literal in enumerate(literals):
+                key = (literal, default_money_code)
+                try:
+                    data[i] = self._records[key]
+                except (KeyError, TypeError):
+                    missing.append(i)
+                else:
+                    self._records.move_to_end(key)
+
+            self.hits += len(literals) - len(missing)
+            self.misses += len(missing)
+        return np.array(missing, dtype=np.intp)
+
+    def store(self, literals, default_money_code, records):
+        """ Cache the records parsed from 'literals', other than NAs """
+        records = records.tolist()
+        with self._lock:
+            for literal, record in zip(literals, records):
+                if record[1]:
+                    try:
+                        self._records[(literal, default_money_code)] = record
+                    except TypeError:
+                        pass
+
+            while len(self._records) > self.maxsize:
+                self._records.popitem(last=False)
+
+
+parse_cache = ParseCache()
+
+
+def _parse_scalar(val, default_money_code=None, errors='raise'):
+    """ Method to apply _as_money_object, returning an NA tuple for
+    unparseable values if errors is 'coerce'.
+    """
+    try:
+        return _as_money_object(val, default_money_code)
+    except ValueError:
+        if errors == 'coerce':
+            return (0, '')
+        raise
+
+
+def _parse_scalars(values, default_money_code=None, errors='raise'):
+    """ Method to parse values one at a time into MoneyType records, raising
+    _UniqueParseError with the position of the first that fails.
+    """
+    parsed = []
+    for position, value in enumerate(values):
+        try:
+            parsed.append(_parse_scalar(value, default_money_code, errors))
+        except ValueError as error:
+            raise _UniqueParseError(str(error), position) from None
+    return _encode_records(np.atleast_1d(np.asarray(parsed, dtype=_parsed_record_type)))
+
+
+def _encode_records(parsed):
+    """ Method to convert parsed (value, currency string) records to the
+    MoneyType storage layout, with currencies as integer codes.
+    """
+    from .money_array import MoneyType
+
+    data = np.empty(len(parsed), dtype=MoneyType._record_type)
+    data['va'] = parsed['va']
+    data['cu'] = encode_currencies(parsed['cu'])
+    return data
+
+# -----------------------------------------------------------------------------
+# Bulk string parsing
+# -----------------------------------------------------------------------------
+
+
+# Strings are parsed in batches of this many rows, as a (rows, width) matrix
+# of code points, so that the matrix stays small however long the input is.
+_parse_batch_size = 1 << 16
+# Longer strings cannot be in one of the fast-path formats (or are not worth
+# widening a whole batch for) and go straight to the scalar parser.
+_max_fast_width = 64
+
+_max_exact_digits = 15
+_powers_of_ten = 10 ** np.arange(_max_exact_digits + 1, dtype=np.int64)
+
+_whitespace = np.array([ord(c) for c in ' \t\n\r\x0b\x0c'], dtype=np.uint32)
+_symbols = None
+
+
+def _symbol_table():
+    """ Sorted code points of the currency symbols, and their integer
+    currency codes, built on first use """
+    global _symbols
+
+    if _symbols is None:
+        ords = np.array(sorted(ord(symbol) for symbol in dtypes.symbols), dtype=np.uint32)
+        codes = np.array([encode_currency(dtypes.symbols[chr(o)]) for o in ords],
+                         dtype=np.uint16)
+        _symbols = ords, codes
+    return _symbols
+
+
+def _parse_strings(values, default_money_code=None, errors='raise'):
+    """ Method to parse a sequence of strings (NA allowed) in bulk.
+
+    Strings in the formats of money_patterns, written in full with ASCII
+    digits and whitespace - '-£123.00', 'EUR 123', '97GBP' - or plain numbers
+    when there is a default code, are classified and converted a batch at a
+    time with NumPy. Anything else falls back to _as_money_object, so the
+    records are identical to parsing each value separately.
+    """
+    from .money_array import MoneyType
+
+    values = np.asarray(values)
+    data = np.zeros(len(values), dtype=MoneyType._record_type)
+
+    na = pd.isna(values)
+    na[~na] = values[~na] == ''
+    if values.dtype.kind == 'U':
+        fast = ~na
+        if values.dtype.itemsize // 4 > _max_fast_width:
+            fast &= np.char.str_len(values) <= _max_fast_width
+    else:
+        lengths = np.zeros(len(values), dtype=np.intp)
+        lengths[~na] = [len(v) for v in values[~na]]
+        fast = ~na & (lengths <= _max_fast_width)
+
+    for start in range(0, len(values), _parse_batch_size):
+        batch = slice(start, start + _parse_batch_size)
+        rows = np.flatnonzero(fast[batch]) + start
+        strings = values[rows].astype(str)
+        if strings.dtype.itemsize // 4 > _max_fast_width:
+            strings = strings.astype('<U{}'.format(_max_fast_width))
+        va, cu, parsed = _parse_string_batch(strings, default_money_code)
+        data['va'][rows[parsed]] = va[parsed]
+        data['cu'][rows[parsed]] = cu[parsed]
+        fast[rows[~parsed]] = False
+
+    slow = np.flatnonzero(~na & ~fast)
+    instrumentation.record('parse', 'vectorized', np.count_nonzero(fast))
+    instrumentation.record('parse', 'scalar', len(slow))
+    if len(slow):
+        try:
+            data[slow] = _parse_scalars(values[slow], default_money_code, errors)
+        except _UniqueParseError as error:
+            raise _UniqueParseError(error.args[0], slow[error.position]) from None
+
+    return data
+
+
+def _parse_string_batch(strings, default_money_code=None):
+    """ Method to parse a 'U' ndarray of strings, vectorized over a matrix
+    of their code points. Returns the values, the integer currency codes and
+    a mask of the rows that were in a fast-path format; other rows must be
+    left to the scalar parser.
+    """
+    n = len(strings)
+    width = strings.dtype.itemsize // 4
+    va = np.zeros(n, dtype=np.float64)
+    cu = np.zeros(n, dtype=np.uint16)
+    parsed = np.zeros(n, dtype=bool)
+    if not n or not width:
+        return va, cu, parsed
+
+    symbol_ords, symbol_codes = _symbol_table()
+    chars = np.ascontiguousarray(strings).view(np.uint32).reshape(n, width)
+    present = chars != 0
+    lengths = np.where(present[:, 0], width - np.argmax(present[:, ::-1], axis=1), 0)
+
+    # Classify each row by its leading characters, in the order of
+    # money_patterns, then validate the number in each class
+    signed = chars[:, 0] == ord('-')
+    symbol = chars[np.arange(n), signed.astype(np.intp) if width > 1 else 0]
+    symbol_index = np.searchsorted(symbol_ords, symbol).clip(0, len(symbol_ords) - 1)
+    is_symbol = symbol_ords[symbol_index] == symbol
+    if width >= 4:
+        is_code = _is_upper(chars[:, :3]).all(axis=1) & ~is_symbol
+    else:
+        is_code = np.zeros(n, dtype=bool)
+    rest = ~is_symbol & ~is_code
+
+    # '-£123.00': optional sign, symbol, then an unsigned number
+    rows = np.flatnonzero(is_symbol)
+    valid, values = _parse_numbers(chars[rows], signed[rows] + 1, lengths[rows], signed=False)
+    rows = rows[valid]
+    va[rows] = np.where(signed[rows], -values[valid], values[valid])
+    cu[rows] = symbol_codes[symbol_index[rows]]
+    parsed[rows] = True
+
+    # 'EUR 123': code, optional whitespace, then a number
+    rows = np.flatnonzero(is_code)
+    sub = chars[rows]
+    after_code = ~_is_space(sub) & (np.arange(width) >= 3)
+    valid, values = _parse_numbers(sub, np.argmax(after_code, axis=1), lengths[rows], signed=True)
+    rows = rows[valid]
+    va[rows] = values[valid]
+    cu[rows] = _encode_packed(chars[rows, :3])
+    parsed[rows] = True
+
+    # '97GBP': number, optional whitespace, then a code ending the string
+    rows = np.flatnonzero(rest & (lengths >= 4))
+    sub = chars[rows]
+    code_at = lengths[rows, np.newaxis] - 3 + np.arange(3)
+    code = np.take_along_axis(sub, code_at, axis=1)
+    has_code = _is_upper(code).all(axis=1)
+    rows, sub, code, code_at = rows[has_code], sub[has_code], code[has_code], code_at[has_code]
+    before_code = ~_is_space(sub) & (np.arange(width) < code_at[:, :1])
+    end = width - np.argmax(before_code[:, ::-1], axis=1)
+    valid, values = _parse_numbers(sub, np.zeros(len(rows), dtype=np.intp), end, signed=True)
+    va[rows[valid]] = values[valid]
+    cu[rows[valid]] = _encode_packed(code[valid])
+    parsed[rows[valid]] = True
+
+    # '123', with a default code
+    if default_money_code:
+        rows = np.flatnonzero(rest & ~parsed)
+        valid, values = _parse_numbers(chars[rows], np.zeros(len(rows), dtype=np.intp),
+                                       lengths[rows], signed=True)
+        rows = rows[valid]
+        va[rows] = values[valid]
+        cu[rows] = encode_currency(default_money_code)
+        parsed[rows] = True
+
+    return va, cu, parsed
+
+
+def _is_upper(chars):
+    return (chars - ord('A')) < 26
+
+
+def _is_space(chars):
+    return np.isin(chars, _whitespace)
+
+
+def _encode_packed(letters):
+    """ Integer currency codes for rows of three code points in A-Z """
+    if not len(letters):
+        return np.zeros(0, dtype=np.uint16)
+    letters = letters.astype(np.int64) - ord('A')
+    packed = (letters[:, 0] * 26 + letters[:, 1]) * 26 + letters[:, 2]
+    uniques, inverse = np.unique(packed, return_inverse=True)
+    lookup = np.array([
+        encode_currency(chr(ord('A') + u // 676) + chr(ord('A') + u // 26 % 26) + chr(ord('A') + u % 26))
+        for u in uniques
+    ], dtype=np.uint16)
+    return lookup[inverse]
+
+
+def _parse_numbers(chars, start, end, signed):
+    r""" Method to parse, for each row of a code point matrix, the characters
+    in [start, end) as r'-?\d*\.?\d*\d' (without the sign if not 'signed').
+    Returns a mask of the rows that match exactly, and their values.
+    """
+    n, width = chars.shape
+    if not n:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=np.float64)
+
+    rows = np.arange(n)
+    positions = np.arange(width)
+    negative = np.zeros(n, dtype=bool)
+    if signed:
+        negative = (chars[rows, np.minimum(start, width - 1)] == ord('-')) & (start < end)
+        start = start + negative
+
+    region = (positions >= start[:, np.newaxis]) & (positions < end[:, np.newaxis])
+    numbers = chars - ord('0')
+    digits = region & (numbers < 10)
+    dots = region & (chars == ord('.'))
+    count = np.count_nonzero(digits, axis=1)
+    valid = (
+        (end > start) & (count > 0) &
+        ((digits | dots) == region).all(axis=1) &
+        (np.count_nonzero(dots, axis=1) <= 1) &
+        (numbers[rows, np.clip(end - 1, 0, width - 1)] < 10)
+    )
+
+    # Up to 15 digits, the integer mantissa and the power of ten are exact
+    # doubles, so dividing them gives the same correctly-rounded value as
+    # float(); longer numbers go through NumPy's string conversion.
+    places = np.cumsum(digits[:, ::-1], axis=1)[:, ::-1] - digits
+    fraction = (places * dots).sum(axis=1)
+    exact = valid & (count <= _max_exact_digits)
+    mantissa = (np.where(digits, numbers, 0).astype(np.int64) *
+                _powers_of_ten[np.minimum(places, _max_exact_digits)]).sum(axis=1)
+    values = np.zeros(n, dtype=np.float64)
+    values[exact] = mantissa[exact] / _powers_of_ten[fraction[exact]]
+
+    inexact = valid & ~exact
+    if inexact.any():
+        text = np.where(region[inexact], chars[inexact], ord(' ')).astype(np.uint32)
+        values[inexact] = text.view('<U{}'.format(width)).ravel().astype(np.float64)
+
+    values[negative] *= -1
+    return valid, values
 
-    return np.atleast_1d(np.asarray(values, dtype=MoneyType._record_type)), default_money_code
 
 def _as_money_object(val, default_money_code=None):
     """ Method to return a tuple with the monetary value
@@ -64,7 +554,7 @@ def _as_money_object(val, default_money_code=None):
     cu, va = None, None
 
     if isinstance(val, np.void):
-        cu = val['cu']
+        cu = decode_currency(val['cu'])
         va = val['va']
     elif val in (None, '', np.nan):
         cu = ''
@@ -73,7 +563,7 @@ def _as_money_object(val, default_money_code=None):
         cu = val.currency
         va = np.float64(val.amount)
     elif isinstance(val, str):
-        for r, extract in money_patterns:
+        for r, extract in dtypes.money_patterns:
             m = r.match(val)
             if m:
                 # calls a lambda function that gets the value that matches the expressions
@@ -0,0 +1,318 @@
+""" Vectorized currency conversion using the installed money.xrates backend """
+import decimal
+import threading
+import contextlib
+import collections
+
+import numpy as np
+import money
+
+from . import instrumentation
+from .dtypes import encode_currency, decode_currency, currency_codes
+
+
+def present_currencies(cu):
+    """ Method to return the sorted integer currency codes present in an
+    array of codes, excluding NA, without sorting the array itself.
+    """
+    if not len(cu):
+        return np.zeros(0, dtype=np.intp)
+    currencies = np.flatnonzero(np.bincount(cu))
+    return currencies[currencies != 0]
+
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def backend_fingerprint():
+    """ Method to identify the current state of the money.xrates backend.
+
+    Backends may provide a 'version' attribute that changes whenever their
+    rates do; otherwise a backend keeping its rates in a '_rates' dict, such
+    as money.exchange.SimpleBackend, is fingerprinted by its base and rates,
+    so that xrates.install, xrates.base and xrates.setrate all change it.
+    Returns None if there is no backend, or its state cannot be identified.
+    """
+    backend = money.xrates._backend
+    if backend is None:
+        return None
+
+    version = getattr(backend, 'version', None)
+    if version is not None:
+        return type(backend), id(backend), version
+
+    rates = getattr(backend, '_rates', None)
+    if not isinstance(rates, dict):
+        return None
+    return type(backend), id(backend), backend.base, frozenset(rates.items())
+
+
+class RateSnapshot:
+    """ Cross rates between every registered currency, taken from one state
+    of the xrates backend through its base currency rates.
+    """
+
+    def __init__(self, base_rates=None):
+        if base_rates is None:
+            base_rates = [None] + [money.xrates.rate(code) for code in currency_codes[1:]]
+        self.base_rates = np.array(base_rates, dtype=object)
+
+        floats = np.array([np.nan if rate is None else float(rate) for rate in base_rates])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # matrix[i, j] converts currency code i to currency code j
+            self.matrix = floats[np.newaxis, :] / floats[:, np.newaxis]
+        self.matrix[~np.isfinite(self.matrix)] = np.nan
+
+        # As matrix, but leaving amounts in the same currency, or NA, as they are
+        self.pairs = self.matrix.copy()
+        np.fill_diagonal(self.pairs, 1.)
+        self.pairs[0, :] = self.pairs[:, 0] = 1.
+        self._quotes = {}
+
+    def __len__(self):
+        return len(self.base_rates)
+
+    def __reduce__(self):
+        # The matrices are rebuilt from the base rates, keyed by currency so
+        # that the snapshot can be used by a process that codes them apart
+        return _restore_snapshot, (dict(zip(currency_codes, self.base_rates.tolist())),)
+
+    # Currencies registered after the snapshot was taken have no rates in
+    # it, so their rows, and columns, read as None or NaN, and conversions
+    # fall back to money.XMoney for them
+
+    def quotes(self, target):
+        """ Decimal rates from each currency code into the target code, or None """
+        quotes = np.full(len(currency_codes), None, dtype=object)
+        if target < len(self):
+            if target not in self._quotes:
+                rate = self.base_rates[target]
+                self._quotes[target] = np.array([
+                    rate / origin if rate and origin else None
+                    for origin in self.base_rates
+                ], dtype=object)
+            quotes[:len(self)] = self._quotes[target]
+        return quotes
+
+    def column(self, target):
+        """ Float rates from each currency code into the target code, or NaN """
+        column = np.full(len(currency_codes), np.nan)
+        if target < len(self):
+            column[:len(self)] = self.matrix[:, target]
+        return column
+
+    def pair_rates(self, cu, targets):
+        """ Float rates converting each code in 'cu' into the corresponding
+        code in 'targets': 1 where they match or either is NA, else NaN
+        where the snapshot has no rate """
+        size = len(self)
+        if (cu.max(initial=0) < size) and (targets.max(initial=0) < size):
+            return self.pairs.take(cu.astype(np.intp) * size + targets)
+
+        rates = np.full(len(cu), np.nan)
+        known = np.flatnonzero((cu < size) & (targets < size))
+        rates[known] = self.pairs.take(cu[known].astype(np.intp) * size + targets[known])
+        rates[(cu == targets) | (cu == 0) | (targets == 0)] = 1.
+        return rates
+
+
+def _restore_snapshot(rates):
+    for code in rates:
+        encode_currency(code)
+    return RateSnapshot([rates.get(code) for code in currency_codes])
+
+
+class RateCache:
+    """ Process-wide LRU of RateSnapshots, keyed by backend_fingerprint, so
+    that repeated conversions under the same xrates configuration resolve
+    their rates once. Safe to share between threads.
+    """
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._snapshots = collections.OrderedDict()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._snapshots))
+
+    @contextlib.contextmanager
+    def pinned(self, snapshot):
+        """ Context manager converting with 'snapshot', for instance one taken
+        in another process, rather than the backend, in this thread """
+        previous = getattr(self._local, 'pinned', None)
+        self._local.pinned = snapshot
+        try:
+            yield snapshot
+        finally:
+            self._local.pinned = previous
+
+    def snapshot(self):
+        """ Return the RateSnapshot for the current backend state, or None if
+        the state cannot be fingerprinted.
+        """
+        pinned = getattr(self._local, 'pinned', None)
+        if pinned is not None:
+            return pinned
+
+        fingerprint = backend_fingerprint()
+        if fingerprint is None:
+            return None
+
+        key = (fingerprint, len(currency_codes))
+        with self._lock:
+            try:
+                snapshot = self._snapshots[key]
+            except KeyError:
+                self.misses += 1
+                with instrumentation.timed('rate lookup'):
+                    snapshot = self._snapshots[key] = RateSnapshot()
+                while len(self._snapshots) > self.maxsize:
+                    self._snapshots.popitem(last=False)
+            else:
+                self.hits += 1
+                self._snapshots.move_to_end(key)
+
+        return snapshot
+
+
+rate_cache = RateCache()
+
+
+def quote_rates(money_code, currencies):
+    """ Method to snapshot the xrates backend: returns an object ndarray,
+    indexed by integer currency code, holding the Decimal rate converting
+    each of 'currencies' into 'money_code', or None where the backend has no
+    quotation. The NA code maps to a rate of 1.
+    """
+    target = encode_currency(money_code)
+    snapshot = rate_cache.snapshot()
+
+    if snapshot is not None:
+        rates = snapshot.quotes(target)
+    else:
+        rates = np.full(len(currency_codes), None, dtype=object)
+        with instrumentation.timed('rate lookup'):
+            for cu in currencies:
+                if cu != target:
+                    rates[cu] = money.xrates.quotation(decode_currency(cu), money_code)
+
+    rates[0] = decimal.Decimal(1)
+    rates[target] = decimal.Decimal(1)
+    return rates
+
+
+def rate_vector(money_code, cu):
+    """ Method to return the float64 rates from quote_rates, with NaN where
+    the backend has no quotation. The integer currency codes 'cu' to be
+    converted are only consulted when the backend cannot be snapshotted.
+    """
+    target = encode_currency(money_code)
+    snapshot = rate_cache.snapshot()
+
+    if snapshot is not None:
+        rates = snapshot.column(target)
+        rates[0] = 1.
+        rates[target] = 1.
+        return rates
+
+    rates = quote_rates(money_code, present_currencies(cu))
+    return np.array([np.nan if rate is None else float(rate) for rate in rates])
+
+
+def convert(va, cu, money_code):
+    """ Method to convert amounts 'va' in integer currency codes 'cu' to
+    'money_code' with one gather-and-multiply over a rate snapshot.
+
+    Currencies the snapshot cannot resolve fall back to converting each row
+    with money.XMoney, which raises ExchangeRateNotFound as before if the
+    backend really has no rate.
+    """
+    rates = rate_vector(money_code, cu)
+    with instrumentation.timed('conversion'):
+        result = va * rates[cu]
+
+        unresolved = np.flatnonzero(np.isnan(result))
+        unresolved = unresolved[np.isnan(rates[cu[unresolved]])]
+        for currency in np.unique(cu[unresolved]):
+            rows = unresolved[cu[unresolved] == currency]
+            code = decode_currency(currency)
+            result[rows] = [
+                float(money.XMoney(amount, code).to(money_code).amount)
+                for amount in va[rows]
+            ]
+
+    instrumentation.record('convert', 'vectorized', len(va) - len(unresolved))
+    instrumentation.record('convert', 'scalar', len(unresolved))
+    return result
+
+
+def pairwise_rates(cu, targets):
+    """ Method to return the float64 rates converting each integer currency
+    code in 'cu' into the corresponding code in 'targets', gathered from one
+    rate snapshot. Rows where the codes match, or either is NA, get a rate
+    of 1; pairs the snapshot cannot resolve are quoted once each through
+    money.XMoney, which raises ExchangeRateNotFound if the backend really
+    has no rate.
+    """
+    snapshot = rate_cache.snapshot()
+    if snapshot is not None:
+        rates = snapshot.pair_rates(cu, targets)
+    else:
+        rates = np.full(len(cu), np.nan)
+        rates[(cu == targets) | (cu == 0) | (targets == 0)] = 1.
+
+    missing = np.flatnonzero(np.isnan(rates))
+    if len(missing):
+        pairs = cu[missing].astype(np.uint32) << 16 | targets[missing]
+        pairs, inverse = np.unique(pairs, return_inverse=True)
+        quotes = [
+            float(money.XMoney(1, decode_currency(pair >> 16)).to(decode_currency(pair & 0xffff)).amount)
+            for pair in pairs
+        ]
+        rates[missing] = np.array(quotes)[inverse]
+
+    instrumentation.record('pairwise_rates', 'vectorized', len(cu) - len(missing))
+    instrumentation.record('pairwise_rates', 'scalar', len(missing))
+    return rates
+
+
+def convert_pairwise(va, cu, targets):
+    """ Method to convert amounts 'va' in integer currency codes 'cu' to the
+    integer currency codes 'targets', row by row.
+    """
+    return va * pairwise_rates(cu, targets)
+
+
+def convert_decimals(amounts, cu, money_code):
+    """ Method to convert an object ndarray of Decimal 'amounts' in integer
+    currency codes 'cu' to 'money_code' exactly, multiplying by a gathered
+    vector of Decimal rates rather than constructing XMoney per row.
+    """
+    currencies = present_currencies(cu)
+    rates = quote_rates(money_code, currencies)
+    missing = np.array([rate is None for rate in rates])
+    with instrumentation.timed('conversion'):
+        result = amounts * np.where(missing, decimal.Decimal(0), rates)[cu]
+
+        scalar = 0
+        for currency in currencies[missing[currencies]]:
+            rows = np.flatnonzero(cu == currency)
+            code = decode_currency(currency)
+            result[rows] = [
+                money.XMoney(amount, code).to(money_code).amount
+                for amount in amounts[rows]
+            ]
+            scalar += len(rows)
+
+    instrumentation.record('convert_decimals', 'vectorized', len(amounts) - scalar)
+    instrumentation.record('convert_decimals', 'scalar', scalar)
+    return result
@@ -0,0 +1,54 @@
+""" Reductions over money arrays, grouping rows by currency in one pass """
+import numpy as np
+
+
+def currency_counts(cu):
+    """ Method to return the integer currency codes present in 'cu',
+    excluding NA, and the number of rows in each, from one bincount.
+    """
+    counts = np.bincount(cu, minlength=1)
+    counts[0] = 0
+    currencies = np.flatnonzero(counts)
+    return currencies, counts[currencies]
+
+
+def currency_partials(va, cu, ufunc, currencies, counts):
+    """ Method to reduce the values 'va' within each currency of 'cu' with a
+    binary ufunc, in one pass over the rows: float sums come straight from a
+    weighted bincount, anything else from a stable (radix) sort by currency
+    and ufunc.reduceat. Returns one partial per entry of 'currencies'.
+    """
+    if not len(currencies):
+        return np.zeros(0, dtype=va.dtype)
+
+    if ufunc is np.add and va.dtype.kind == 'f':
+        return np.bincount(cu, weights=va)[currencies]
+
+    va, starts = _by_currency(va, cu, currencies, counts)
+    return ufunc.reduceat(va, starts)
+
+
+def currency_extrema(va, cu, currencies, counts):
+    """ Method to return the minimum and maximum of 'va' within each currency
+    of 'cu', as currency_partials would, from one sort by currency.
+    """
+    if not len(currencies):
+        return np.zeros(0, dtype=va.dtype), np.zeros(0, dtype=va.dtype)
+
+    va, starts = _by_currency(va, cu, currencies, counts)
+    return np.minimum.reduceat(va, starts), np.maximum.reduceat(va, starts)
+
+
+def _by_currency(va, cu, currencies, counts):
+    """ Method to return the non-NA values of 'va' with the rows of each
+    currency contiguous, and the offset at which each currency starts """
+    if len(currencies) == 1:
+        if counts[0] != len(cu):
+            va = va[cu == currencies[0]]
+        return va, np.zeros(1, dtype=np.intp)
+
+    # Rows of each currency are contiguous in a stable (radix) sort
+    order = np.argsort(cu, kind='stable')
+    na = len(cu) - counts.sum()
+    starts = np.concatenate([[0], np.cumsum(counts[:-1])])
+    return va[order[na:]], starts
@@ -37,5 +37,9 @@ setup(
     ],
     packages=find_packages(),
     install_requires=install_requires,
-    tests_require=tests_require
+    tests_require=tests_require,
+    extras_require={
+        'arrow': ['pyarrow'],
+        'dask': ['dask[dataframe]'],
+    }
 )
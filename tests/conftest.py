@@ -0,0 +1,26 @@
+import decimal
+
+import money
+import pytest
+
+from moneypandas import rates
+
+
+@pytest.fixture
+def backend_class():
+    """The xrates backend class installed by the backend fixture"""
+    return money.exchange.SimpleBackend
+
+
+@pytest.fixture
+def backend(backend_class):
+    """money.xrates with rates to the USD for GBP and EUR, and an empty
+    rate cache"""
+    money.xrates.install(backend_class)
+    money.xrates.base = 'USD'
+    money.xrates.setrate('GBP', decimal.Decimal('0.8'))
+    money.xrates.setrate('EUR', decimal.Decimal('0.9'))
+    rates.rate_cache.clear()
+    yield money.xrates
+    money.xrates.uninstall()
+    rates.rate_cache.clear()
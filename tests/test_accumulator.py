@@ -0,0 +1,75 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import moneypandas as mpd
+
+
+def _amount(value):
+    return float(value.amount)
+
+
+def test_accumulate_batches(backend):
+    batches = [
+        mpd.MoneyArray(['1 GBP', '2 EUR', None, '3 USD']),
+        mpd.MoneyArray(['-4 GBP', '10 EUR']),
+        mpd.MoneyArray([None]),
+    ]
+    totals = mpd.MoneyAccumulator('USD')
+    for batch in batches:
+        totals.update(batch)
+    assert len(totals) == 5
+
+    whole = mpd.MoneyArray._concat_same_type(batches)
+    whole.default_money_code = 'USD'
+    result = totals.result()
+    assert result.count == 5
+    for name in ('sum', 'mean', 'min', 'max', 'std'):
+        expected = whole._reduce(name)
+        assert getattr(result, name).currency == 'USD'
+        assert _amount(getattr(result, name)) == pytest.approx(_amount(expected)), name
+
+    assert _amount(totals.result('GBP').sum) == pytest.approx(_amount(whole._reduce('sum')) * 0.8)
+
+
+def test_merge(backend):
+    left = mpd.MoneyAccumulator().update(pd.Series(mpd.MoneyArray(['1 GBP', '5 GBP'])))
+    right = mpd.MoneyAccumulator().update(['2 EUR', '7 GBP'])
+    remote = pickle.loads(pickle.dumps(right))
+
+    merged = left.merge(remote)
+    assert merged is left
+    assert merged.state['currency'].tolist() == ['EUR', 'GBP']
+    assert merged.state['count'].tolist() == [1, 3]
+    assert merged.state['min'].tolist() == [2, 1]
+    assert merged.state['max'].tolist() == [2, 7]
+    assert merged.result().sum.currency == 'EUR'
+    assert _amount(merged.result('GBP').sum) == pytest.approx(13 + 2 * 0.8 / 0.9)
+
+
+def test_single_currency_and_empty():
+    totals = mpd.MoneyAccumulator()
+    result = totals.result()
+    assert result.count == 0 and pd.isna(result.mean)
+
+    fixed = mpd.FixedMoneyArray.from_money_array(mpd.MoneyArray(['1.10 GBP', '2.20 GBP']))
+    result = totals.update(fixed).result()
+    assert _amount(result.sum) == pytest.approx(3.3)
+    assert _amount(result.std) == pytest.approx(np.std([1.1, 2.2], ddof=1))
+    assert pd.isna(totals.result(ddof=2).std)
+
+
+def test_std_is_stable(backend):
+    amounts = 1e9 + np.arange(1, 10) / 100
+    totals = mpd.MoneyAccumulator()
+    for batch in np.array_split(amounts, 4):
+        totals.update(['{:.2f} GBP'.format(amount) for amount in batch])
+    assert _amount(totals.result().std) == pytest.approx(np.std(amounts, ddof=1), rel=1e-6)
+
+    # Across currencies, each converted at its own rate
+    mixed = mpd.MoneyAccumulator().update(['1000000000.01 GBP', '1000000000.03 GBP'])
+    mixed.merge(mpd.MoneyAccumulator().update(['1250000000.05 USD']))
+    expected = np.std([1000000000.01, 1000000000.03, 1250000000.05 * 0.8], ddof=1)
+    assert _amount(mixed.result('GBP').std) == pytest.approx(expected)
@@ -0,0 +1,49 @@
+import io
+
+import pytest
+import numpy.testing as npt
+import pandas as pd
+
+import moneypandas as mpd
+
+pa = pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def frame():
+    prices = mpd.MoneyArray(['3 GBP', '1.25 USD', None, '2 GBP'], default_money_code='GBP')
+    return pd.DataFrame({'price': prices, 'fixed': mpd.FixedMoneyArray(prices)})
+
+
+def test_arrow_array(frame):
+    result = pa.array(frame.price.values)
+    assert isinstance(result.type, mpd.MoneyArrowType)
+    assert result.type.default_money_code == 'GBP'
+    assert result.null_count == 1
+
+    amounts, currencies = result.storage.flatten()
+    assert amounts.to_pylist() == [3., 1.25, None, 2.]
+    assert currencies.dictionary.to_pylist() == ['GBP', 'USD']
+
+
+def test_arrow_round_trip(frame):
+    table = pa.Table.from_pandas(frame)
+    result = table.to_pandas()
+    assert result.price.values.equals(frame.price.values)
+    assert result.price.values.default_money_code == 'GBP'
+    assert isinstance(result.fixed.values, mpd.FixedMoneyArray)
+    npt.assert_array_equal(result.fixed.values.to_minor_units(), [300, 125, 0, 200])
+
+    chunked = pa.chunked_array([table.column('price').chunk(0).slice(1), table.column('price').chunk(0)])
+    result = mpd.MoneyType().__from_arrow__(chunked)
+    assert result.equals(frame.price.values.take([1, 2, 3, 0, 1, 2, 3]))
+
+
+def test_parquet_round_trip(frame):
+    pytest.importorskip('pyarrow.parquet')
+    buffer = io.BytesIO()
+    frame.to_parquet(buffer)
+    result = pd.read_parquet(io.BytesIO(buffer.getvalue()))
+    assert result.price.values.equals(frame.price.values)
+    assert result.price.values.default_money_code == 'GBP'
+    assert result.fixed.values.equals(frame.fixed.values)
@@ -0,0 +1,86 @@
+import decimal
+
+import money
+import numpy.testing as npt
+import pandas as pd
+import pytest
+
+import moneypandas as mpd
+
+
+@pytest.fixture
+def arr():
+    return mpd.MoneyArray(['1 GBP', '2 EUR', None, '3 USD', '4 GBP'], 'GBP')
+
+
+def test_lazy_matches_eager(backend, arr):
+    eager = arr.to_currency('USD', shallow=False)
+    lazy = arr.to_currency('USD', shallow=False, lazy=True)
+    assert isinstance(lazy, mpd.ConvertedMoneyArray)
+    assert lazy.default_money_code == 'USD'
+
+    assert lazy[1:4].equals(eager[1:4])
+    assert lazy.take([4, 0, -1], allow_fill=True).equals(eager.take([4, 0, -1], allow_fill=True))
+    assert lazy[0] == eager[0]
+    npt.assert_array_equal(lazy.isna(), eager.isna())
+    assert len(lazy) == len(eager)
+    for name in ('sum', 'mean', 'min', 'max', 'median', 'std'):
+        result, expected = lazy._reduce(name), eager._reduce(name)
+        assert result.currency == expected.currency == 'USD'
+        assert float(result.amount) == pytest.approx(float(expected.amount)), name
+    assert lazy._reduce('count') == 4
+    assert not lazy.is_materialized
+
+    assert lazy.equals(eager)
+    assert lazy.is_materialized
+    assert lazy._reduce('nunique') == eager._reduce('nunique')
+
+
+def test_lazy_series(backend, arr):
+    ser = pd.Series(arr).money.to_currency('USD', shallow=False, lazy=True)
+    assert ser.head(2).values.tolist() == pytest.approx([(1.25, 'USD'), (2 / 0.9, 'USD')])
+    assert float(ser.sum().amount) == pytest.approx(1.25 + 2 / 0.9 + 3 + 5)
+    assert not ser.values.is_materialized
+    assert arr[0] == money.XMoney(1, 'GBP')
+
+
+def test_lazy_writes_materialize(backend, arr):
+    lazy = arr.to_currency('USD', shallow=False, lazy=True)
+    lazy[2] = '6 EUR'
+    assert lazy.is_materialized
+    assert lazy[2] == money.XMoney(6, 'EUR')
+    assert lazy[0] == money.XMoney(1.25, 'USD')
+    assert arr.isna()[2]
+
+    with pytest.raises(ValueError):
+        arr.to_currency('USD', shallow=False, in_place=True, lazy=True)
+
+
+def test_lazy_keeps_rates(backend, arr):
+    lazy = arr.to_currency('EUR', shallow=False, lazy=True)
+    chained = lazy.to_currency('USD', shallow=False, lazy=True)
+    assert not lazy.is_materialized and not chained.is_materialized
+    assert chained.equals(arr.to_currency('USD', shallow=False))
+
+    backend.setrate('GBP', decimal.Decimal('0.5'))
+    assert lazy[0] == money.XMoney(0.9 / 0.8, 'EUR')
+    assert lazy.materialize()[4] == money.XMoney(4 * 0.9 / 0.8, 'EUR')
+
+
+def test_fixed_is_eager(backend, arr):
+    fixed = mpd.FixedMoneyArray.from_money_array(arr)
+    result = fixed.to_currency('USD', shallow=False, lazy=True)
+    assert type(result) is mpd.FixedMoneyArray
+    npt.assert_array_equal(result.to_minor_units()[[0, 4]], [125, 500])
+
+
+def test_lazy_new_target(backend):
+    backend.setrate('XQB', decimal.Decimal('2'))
+    arr = mpd.to_money(['GBP 1', 'USD 2'])
+    lazy = arr.to_currency('XQB', shallow=False, lazy=True)
+    assert lazy[0] == money.XMoney(2.5, 'XQB')
+    assert lazy.materialize().equals(arr.to_currency('XQB', shallow=False))
+
+    backend.setrate('XQC', decimal.Decimal('3'))
+    chained = arr.to_currency('USD', shallow=False, lazy=True).to_currency('XQC', shallow=False, lazy=True)
+    assert chained[1] == money.XMoney(6, 'XQC')
@@ -0,0 +1,50 @@
+import decimal
+
+import pandas as pd
+import pytest
+
+import moneypandas as mpd
+
+dask = pytest.importorskip('dask')
+dd = pytest.importorskip('dask.dataframe')
+pytest.importorskip('moneypandas.dask')
+
+
+@pytest.fixture
+def prices():
+    arr = mpd.MoneyArray(['8 GBP', '9 EUR', '1 USD', None, '4 GBP'] * 3, default_money_code='USD')
+    return dd.from_pandas(pd.Series(arr, name='price'), npartitions=4)
+
+
+def test_meta(prices):
+    assert prices.dtype == mpd.MoneyType()
+    assert prices._meta.array.default_money_code == 'USD'
+    assert prices.head(2).array.equals(mpd.MoneyArray(['8 GBP', '9 EUR']))
+
+
+@pytest.mark.parametrize('scheduler', ['sync', 'threads', 'processes'])
+def test_reductions(backend, prices, scheduler):
+    expected = prices.compute().array
+    with dask.config.set(scheduler=scheduler):
+        for name in ['sum', 'mean', 'min', 'max', 'count']:
+            assert getattr(prices.money, name)().compute() == expected._reduce(name)
+        total = prices.money.sum(money_code='GBP').compute()
+        assert total.currency == 'GBP'
+        assert float(total.amount) == pytest.approx(62.4)
+
+        converted = prices.money.to_currency('GBP', shallow=False).compute()
+        assert converted.array.equals(expected.to_currency('GBP', shallow=False))
+
+
+def test_fixed_reductions(backend):
+    arr = mpd.FixedMoneyArray(['0.10 GBP', '0.20 GBP', None, '0.30 EUR'] * 5)
+    fixed = dd.from_pandas(pd.Series(arr), npartitions=3)
+    assert fixed.money.sum().compute() == arr._reduce('sum')
+    assert fixed.money.max().compute() == arr._reduce('max')
+    total = fixed.money.sum(money_code='USD').compute()
+    assert isinstance(total.amount, decimal.Decimal)
+    assert float(total.amount) == pytest.approx(5 * (0.3 / 0.8 + 0.3 / 0.9))
+
+    empty = dd.from_pandas(pd.Series(mpd.MoneyArray([None, None])), npartitions=2)
+    assert pd.isna(empty.money.mean().compute())
+    assert empty.money.count().compute() == 0
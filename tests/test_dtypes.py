@@ -24,3 +24,49 @@ def test_find_currency_data_type():
     expected_result = dict
     result = type(dtypes.find_currency_data())
     assert result == expected_result
+
+
+def test_currency_encoding_roundtrip():
+    codes = ['GBP', '', 'EUR', 'GBP']
+    encoded = dtypes.encode_currencies(codes)
+    assert encoded.dtype == dtypes.currency_code_type
+    assert encoded[1] == 0
+    assert encoded[0] == encoded[3] == dtypes.encode_currency('GBP')
+    assert dtypes.decode_currencies(encoded).tolist() == codes
+
+
+def test_currency_encoding_is_stable():
+    # ISO 4217 codes are seeded in sorted order, so byte serializations
+    # agree between processes
+    assert dtypes.encode_currency('AED') == 1
+    assert dtypes.decode_currency(0) == ''
+
+
+def test_currency_registration_threads():
+    import concurrent.futures
+
+    codes = ['Q{:02d}'.format(i) for i in range(40)] * 10
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        encoded = list(executor.map(dtypes.encode_currency, codes))
+    assert len(set(encoded)) == 40
+    assert dtypes.decode_currencies(encoded).tolist() == codes
+
+
+def test_generated_currency_data_is_current():
+    # Regenerate with `make currency-data` if iso4217parse changes
+    from moneypandas import _currency_data
+    assert _currency_data.SYMBOLS == dtypes.find_currency_data()
+    assert _currency_data.CODES == dtypes.find_currency_codes()
+    assert _currency_data.EXPONENTS == dtypes.find_currency_exponents()
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+
+    code = ("import sys, moneypandas, moneypandas.dtypes as dtypes; "
+            "assert 'iso4217parse' not in sys.modules; "
+            "assert not dtypes._lazy; "
+            "moneypandas.to_money(['£1']); "
+            "assert 'symbols' in dtypes._lazy")
+    subprocess.run([sys.executable, '-c', code], check=True)
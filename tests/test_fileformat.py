@@ -0,0 +1,58 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+import moneypandas as mpd
+from moneypandas import dtypes, fileformat
+
+
+def test_mmap_round_trip(tmpdir):
+    path = str(tmpdir.join('ledger.money'))
+    arr = mpd.MoneyArray(['10 GBP', '20.5 EUR', None, '3 USD'], default_money_code='GBP')
+    arr.to_file(path)
+
+    result = mpd.MoneyArray.open_mmap(path)
+    assert isinstance(result.data, np.memmap)
+    assert result.equals(arr)
+    assert result.default_money_code == 'GBP'
+
+    part = result[1:3]
+    assert isinstance(part.data, np.memmap)
+    assert part.equals(arr[1:3])
+
+    with pytest.raises(TypeError):
+        mpd.FixedMoneyArray.open_mmap(path)
+
+
+def test_mmap_fixed_and_empty(tmpdir):
+    path = str(tmpdir.join('fixed.money'))
+    arr = mpd.FixedMoneyArray(['10.25 GBP', '3 JPY'])
+    arr.to_file(path)
+    npt.assert_array_equal(mpd.FixedMoneyArray.open_mmap(path).to_minor_units(), [1025, 3])
+
+    mpd.MoneyArray([]).to_file(path)
+    assert len(mpd.MoneyArray.open_mmap(path)) == 0
+
+
+def test_mmap_remaps_currencies(tmpdir, monkeypatch):
+    path = str(tmpdir.join('ledger.money'))
+    arr = mpd.MoneyArray(['10 GBP', '20 EUR'])
+    arr.to_file(path)
+
+    # As if the file came from a process with another currency table
+    header, offset = fileformat.read_header(path)
+    swapped = dtypes.currency_codes[:]
+    gbp, eur = dtypes.currency_index['GBP'], dtypes.currency_index['EUR']
+    swapped[gbp], swapped[eur] = 'EUR', 'GBP'
+    monkeypatch.setattr(fileformat, 'read_header', lambda path: (dict(header, currencies=swapped), offset))
+
+    result = mpd.MoneyArray.open_mmap(path)
+    assert result.currency_codes() == ['EUR', 'GBP']
+    npt.assert_array_equal(result.data['cu'], [eur, gbp])
+
+
+def test_not_a_money_file(tmpdir):
+    path = tmpdir.join('other.bin')
+    path.write_binary(b'\x00' * 100)
+    with pytest.raises(ValueError):
+        mpd.MoneyArray.open_mmap(str(path))
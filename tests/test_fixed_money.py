@@ -0,0 +1,119 @@
+import decimal
+
+import money
+import pytest
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+
+import moneypandas as mpd
+
+
+@pytest.fixture
+def rates(backend):
+    backend.setrate('JPY', decimal.Decimal('100'))
+    return backend
+
+
+def test_minor_units():
+    arr = mpd.FixedMoneyArray(['0.1 GBP', '0.2 GBP', '5 JPY', None])
+    assert arr.data.dtype['va'] == np.int64
+    npt.assert_array_equal(arr.to_minor_units(), [10, 20, 5, 0])
+    assert arr[2] == money.XMoney(5, 'JPY')
+    assert arr.tolist()[1] == (decimal.Decimal('0.20'), 'GBP')
+
+
+def test_from_minor_units():
+    arr = mpd.FixedMoneyArray.from_minor_units([1050, 25], 'GBP')
+    assert arr.equals(mpd.FixedMoneyArray(['10.50 GBP', '0.25 GBP']))
+
+
+def test_money_array_roundtrip():
+    floats = mpd.MoneyArray(['1.25 GBP', '3 EUR', None])
+    fixed = mpd.FixedMoneyArray.from_money_array(floats)
+    npt.assert_array_equal(fixed.to_minor_units(), [125, 300, 0])
+    assert fixed.to_money_array().equals(floats)
+    assert fixed.astype(mpd.MoneyType()).equals(floats)
+    assert floats.astype(mpd.FixedMoneyType()).equals(fixed)
+
+
+def test_exact_sum():
+    arr = mpd.FixedMoneyArray(['0.1 GBP'] * 10 + [None])
+    assert pd.Series(arr).sum().amount == decimal.Decimal('1.00')
+    assert pd.Series(arr).mean().amount == decimal.Decimal('0.10')
+
+
+def test_mixed_sum(rates):
+    arr = mpd.FixedMoneyArray(['0.1 GBP', '0.2 GBP', '5 JPY'])
+    assert arr._reduce('sum') == money.XMoney('0.34', 'GBP')
+    assert arr._reduce('max') == money.XMoney('0.2', 'GBP')
+
+
+def test_exact_add_sub(rates):
+    a = mpd.FixedMoneyArray(['0.1 GBP', '0.2 GBP', None])
+    b = mpd.FixedMoneyArray(['0.2 GBP', '100 JPY', '1 GBP'])
+    assert (a + b).equals(mpd.FixedMoneyArray(['0.3 GBP', '1 GBP', None]))
+    assert (a - money.XMoney('0.1', 'GBP')).equals(
+        mpd.FixedMoneyArray(['0 GBP', '0.1 GBP', None])
+    )
+
+
+def test_compare():
+    a = mpd.FixedMoneyArray(['0.1 GBP', '0.3 GBP'])
+    b = mpd.MoneyArray(['0.2 GBP', '0.3 GBP'])
+    npt.assert_array_equal(a < b, [True, False])
+    npt.assert_array_equal(a == b, [False, True])
+
+
+def test_compare_unrounded():
+    fixed = mpd.FixedMoneyArray(['0.10 GBP', '0.10 GBP'])
+    floats = mpd.MoneyArray(['0.104 GBP', '0.1 GBP'])
+    npt.assert_array_equal(fixed < floats, [True, False])
+    npt.assert_array_equal(fixed == floats, [False, True])
+    npt.assert_array_equal(floats > fixed, [True, False])
+    npt.assert_array_equal(floats == fixed, [False, True])
+    npt.assert_array_equal(floats <= fixed, [False, True])
+
+    scalar = money.XMoney('0.104', 'GBP')
+    npt.assert_array_equal(fixed < scalar, [True, True])
+    npt.assert_array_equal(fixed == scalar, [False, False])
+    npt.assert_array_equal(fixed >= money.XMoney('0.1', 'GBP'), [True, True])
+
+
+def test_to_currency(rates):
+    arr = mpd.FixedMoneyArray(['0.8 GBP', '100 JPY', None])
+    result = arr.to_currency('USD', shallow=False)
+    npt.assert_array_equal(result.to_minor_units(), [100, 100, 0])
+    assert result.default_money_code == 'USD'
+
+
+def test_series():
+    s = pd.Series(mpd.FixedMoneyArray(['1 GBP', '2 GBP']))
+    assert isinstance(s.dtype, mpd.FixedMoneyType)
+    assert s.dtype != mpd.MoneyType()
+    result = pd.concat([s, s], ignore_index=True)
+    assert result.dtype == s.dtype
+    assert len(result) == 4
+
+
+def test_exact_scaling():
+    arr = mpd.FixedMoneyArray(['0.10 GBP', '1.01 GBP', None])
+    npt.assert_array_equal((arr * 3).to_minor_units(), [30, 303, 0])
+    npt.assert_array_equal((arr / 2).to_minor_units(), [5, 50, 0])
+    npt.assert_array_equal((-arr).to_minor_units(), [-10, -101, 0])
+
+
+def test_unrepresentable_amounts():
+    floats = mpd.MoneyArray(['1 GBP', '2 GBP'])
+    floats.data['va'][0] = np.nan
+    fixed = mpd.FixedMoneyArray.from_money_array(floats)
+    npt.assert_array_equal(fixed.isna(), [True, False])
+    npt.assert_array_equal(fixed.to_minor_units(), [0, 200])
+
+    floats.data['va'][0] = np.inf
+    with pytest.raises(OverflowError):
+        mpd.FixedMoneyArray.from_money_array(floats)
+    with pytest.raises(OverflowError):
+        mpd.FixedMoneyArray(['100000000000000000 GBP'])
+    with pytest.raises(OverflowError):
+        fixed * 1e18
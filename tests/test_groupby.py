@@ -0,0 +1,76 @@
+import money
+import pytest
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+
+import moneypandas as mpd
+
+
+def test_groupby_single_currency():
+    s = pd.Series(mpd.MoneyArray(['1 GBP', '2 GBP', '3 EUR', None, '5 EUR']), name='price')
+    g = s.money.groupby(['a', 'a', 'b', 'b', 'c'])
+
+    result = g.sum()
+    assert result.name == 'price'
+    assert list(result.index) == ['a', 'b', 'c']
+    assert result.array.equals(mpd.MoneyArray(['3 GBP', '3 EUR', '5 EUR']))
+    assert g.mean().array.equals(mpd.MoneyArray(['1.5 GBP', '3 EUR', '5 EUR']))
+    assert g.min().array.equals(mpd.MoneyArray(['1 GBP', '3 EUR', '5 EUR']))
+    assert g.max().array.equals(mpd.MoneyArray(['2 GBP', '3 EUR', '5 EUR']))
+    npt.assert_array_equal(g.count(), [2, 1, 1])
+    assert pd.isna(g.sum(min_count=2)).tolist() == [False, True, True]
+
+
+def test_groupby_matches_pandas():
+    rng = np.random.RandomState(0)
+    values = ['{} GBP'.format(v) for v in rng.randint(0, 100, 1000)]
+    keys = rng.randint(0, 50, 1000)
+    s = pd.Series(mpd.MoneyArray(values))
+
+    result = s.money.groupby(keys).sum()
+    expected = pd.Series(s.array.data['va']).groupby(keys).sum()
+    npt.assert_allclose(result.array.data['va'], expected.values)
+    npt.assert_array_equal(result.index, expected.index)
+
+
+def test_groupby_mixed_currency(backend):
+    s = pd.Series(mpd.MoneyArray(['8 GBP', '10 USD', '9 EUR', '1 USD', None]))
+    keys = pd.Series([1, 1, 2, 2, 3], name='account')
+
+    result = s.money.groupby(keys).sum()
+    assert result.index.name == 'account'
+    assert result[1] == money.XMoney(16, 'GBP')
+    assert result[2].currency == 'EUR'
+    assert float(result[2].amount) == pytest.approx(9.9)
+    assert pd.isna(result[3])
+
+    s.array.default_money_code = 'USD'
+    result = s.money.groupby(keys).max()
+    assert result[1] == money.XMoney(10, 'USD')
+    assert float(result[2].amount) == pytest.approx(10.)
+
+
+def test_groupby_fixed_and_multiple_keys():
+    s = pd.Series(mpd.FixedMoneyArray(['0.1 GBP'] * 4))
+    result = s.money.groupby([[1, 1, 2, 2], ['x', 'y', 'x', 'x']]).sum()
+    assert isinstance(result.dtype, mpd.FixedMoneyType)
+    npt.assert_array_equal(result.array.to_minor_units(), [10, 10, 20])
+    assert list(result.index) == [(1, 'x'), (1, 'y'), (2, 'x')]
+
+
+def test_groupby_fixed_sums_exactly(backend):
+    amounts = ['0.10 GBP', '0.20 GBP', '90071992547409.91 GBP', '0.01 GBP', '1 USD', '0.80 GBP']
+    s = pd.Series(mpd.FixedMoneyArray(amounts))
+    keys = [1, 1, 1, 1, 2, 2]
+    result = s.money.groupby(keys).sum()
+    assert isinstance(result.dtype, mpd.FixedMoneyType)
+    npt.assert_array_equal(result.array.to_minor_units(), [9007199254741022, 160])
+
+
+def test_groupby_aligns_series_keys():
+    s = pd.Series(mpd.MoneyArray(['1 GBP', '2 GBP', '4 GBP']), index=[10, 20, 30])
+    keys = pd.Series(['b', 'a', 'a'], index=[30, 20, 10])
+    result = s.money.groupby(keys).sum()
+    assert result.array.equals(mpd.MoneyArray(['3 GBP', '4 GBP']))
+    assert s.money.groupby([keys, ['x', 'x', 'x']]).count().tolist() == [2, 1]
@@ -0,0 +1,66 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import moneypandas as mpd
+from moneypandas import dtypes, instrumentation, parser, rates
+
+
+def test_parse_paths():
+    parser.parse_cache.clear()
+    with mpd.stats(callback=lambda collected: None) as collected:
+        mpd.to_money(['1 GBP', '2 EUR', '2 EUR', None, 'two euros'], errors='coerce')
+        mpd.to_money(['1 GBP', '2 EUR'])
+        mpd.to_money([(1, 'GBP')])
+
+    assert collected.rows == {
+        ('parse', 'vectorized'): 2,
+        ('parse', 'scalar'): 2,
+        ('parse', 'cached'): 2,
+    }
+    assert collected.calls['parse'] == 3
+    assert collected.scalar_fraction('parse') == pytest.approx(1 / 3)
+    assert not instrumentation._collectors
+
+
+def test_conversion_paths(backend):
+    arr = mpd.MoneyArray(['1 GBP', '2 EUR', None, '3 USD'])
+    with mpd.stats(callback=lambda collected: None) as collected:
+        arr.to_currency('USD', shallow=False)
+        # A snapshot without rates sends every row through money.XMoney
+        with rates.rate_cache.pinned(rates.RateSnapshot([None] * len(dtypes.currency_codes))):
+            arr.to_currency('USD', shallow=False)
+
+    # Only the GBP and EUR rows need converting
+    assert collected.rows[('convert', 'vectorized')] == 2
+    assert collected.rows[('convert', 'scalar')] == 2
+    assert collected.calls['rate lookup'] == 1
+    assert collected.calls['conversion'] == 2
+
+
+def test_boxing_paths():
+    arr = mpd.MoneyArray(['1 GBP', '1 GBP', None, '3 USD'])
+    with mpd.stats(callback=lambda collected: None) as collected:
+        np.asarray(arr)
+    assert collected.rows == {('box', 'scalar'): 2, ('box', 'cached'): 2}
+    assert collected.calls['boxing'] == 1
+
+
+def test_stats_logs(caplog):
+    with caplog.at_level(logging.INFO, logger='moneypandas'):
+        with mpd.stats():
+            pd.Series(mpd.to_money(['1 GBP']))
+    assert 'parse' in caplog.text
+
+
+def test_nested_stats():
+    with mpd.stats(callback=lambda collected: None) as outer:
+        with mpd.stats(callback=lambda collected: None) as inner:
+            instrumentation.record('parse', 'scalar', 2)
+        instrumentation.record('parse', 'scalar', 1)
+    assert inner.rows[('parse', 'scalar')] == 2
+    assert outer.rows[('parse', 'scalar')] == 3
+    instrumentation.record('parse', 'scalar', 1)
+    assert outer.rows[('parse', 'scalar')] == 3
@@ -124,7 +124,7 @@ class TestMethods(base.BaseMethodsTests):
 
     def test_argsort_missing_array(self, data_missing_for_sorting):
         result = data_missing_for_sorting.argsort()
-        expected = np.array([1, 2, 0], dtype=np.dtype("int"))
+        expected = np.array([2, 0, 1], dtype=np.dtype("int"))
         # we don't care whether it's int32 or int64
         result = result.astype("int64", casting="safe")
         expected = expected.astype("int64", casting="safe")
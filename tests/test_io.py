@@ -0,0 +1,49 @@
+import io
+
+import pandas as pd
+import pytest
+
+import moneypandas as mpd
+from moneypandas import io as mpd_io
+
+CSV = 'account,amount,note\n1,10 GBP,a\n2,,b\n1,3.50,c\n3,20 EUR,d\n'
+
+
+def test_read_csv():
+    result = mpd.read_csv(io.StringIO(CSV), ['amount'], default_money_code='USD')
+    assert result.dtypes.tolist() == [pd.Series([1]).dtype, mpd.MoneyType(), object]
+    assert result.amount.values.equals(mpd.MoneyArray(['10 GBP', None, '3.50 USD', '20 EUR']))
+    assert result.amount.values.default_money_code == 'USD'
+
+
+def test_read_csv_chunks(monkeypatch):
+    infos = []
+    chunks = list(mpd.read_csv(io.StringIO(CSV), ['amount'], chunksize=3, default_money_code='USD',
+                               progress=infos.append))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert chunks[1].index.tolist() == [3]
+    assert [(info.chunk, info.rows) for info in infos] == [(0, 3), (1, 1)]
+    assert all(info.rows_per_second > 0 for info in infos)
+
+    monkeypatch.setattr(mpd_io, 'DEFAULT_CHUNKSIZE', 2)
+    result = mpd.read_csv(io.StringIO(CSV), ['amount'], default_money_code='USD')
+    assert isinstance(result.amount.values, mpd.MoneyArray)
+    assert result.amount.values.equals(mpd.MoneyArray(['10 GBP', None, '3.50 USD', '20 EUR']))
+    assert result.index.tolist() == [0, 1, 2, 3]
+
+
+def test_read_csv_errors():
+    csv = 'amount\n10 GBP\nnonsense\n'
+    with pytest.raises(ValueError):
+        mpd.read_csv(io.StringIO(csv), ['amount'])
+    result = mpd.read_csv(io.StringIO(csv), ['amount'], errors='coerce')
+    assert result.amount.isna().tolist() == [False, True]
+
+
+def test_read_csv_error_row():
+    csv = CSV + '4,nonsense,e\n'
+    with pytest.raises(ValueError, match=r'at index 4\)'):
+        list(mpd.read_csv(io.StringIO(csv), ['amount'], chunksize=3, default_money_code='USD'))
+
+    result = mpd.read_csv(io.StringIO(csv), ['amount'], chunksize=3, errors='coerce')
+    assert list(result)[1].amount.isna().tolist() == [False, True]
@@ -1,4 +1,5 @@
 import money
+import pickle
 import decimal
 import operator
 
@@ -16,14 +17,24 @@ import pandas.util.testing as tm
 
 def test_make_container():
     values = mpd.MoneyArray([1, 2, 3], 'GBP')
+    gbp = mpd.dtypes.encode_currency('GBP')
     npt.assert_array_equal(
         values.data,
-        np.array([(1, 'GBP'),
-                  (2, 'GBP'),
-                  (3, 'GBP')], dtype=values.dtype._record_type)
+        np.array([(1, gbp),
+                  (2, gbp),
+                  (3, gbp)], dtype=values.dtype._record_type)
     )
 
 
+def test_currency_codes_are_integers():
+    values = mpd.MoneyArray(['1 GBP', None, '2 EUR', '3 GBP'])
+    assert values.data.dtype['cu'] == np.uint16
+    assert values.data.itemsize == 10
+    npt.assert_array_equal(values.isna(), [False, True, False, False])
+    assert values.currency_codes() == ['EUR', 'GBP']
+    assert values.tolist() == [(1, 'GBP'), (0, ''), (2, 'EUR'), (3, 'GBP')]
+
+
 def test_repr_works():
     values = mpd.MoneyArray([0, 1, 2, 3], 'GBP')
     result = repr(values)
@@ -133,7 +144,6 @@ def test_ops(tup):
     tm.assert_numpy_array_equal(r1, r2)
 
 
-@pytest.mark.xfail(reason='upstream')
 def test_value_counts():
     x = mpd.MoneyArray([0, 0, 1], 'USD')
     result = x.value_counts()
@@ -199,6 +209,39 @@ def test_bytes_roundtrip():
     assert result.equals(arr)
 
 
+@pytest.mark.parametrize('protocol', [2, 4, 5])
+def test_pickle(protocol):
+    arr = mpd.MoneyArray(['10 GBP', None, '3 USD'], default_money_code='GBP')
+    result = pickle.loads(pickle.dumps(arr, protocol=protocol))
+    assert result.equals(arr)
+    assert result.default_money_code == 'GBP'
+    result[1] = '1 EUR'
+
+    fixed = mpd.FixedMoneyArray(arr)
+    assert pickle.loads(pickle.dumps(fixed, protocol=protocol)).equals(fixed)
+
+
+def test_pickle_out_of_band():
+    arr = mpd.MoneyArray(['10 GBP', None, '3 USD'] * 1000)
+    buffers = []
+    pickled = pickle.dumps(arr, protocol=5, buffer_callback=buffers.append)
+    assert len(pickled) < 200
+    assert len(buffers) == 1
+
+    result = pickle.loads(pickled, buffers=buffers)
+    assert result.equals(arr)
+    assert np.shares_memory(result.data, arr.data)
+
+
+def test_pickle_remaps_currencies():
+    arr = mpd.MoneyArray(['10 GBP', '20 EUR'])
+    unpickle, (cls, buffer, currencies, default) = arr.__reduce_ex__(5)
+    # As if pickled in a process that coded GBP and EUR the other way round
+    swapped = dict(zip(currencies, reversed(list(currencies.values()))))
+    result = unpickle(cls, buffer, swapped, default)
+    assert result.tolist() == [(10., 'EUR'), (20., 'GBP')]
+
+
 def test_unique():
     arr = mpd.MoneyArray([3, 3, 1, 2, 3], 'USD')
     result = arr.unique()
@@ -228,3 +271,148 @@ def test_from_ndarray(values):
     result = mpd.MoneyArray(np.asarray(values), 'USD')
     expected = mpd.MoneyArray(values, 'USD')
     assert result.equals(expected)
+
+
+def test_record_operations_do_not_reparse(monkeypatch):
+    arr = mpd.MoneyArray(['1 GBP', '2 EUR', None], 'GBP')
+
+    def fail(*args, **kwargs):
+        raise AssertionError("records were re-parsed")
+    monkeypatch.setattr(mpd.parser, '_to_money_array', fail)
+
+    results = [
+        arr[1:],
+        arr[[2, 0]],
+        arr.take([0, -1], allow_fill=True),
+        arr.copy(),
+        mpd.MoneyArray._concat_same_type([arr, arr]),
+        arr.unique(),
+        mpd.MoneyArray(arr.data, 'GBP'),
+    ]
+    for result in results:
+        assert result.default_money_code == 'GBP'
+    assert results[0].data.base is arr.data
+    assert results[4][4] == money.XMoney(2, 'EUR')
+    assert pd.isna(results[2][1])
+
+
+def test_arithmetic():
+    a = mpd.MoneyArray(['1 GBP', '2 GBP', None, '4 EUR'])
+    b = mpd.MoneyArray(['0.5 GBP', None, '1 GBP', '1 EUR'])
+
+    assert (a + b).equals(mpd.MoneyArray(['1.5 GBP', None, None, '5 EUR']))
+    assert (a[:3] - money.XMoney(1, 'GBP')).equals(mpd.MoneyArray(['0 GBP', '1 GBP', None]))
+    assert (a * 2).equals(mpd.MoneyArray(['2 GBP', '4 GBP', None, '8 EUR']))
+    assert (0.5 * a).equals(mpd.MoneyArray(['0.5 GBP', '1 GBP', None, '2 EUR']))
+    assert (a / np.array([1, 0, 1, 2])).equals(mpd.MoneyArray(['1 GBP', None, None, '2 EUR']))
+    assert (-a).equals(mpd.MoneyArray(['-1 GBP', '-2 GBP', None, '-4 EUR']))
+    assert abs(-a).equals(a)
+    npt.assert_array_equal(a / a, [1., 1., np.nan, 1.])
+
+    with pytest.raises(TypeError):
+        a * a
+    with pytest.raises(TypeError):
+        a + 1
+
+
+def test_scalar_equality():
+    arr = mpd.MoneyArray(['1 GBP', '2 GBP', None, '1 EUR'])
+    npt.assert_array_equal(arr == money.XMoney(1, 'GBP'), [True, False, False, False])
+    npt.assert_array_equal(arr != money.XMoney(1, 'GBP'), [False, True, True, True])
+    npt.assert_array_equal(arr[:3] < money.XMoney(2, 'GBP'), [True, False, False])
+
+
+def test_reductions_skip_na():
+    s = pd.Series(mpd.MoneyArray(['1 GBP', '3 GBP', None, '8 GBP']))
+    assert s.sum() == money.XMoney(12, 'GBP')
+    assert s.mean() == money.XMoney(4, 'GBP')
+    assert s.min() == money.XMoney(1, 'GBP')
+    assert s.max() == money.XMoney(8, 'GBP')
+    assert s.median() == money.XMoney(3, 'GBP')
+    assert s.quantile(0.5) == money.XMoney(3, 'GBP')
+    assert s.var() == pytest.approx(13.)
+    assert float(s.std().amount) == pytest.approx(np.sqrt(13.))
+    assert s.count() == 3
+    assert s.array._reduce('count') == 3
+    assert s.array._reduce('nunique') == 3
+    assert s.any() and s.all()
+    assert pd.isna(s.sum(skipna=False))
+    assert pd.isna(s.sum(min_count=4))
+    with pytest.raises(TypeError):
+        s.prod()
+
+
+def test_accumulate():
+    s = pd.Series(mpd.MoneyArray(['1 GBP', '3 GBP', None, '2 EUR', '-5 GBP', '4 EUR']))
+
+    result = s.money.cumsum()
+    assert result.array.equals(mpd.MoneyArray(['1 GBP', '4 GBP', None, '2 EUR', '-1 GBP', '6 EUR']))
+    result = s.money.cummin()
+    assert result.array.equals(mpd.MoneyArray(['1 GBP', '1 GBP', None, '2 EUR', '-5 GBP', '2 EUR']))
+    result = s.money.cumsum(skipna=False)
+    assert result.array.equals(mpd.MoneyArray(['1 GBP', '4 GBP', None, None, None, None]))
+
+    result = pd.Series(mpd.MoneyArray(['1 GBP', '3 GBP'])).cumsum()
+    assert result.array.equals(mpd.MoneyArray(['1 GBP', '4 GBP']))
+    result = s.cumsum()
+    assert result.array.equals(mpd.MoneyArray(['1 GBP', '4 GBP', None, '2 EUR', '-1 GBP', '6 EUR']))
+
+
+def test_factorize_without_boxing(monkeypatch):
+    arr = mpd.MoneyArray(['1 GBP', '1 EUR', None, '1 GBP', '0 GBP'], 'GBP')
+
+    def fail(*args, **kwargs):
+        raise AssertionError("records were boxed")
+    monkeypatch.setattr(mpd.MoneyArray, '_box_scalar', staticmethod(fail))
+    monkeypatch.setattr(mpd.parser, '_to_money_array', fail)
+
+    labels, uniques = arr.factorize()
+    npt.assert_array_equal(labels, [0, 1, -1, 0, 2])
+    assert uniques.default_money_code == 'GBP'
+    npt.assert_array_equal(uniques.data, arr.data[[0, 1, 4]])
+    npt.assert_array_equal(arr.duplicated(), [False, False, False, True, False])
+    assert len(arr.unique()) == 4
+
+    fixed = mpd.FixedMoneyArray.from_minor_units([2 ** 40 + 1, 2 ** 40 + 1, 5], 'GBP')
+    labels, uniques = fixed.factorize()
+    npt.assert_array_equal(labels, [0, 0, 1])
+    npt.assert_array_equal(uniques.to_minor_units(), [2 ** 40 + 1, 5])
+
+
+def test_series_value_counts():
+    s = pd.Series(mpd.MoneyArray(['1 GBP', '1 GBP', None, '2 EUR']))
+    result = s.value_counts()
+    assert result.tolist() == [2, 1]
+    assert result.index[0] == money.XMoney(1, 'GBP')
+    assert s.value_counts(dropna=False).tolist() == [2, 1, 1]
+
+
+def test_sort():
+    arr = mpd.MoneyArray(['3 GBP', '1 GBP', None, '2 GBP'])
+    npt.assert_array_equal(arr.argsort(), [1, 3, 0, 2])
+    npt.assert_array_equal(arr.argsort(ascending=False), [0, 3, 1, 2])
+
+    ser = pd.Series(arr)
+    assert ser.sort_values().index.tolist() == [1, 3, 0, 2]
+    assert ser.money.nlargest(2).index.tolist() == [0, 3]
+    assert ser.money.nsmallest(5).index.tolist() == [1, 3, 0]
+
+    ordered = arr.take([1, 3, 0])
+    assert ordered.searchsorted(money.XMoney(2, 'GBP')) == 1
+    npt.assert_array_equal(ordered.searchsorted(['2 GBP', '5 GBP'], side='right'), [2, 3])
+
+
+def test_mixed_sort_without_backend():
+    money.xrates.uninstall()
+    arr = mpd.MoneyArray(['3 GBP', '1 USD', '2 EUR', None, '1 EUR'])
+    ser = pd.Series(arr)
+
+    # Unconvertible rows order by amount, then currency
+    assert ser.money.sort_values().index.tolist() == [4, 1, 2, 0, 3]
+    assert ser.money.nlargest(2).index.tolist() == [0, 2]
+    assert ser.money.nsmallest(2).index.tolist() == [4, 1]
+
+    ordered = arr.take([4, 1, 2, 0])
+    assert ordered.searchsorted(money.XMoney(2, 'EUR')) == 2
+    assert ordered.searchsorted(money.XMoney(2, 'EUR'), side='right') == 3
+    npt.assert_array_equal(ordered.searchsorted(['1 GBP', '5 EUR']), [1, 4])
@@ -126,7 +126,6 @@ def test_argsort(ints):
 # ---------
 
 
-@pytest.mark.xfail(reason="TODO")
 def test_factorize():
     arr = mpd.MoneyArray([1, 1, 10, 10], 'JPY')
     labels, uniques = pd.factorize(arr)
@@ -147,7 +146,6 @@ def test_groupby_make_grouper():
     assert result.equals(df.B.values)
 
 
-@pytest.mark.xfail(reason="TODO")
 def test_groupby_make_grouper_groupings():
     df = pd.DataFrame({"A": [1, 1, 2, 2],
                        "B": mpd.MoneyArray([1, 1, 2, 2], 'EUR')})
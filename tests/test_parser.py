@@ -5,6 +5,7 @@ Unit tests for parser.
 import money
 from iso4217parse import Currency
 import pytest
+import numpy as np
 import money
 from moneypandas import parser, MoneyArray
 
@@ -41,3 +42,120 @@ def test_as_money_object(val, expected, money_code):
 def test_as_money_object_raises(val):
     with pytest.raises(ValueError):
         parser._as_money_object(val)
+
+
+BULK_STRINGS = [
+    u'123.45 GBP', u'€12', u'-£3.50', u'EUR 7', u'EUR-7', u'97GBP', u'-0.5 USD',
+    u'.5 JPY', u'GBP\t12', u'12 EURO', u'1234567890.12345678 EUR', None, u'',
+]
+
+
+@pytest.mark.parametrize('default_money_code', [None, 'GBP'])
+def test_parse_strings_matches_scalar(default_money_code):
+    values = BULK_STRINGS + [u'42']
+    if not default_money_code:
+        values = BULK_STRINGS
+    result = parser._parse_strings(values, default_money_code)
+    expected = parser._encode_records(np.asarray(
+        [parser._as_money_object(v, default_money_code) for v in values],
+        dtype=parser._parsed_record_type
+    ))
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_to_money_errors():
+    with pytest.raises(ValueError):
+        parser.to_money([u'12 GBP', u'twelve'])
+
+    result = parser.to_money([u'12 GBP', u'twelve'], errors='coerce')
+    assert result.equals(MoneyArray([u'12 GBP', None]))
+
+    with pytest.raises(ValueError):
+        parser.to_money([u'12 GBP'], errors='ignore')
+
+
+def test_to_money_string_array():
+    values = np.array([u'12 GBP', u'€1.5'] * 100000)
+    result = parser.to_money(values)
+    assert len(result) == 200000
+    assert result[1] == money.XMoney('1.5', 'EUR')
+
+
+def test_parse_cache():
+    parser.parse_cache.clear()
+    values = [u'12 GBP', u'€1.5', None] * 1000
+    first = parser.to_money(values)
+    info = parser.parse_cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 2)
+
+    second = parser.to_money(values)
+    assert second.equals(first)
+    assert parser.parse_cache.cache_info().hits == 2
+
+    parser.to_money([u'12'], default_money_code='USD')
+    assert parser.parse_cache.cache_info().misses == 3
+
+
+def test_parse_cache_disabled():
+    parser.parse_cache.clear()
+    parser.parse_cache.maxsize = 0
+    try:
+        result = parser.to_money([u'12 GBP', u'12 GBP'])
+        assert result[1] == money.XMoney(12, 'GBP')
+        assert parser.parse_cache.cache_info().currsize == 0
+    finally:
+        parser.parse_cache.maxsize = 2 ** 16
+
+
+def test_parallel_parse(monkeypatch):
+    monkeypatch.setattr(parser, 'PARALLEL_CHUNKSIZE', 4)
+    values = ['{} {}'.format(i, code) for i, code in zip(range(40), ['GBP', 'EUR', 'USD'] * 14)]
+    values[7] = None
+    expected = parser.to_money(values)
+    parser.parse_cache.clear()
+
+    result = parser.to_money(values, n_jobs=2)
+    assert result.equals(expected)
+    assert MoneyArray(values, n_jobs=2).equals(expected)
+
+
+def test_parallel_parse_error_index(monkeypatch):
+    import pandas as pd
+
+    monkeypatch.setattr(parser, 'PARALLEL_CHUNKSIZE', 4)
+    values = pd.Series(['{} GBP'.format(i) for i in range(40)], index=range(100, 140))
+    values[131] = 'nonsense'
+    parser.parse_cache.clear()
+    with pytest.raises(ValueError, match='at index 131') as parallel:
+        parser.to_money(values, n_jobs=2)
+    parser.parse_cache.clear()
+    with pytest.raises(ValueError, match='at index 131') as serial:
+        parser.to_money(values)
+    assert str(parallel.value) == str(serial.value)
+
+    result = parser.to_money(values, n_jobs=2, errors='coerce')
+    assert result.isna().sum() == 1
+
+
+@pytest.mark.parametrize('values, row', [
+    (['1 GBP', '2 GBP', 'nonsense', '3 GBP'], 2),
+    ([1, 2.5, object()], 2),
+    ([[1], (2, 'GBP'), 'bad'], 2),
+])
+def test_serial_parse_error_index(values, row):
+    parser.parse_cache.clear()
+    with pytest.raises(ValueError, match=r'\(at index {}\)$'.format(row)):
+        parser.to_money(values, default_money_code='GBP')
+
+
+def test_parse_cache_threads(monkeypatch):
+    import concurrent.futures
+
+    monkeypatch.setattr(parser.parse_cache, 'maxsize', 50)
+    parser.parse_cache.clear()
+    batches = [['{} GBP'.format((i * 7 + j) % 200) for j in range(100)] for i in range(40)]
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(parser.to_money, batches))
+    for batch, result in zip(batches, results):
+        assert result.tolist() == [(float(value.split()[0]), 'GBP') for value in batch]
+    assert parser.parse_cache.cache_info().currsize <= 50
@@ -0,0 +1,240 @@
+import decimal
+
+import money
+import pytest
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+
+import moneypandas as mpd
+from moneypandas import rates
+from moneypandas.dtypes import encode_currencies
+
+
+class CountingBackend(money.exchange.SimpleBackend):
+    lookups = 0
+
+    def rate(self, currency):
+        CountingBackend.lookups += 1
+        return super().rate(currency)
+
+
+class OpaqueBackend(money.exchange.BackendBase):
+    # Keeps its rates somewhere the cache cannot fingerprint
+    base = 'USD'
+
+    def __init__(self):
+        self.hidden = {}
+
+    def setrate(self, currency, rate):
+        self.hidden[currency] = rate
+
+    def rate(self, currency):
+        if currency == self.base:
+            return decimal.Decimal(1)
+        return self.hidden.get(currency, None)
+
+    def quotation(self, origin, target):
+        return super().quotation(origin, target)
+
+
+@pytest.fixture
+def backend_class():
+    CountingBackend.lookups = 0
+    return CountingBackend
+
+
+def test_convert_matches_xmoney(backend):
+    va = np.array([10., 20., 30., 0.])
+    cu = encode_currencies(['GBP', 'EUR', 'USD', ''])
+    result = rates.convert(va, cu, 'GBP')
+    expected = [
+        float(money.XMoney(10, 'GBP').amount),
+        float(money.XMoney(20, 'EUR').to('GBP').amount),
+        float(money.XMoney(30, 'USD').to('GBP').amount),
+        0.
+    ]
+    npt.assert_allclose(result, expected)
+
+
+def test_convert_resolves_rates_once(backend):
+    va = np.arange(1000, dtype=np.float64)
+    cu = encode_currencies(['GBP', 'EUR', 'USD', 'EUR'] * 250)
+    rates.convert(va, cu, 'USD')
+    lookups = CountingBackend.lookups
+    assert lookups > 0
+
+    for _ in range(50):
+        rates.convert(va, cu, 'GBP')
+    assert CountingBackend.lookups == lookups
+    assert rates.rate_cache.cache_info().hits == 50
+    assert rates.rate_cache.cache_info().misses == 1
+
+
+def test_cache_invalidation(backend):
+    cu = encode_currencies(['GBP'])
+    npt.assert_allclose(rates.convert(np.array([8.]), cu, 'USD'), [10.])
+
+    backend.setrate('GBP', decimal.Decimal('0.5'))
+    npt.assert_allclose(rates.convert(np.array([8.]), cu, 'USD'), [16.])
+    assert rates.rate_cache.cache_info().misses == 2
+
+    backend.setrate('GBP', decimal.Decimal('0.8'))
+    npt.assert_allclose(rates.convert(np.array([8.]), cu, 'USD'), [10.])
+    assert rates.rate_cache.cache_info().hits == 1
+
+    money.xrates.install(CountingBackend)
+    money.xrates.base = 'GBP'
+    money.xrates.setrate('USD', decimal.Decimal('2'))
+    npt.assert_allclose(rates.convert(np.array([8.]), cu, 'USD'), [16.])
+
+
+def test_cache_is_bounded(backend):
+    rates.rate_cache.maxsize = 2
+    try:
+        for rate in ['0.1', '0.2', '0.3']:
+            backend.setrate('GBP', decimal.Decimal(rate))
+            rates.convert(np.array([1.]), encode_currencies(['GBP']), 'USD')
+        assert rates.rate_cache.cache_info().currsize == 2
+    finally:
+        rates.rate_cache.maxsize = 8
+
+
+def test_cache_threads(backend, monkeypatch):
+    import concurrent.futures
+    import itertools
+
+    fingerprints = itertools.cycle(range(5))
+    monkeypatch.setattr(rates, 'backend_fingerprint', lambda: next(fingerprints))
+    monkeypatch.setattr(rates.rate_cache, 'maxsize', 2)
+    rates.rate_cache.clear()
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        snapshots = list(executor.map(lambda _: rates.rate_cache.snapshot(), range(400)))
+
+    gbp, usd = encode_currencies(['GBP', 'USD'])
+    assert all(snapshot.column(usd)[gbp] == pytest.approx(1.25) for snapshot in snapshots)
+    info = rates.rate_cache.cache_info()
+    assert info.hits + info.misses == 400
+    assert info.currsize <= 2
+
+
+def test_unfingerprinted_backend_is_not_cached():
+    money.xrates.install(OpaqueBackend)
+    money.xrates.setrate('GBP', decimal.Decimal('0.8'))
+    rates.rate_cache.clear()
+    try:
+        cu = encode_currencies(['GBP'])
+        npt.assert_allclose(rates.convert(np.array([8.]), cu, 'USD'), [10.])
+        money.xrates.setrate('GBP', decimal.Decimal('0.5'))
+        npt.assert_allclose(rates.convert(np.array([8.]), cu, 'USD'), [16.])
+        assert rates.rate_cache.cache_info().currsize == 0
+    finally:
+        money.xrates.uninstall()
+
+
+def test_convert_unresolved_raises(backend):
+    cu = encode_currencies(['GBP', 'JPY'])
+    with pytest.raises(money.exceptions.ExchangeRateNotFound):
+        rates.convert(np.array([1., 2.]), cu, 'USD')
+
+
+def test_to_currency_deep(backend):
+    arr = mpd.MoneyArray(['8 GBP', '9 EUR', '10 USD', None])
+    result = arr.to_currency('USD', shallow=False)
+    assert result.equals(mpd.MoneyArray(['10 USD', '10 USD', '10 USD', None]))
+
+
+def test_to_decimals_exact(backend):
+    arr = mpd.MoneyArray(['8 GBP', '9 EUR', None])
+    result = arr.to_decimals('USD')
+    assert list(result) == [
+        money.XMoney(8, 'GBP').to('USD').amount,
+        money.XMoney(9, 'EUR').to('USD').amount,
+        decimal.Decimal(0),
+    ]
+
+
+def test_mixed_comparison(backend):
+    a = mpd.MoneyArray(['8 GBP', '9 EUR', '1 USD'])
+    b = mpd.MoneyArray(['11 USD', '9 USD', '1 USD'])
+    npt.assert_array_equal(a < b, [True, False, False])
+    npt.assert_array_equal(a >= b, [False, True, True])
+    npt.assert_array_equal(a <= b, [True, False, True])
+
+
+def test_mixed_arithmetic(backend):
+    a = mpd.MoneyArray(['8 GBP', '9 EUR', '1 USD', None])
+    b = mpd.MoneyArray(['10 USD', '9 EUR', '1 GBP', '1 USD'])
+    result = a + b
+    npt.assert_allclose(result.data['va'], [16., 18., 2.25, 0.])
+    assert result.currency_codes() == ['EUR', 'GBP', 'USD']
+    assert result.isna().tolist() == [False, False, False, True]
+    npt.assert_allclose(a / b, [1., 1., 0.8, np.nan])
+
+
+def test_scalar_comparison(backend):
+    df = pd.DataFrame({'price': mpd.MoneyArray(['9 GBP', '10 USD', '10 EUR', None])})
+    threshold = money.XMoney(8, 'GBP')
+    npt.assert_array_equal(df.price > threshold, [True, False, True, False])
+    npt.assert_array_equal(df.price >= threshold, [True, True, True, False])
+    assert len(df[df.price <= threshold]) == 1
+
+    fixed = mpd.FixedMoneyArray(['8 GBP', '10 USD', None])
+    npt.assert_array_equal(fixed < money.XMoney(9, 'GBP'), [True, True, False])
+
+
+def test_mixed_reductions(backend):
+    arr = mpd.MoneyArray(['8 GBP', '9 EUR', '1 USD', None, '4 GBP'], default_money_code='USD')
+    assert arr._reduce('sum') == money.XMoney(26, 'USD')
+    assert arr._reduce('mean') == money.XMoney('6.5', 'USD')
+    assert arr._reduce('min') == money.XMoney(1, 'USD')
+    assert arr._reduce('max') == money.XMoney(10, 'USD')
+    assert arr._reduce('median') == money.XMoney('7.5', 'USD')
+
+    arr.default_money_code = None
+    assert arr._reduce('max') == money.XMoney(9, 'EUR')
+
+
+def test_normalized_accumulate(backend):
+    arr = mpd.MoneyArray(['8 GBP', None, '9 EUR', '1 USD'], default_money_code='USD')
+    result = arr.cumsum()
+    npt.assert_allclose(result.data['va'], [10., 0., 20., 21.])
+    assert result.currency_codes() == ['USD']
+    assert result.isna().tolist() == [False, True, False, False]
+
+    result = mpd.FixedMoneyArray(arr).cummax(money_code='GBP')
+    npt.assert_array_equal(result.to_minor_units(), [800, 0, 800, 800])
+
+
+def test_mixed_sort(backend):
+    arr = mpd.MoneyArray(['9 GBP', '10 USD', '10 EUR', None, '1 GBP'])
+    npt.assert_allclose(arr.sort_keys('USD')[[0, 1, 2, 4]], [11.25, 10., 11.111111, 1.25])
+    npt.assert_array_equal(arr.argsort(), [4, 1, 2, 0, 3])
+
+    ser = pd.Series(arr)
+    assert ser.money.sort_values(ascending=False).index.tolist() == [0, 2, 1, 4, 3]
+    assert ser.money.nlargest(1, money_code='USD').index.tolist() == [0]
+    assert arr.take([4, 1, 2, 0]).searchsorted(money.XMoney(11, 'USD')) == 2
+
+
+def test_pinned_snapshot(backend):
+    import pickle
+
+    snapshot = pickle.loads(pickle.dumps(rates.rate_cache.snapshot()))
+    money.xrates.uninstall()
+    cu = encode_currencies(['GBP'])
+    with rates.rate_cache.pinned(snapshot):
+        npt.assert_allclose(rates.convert(np.array([8.]), cu, 'USD'), [10.])
+    assert rates.rate_cache.snapshot() is None
+
+
+def test_pinned_snapshot_new_currency(backend):
+    snapshot = rates.rate_cache.snapshot()
+    backend.setrate('XQA', decimal.Decimal('4'))
+    with rates.rate_cache.pinned(snapshot):
+        # Registered after the snapshot, so converted through money.XMoney
+        arr = mpd.MoneyArray(['8 XQA', '8 GBP', None])
+        npt.assert_allclose(arr.to_currency('USD', shallow=False).data['va'], [2., 10., 0.])
+        npt.assert_allclose(rates.convert_pairwise(
+            arr.data['va'], arr.data['cu'], encode_currencies(['GBP', 'XQA', 'USD'])), [1.6, 40., 0.])
+        assert arr.to_decimals('USD')[0] == decimal.Decimal(2)